@@ -7,16 +7,23 @@ from .database import (
     get_database,
     init_database,
     check_database_connection,
-    SessionLocal,
+    check_database_connection_async,
+    AsyncSessionLocal,
+    session_scope,
+    current_session,
     engine,
+    sync_engine,
     Base
 )
 
 from .models import (
     ScheduledTask,
     ResearchHistory,
+    ResearchHistoryContent,
     TrendData,
-    TaskExecutionLog
+    TaskExecutionLog,
+    ExecutionLogMessage,
+    TaskKeyword
 )
 
 from .dao import (
@@ -24,7 +31,9 @@ from .dao import (
     ResearchHistoryDAO,
     TrendDataDAO,
     TaskExecutionLogDAO,
-    AnalyticsDAO
+    AnalyticsDAO,
+    ExecutionLogCreate,
+    HistoryCreate
 )
 
 __all__ = [
@@ -32,20 +41,31 @@ __all__ = [
     "get_database",
     "init_database", 
     "check_database_connection",
-    "SessionLocal",
+    "check_database_connection_async",
+    "AsyncSessionLocal",
+    "session_scope",
+    "current_session",
     "engine",
+    "sync_engine",
     "Base",
     
     # Data models
     "ScheduledTask",
     "ResearchHistory",
-    "TrendData", 
+    "ResearchHistoryContent",
+    "TrendData",
     "TaskExecutionLog",
+    "ExecutionLogMessage",
+    "TaskKeyword",
     
     # Data access objects
     "ScheduledTaskDAO",
     "ResearchHistoryDAO",
     "TrendDataDAO",
     "TaskExecutionLogDAO",
-    "AnalyticsDAO"
+    "AnalyticsDAO",
+
+    # DAO写入参数对象
+    "ExecutionLogCreate",
+    "HistoryCreate"
 ]
@@ -2,220 +2,813 @@
 数据访问对象 (DAO) - 提供数据库操作接口
 Data Access Objects (DAO) - Provides database operation interfaces
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
-from typing import List, Optional, Dict, Any
+from sqlalchemy import (
+    select, insert, update, delete, and_, or_, desc, asc, func, case, cast, literal,
+    String, DateTime, inspect, bindparam, lambda_stmt
+)
+from collections import namedtuple
+from dataclasses import dataclass, fields as _dc_fields
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
+from time import monotonic
 import logging
+import uuid
 
-from .models import ScheduledTask, ResearchHistory, TrendData, TaskExecutionLog
-from .database import SessionLocal
+from sqlalchemy.orm import selectinload
+
+from .models import (
+    ScheduledTask, ResearchHistory, ResearchHistoryContent, TrendData, TaskExecutionLog,
+    ExecutionLogMessage, TaskKeyword
+)
+from .database import session_scope
 
 logger = logging.getLogger(__name__)
 
 
+class _TTLCache:
+    """简单的进程内TTL缓存（事件循环内使用，无需加锁）"""
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Any] = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value):
+        if len(self._data) >= self.maxsize:
+            # 简单淘汰：清掉过期项，仍满则整体重置
+            now = monotonic()
+            self._data = {k: v for k, v in self._data.items() if v[1] > now}
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+        self._data[key] = (value, monotonic() + self.ttl)
+
+    def pop(self, key):
+        self._data.pop(key, None)
+
+
+# 热点读缓存：调度器和API路径每分钟重复读取相同任务行
+_TASK_CACHE = _TTLCache(maxsize=10000, ttl=5.0)
+_LATEST_TREND_CACHE = _TTLCache(maxsize=10000, ttl=5.0)
+
+# 数据库端"当前本地时间"，到期比较直接在SQL里做，不经由Python时钟传参
+# （列值按仓库约定存本地naive时间，故不用func.now()的UTC CURRENT_TIMESTAMP）
+_DB_NOW = func.datetime("now", "localtime")
+
+# 各模型的datetime列名，列表端点直接处理Core行映射时用于isoformat转换
+_TASK_DT_COLUMNS = tuple(
+    c.name for c in inspect(ScheduledTask).columns if isinstance(c.type, DateTime)
+)
+_HISTORY_DT_COLUMNS = tuple(
+    c.name for c in inspect(ResearchHistory).columns if isinstance(c.type, DateTime)
+)
+
+
+def _rows_to_dicts(rows, dt_columns) -> List[Dict[str, Any]]:
+    """把Core行映射转成可序列化dict，仅对datetime列做isoformat"""
+    out = []
+    for row in rows:
+        d = dict(row)
+        for name in dt_columns:
+            v = d.get(name)
+            if v is not None:
+                d[name] = v.isoformat()
+        out.append(d)
+    return out
+
+
+# 各模型的合法列名白名单（导入时一次性反射，更新时过滤未知键）
+_TASK_COLUMNS = frozenset(inspect(ScheduledTask).columns.keys())
+_HISTORY_COLUMNS = frozenset(inspect(ResearchHistory).columns.keys())
+_LOG_COLUMNS = frozenset(inspect(TaskExecutionLog).columns.keys())
+
+# 垂直拆分出的冷数据列，DAO在写入时透明分流到research_history_contents
+_HISTORY_CONTENT_COLUMNS = frozenset({"raw_result", "sources_used"})
+
+
+@dataclass(slots=True)
+class ExecutionLogCreate:
+    """create_log的参数对象
+
+    每次执行都要构造一份，slots实例比裸dict少一次哈希表分配且字段
+    固定可查；SQL边界经_payload_to_dict统一转回行dict
+    """
+    task_id: str
+    status: str
+    execution_step: Optional[str] = None
+    progress_percentage: float = 0.0
+
+
+@dataclass(slots=True)
+class HistoryCreate:
+    """create_history/finalize_execution的历史记录参数对象"""
+    task_id: str
+    status: str = "success"
+    executed_at: Optional[datetime] = None
+    execution_duration: Optional[float] = None
+    error_message: Optional[str] = None
+    raw_result: Optional[str] = None
+    summary: Optional[str] = None
+    key_findings: Optional[List] = None
+    key_changes: Optional[List] = None
+    sources_count: int = 0
+    tokens_used: int = 0
+    trend_score: Optional[float] = None
+    sentiment_score: Optional[float] = None
+    research_config: Optional[Dict[str, Any]] = None
+    sources_used: Optional[List] = None
+
+
+def _payload_to_dict(payload) -> Dict[str, Any]:
+    """SQL边界的统一转换：dataclass按字段展开（None字段交给模型默认值），
+    dict原样返回，调用方可渐进迁移"""
+    if isinstance(payload, dict):
+        return payload
+    return {
+        f.name: v
+        for f in _dc_fields(payload)
+        if (v := getattr(payload, f.name)) is not None
+    }
+
+
+# 只读列表路径的轻量行类型：无_sa_instance_state和描述符开销，属性访问即元组索引
+ScheduledTaskRow = namedtuple(
+    "ScheduledTaskRow", [c.name for c in ScheduledTask.__table__.columns]
+)
+
+
+# 热点读语句在导入时构建一次，lambda_stmt缓存编译结果，调用时只绑参数
+_STMT_TASK_BY_ID = lambda_stmt(
+    lambda: select(ScheduledTask).where(ScheduledTask.id == bindparam("task_id"))
+)
+_STMT_HISTORY_BY_TASK = lambda_stmt(
+    lambda: select(ResearchHistory)
+    .where(ResearchHistory.task_id == bindparam("task_id"))
+    .order_by(desc(ResearchHistory.executed_at))
+    .limit(bindparam("limit"))
+)
+_STMT_LATEST_HISTORY = lambda_stmt(
+    lambda: select(ResearchHistory)
+    .where(ResearchHistory.task_id == bindparam("task_id"))
+    .order_by(desc(ResearchHistory.executed_at))
+    .limit(1)
+)
+_STMT_SUCCESSFUL_HISTORIES = lambda_stmt(
+    lambda: select(ResearchHistory)
+    .where(
+        and_(
+            ResearchHistory.task_id == bindparam("task_id"),
+            ResearchHistory.status == "success"
+        )
+    )
+    .order_by(desc(ResearchHistory.executed_at))
+    .limit(bindparam("limit"))
+)
+_STMT_LATEST_TREND = lambda_stmt(
+    lambda: select(TrendData)
+    .where(TrendData.task_id == bindparam("task_id"))
+    .order_by(desc(TrendData.analysis_date))
+    .limit(1)
+)
+_STMT_RUNNING_LOGS = lambda_stmt(
+    lambda: select(TaskExecutionLog).where(TaskExecutionLog.status == "running")
+)
+
+
 class ScheduledTaskDAO:
     """定时任务数据访问对象"""
 
     @staticmethod
-    def create_task(task_data: Dict[str, Any]) -> ScheduledTask:
+    async def create_task(task_data: Dict[str, Any]) -> ScheduledTask:
         """创建新的定时任务"""
-        with SessionLocal() as db:
+        async with session_scope() as db:
             try:
                 # 设置下次执行时间
                 if 'next_run' not in task_data:
                     task_data['next_run'] = datetime.now() + timedelta(hours=task_data.get('interval_hours', 24))
-                
+
                 task = ScheduledTask(**task_data)
                 db.add(task)
-                db.commit()
-                db.refresh(task)
-                logger.info(f"Created scheduled task: {task.id}")
+                await db.flush()
+
+                # 同步关键词物化表，按关键词过滤不走JSON解码
+                keywords = task_data.get("keywords") or []
+                if keywords:
+                    await db.execute(
+                        insert(TaskKeyword),
+                        [{"task_id": task.id, "keyword": kw} for kw in keywords]
+                    )
+
+                await db.commit()
+                logger.info("Created scheduled task: %s", task.id)
                 return task
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to create scheduled task: {e}")
                 raise
 
     @staticmethod
-    def get_task_by_id(task_id: str) -> Optional[ScheduledTask]:
-        """根据ID获取任务"""
-        with SessionLocal() as db:
-            return db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
+    async def get_task_by_id(task_id: str) -> Optional[ScheduledTask]:
+        """根据ID获取任务（短TTL缓存，写操作时失效）"""
+        cached = _TASK_CACHE.get(task_id)
+        if cached is not None:
+            return cached
+
+        async with session_scope() as db:
+            result = await db.execute(_STMT_TASK_BY_ID, {"task_id": task_id})
+            task = result.scalars().first()
+            if task is not None:
+                _TASK_CACHE.set(task_id, task)
+            return task
+
+    @staticmethod
+    async def get_tasks_by_user(user_id: str, active_only: bool = False,
+                                limit: Optional[int] = None, offset: int = 0,
+                                with_histories: bool = False) -> List[ScheduledTask]:
+        """获取用户的所有任务（可选分页；with_histories时selectinload一次批量取历史）"""
+        async with session_scope() as db:
+            stmt = select(ScheduledTask).where(ScheduledTask.user_id == user_id)
+            if with_histories:
+                stmt = stmt.options(selectinload(ScheduledTask.research_histories))
+            if active_only:
+                stmt = stmt.where(ScheduledTask.is_active == True)
+            stmt = stmt.order_by(desc(ScheduledTask.created_at))
+            if offset:
+                stmt = stmt.offset(offset)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await db.execute(stmt)
+            return result.scalars().all()
+
+    # 列表端点使用的轻量列集合，跳过大字段和ORM实例构建
+    SUMMARY_COLUMNS = (
+        ScheduledTask.id,
+        ScheduledTask.user_id,
+        ScheduledTask.topic,
+        ScheduledTask.keywords,
+        ScheduledTask.is_active,
+        ScheduledTask.analysis_depth,
+        ScheduledTask.interval_hours,
+        ScheduledTask.next_run,
+        ScheduledTask.last_run,
+        ScheduledTask.created_at,
+        ScheduledTask.updated_at,
+        ScheduledTask.total_runs,
+        ScheduledTask.success_runs,
+        ScheduledTask.failed_runs,
+    )
+
+    @staticmethod
+    async def get_tasks_by_user_summary(user_id: str, active_only: bool = False) -> List[Any]:
+        """获取用户任务的轻量列元组（不构建ORM实例，适合列表序列化）"""
+        async with session_scope() as db:
+            stmt = select(*ScheduledTaskDAO.SUMMARY_COLUMNS).where(ScheduledTask.user_id == user_id)
+            if active_only:
+                stmt = stmt.where(ScheduledTask.is_active == True)
+            result = await db.execute(stmt.order_by(desc(ScheduledTask.created_at)))
+            return result.all()
 
     @staticmethod
-    def get_tasks_by_user(user_id: str, active_only: bool = False) -> List[ScheduledTask]:
-        """获取用户的所有任务"""
-        with SessionLocal() as db:
-            query = db.query(ScheduledTask).filter(ScheduledTask.user_id == user_id)
+    async def get_task_rows(user_id: str, active_only: bool = False) -> List["ScheduledTaskRow"]:
+        """只读列表路径：返回ScheduledTaskRow命名元组，跳过ORM实例化"""
+        async with session_scope() as db:
+            table = ScheduledTask.__table__
+            stmt = select(*table.c).where(table.c.user_id == user_id)
             if active_only:
-                query = query.filter(ScheduledTask.is_active == True)
-            return query.order_by(desc(ScheduledTask.created_at)).all()
+                stmt = stmt.where(table.c.is_active == True)
+            result = await db.execute(stmt.order_by(desc(table.c.created_at)))
+            return [ScheduledTaskRow._make(row) for row in result.all()]
 
     @staticmethod
-    def get_all_active_tasks() -> List[ScheduledTask]:
-        """获取所有激活的任务"""
-        with SessionLocal() as db:
-            return db.query(ScheduledTask).filter(ScheduledTask.is_active == True).all()
+    async def find_tasks_by_keyword(keyword: str, user_id: Optional[str] = None) -> List[ScheduledTask]:
+        """按关键词过滤任务（走task_keywords物化表的索引，不扫JSON列）"""
+        async with session_scope() as db:
+            stmt = (
+                select(ScheduledTask)
+                .join(TaskKeyword, TaskKeyword.task_id == ScheduledTask.id)
+                .where(TaskKeyword.keyword == keyword)
+            )
+            if user_id is not None:
+                stmt = stmt.where(ScheduledTask.user_id == user_id)
+            result = await db.execute(stmt.order_by(desc(ScheduledTask.created_at)))
+            return result.scalars().all()
 
     @staticmethod
-    def get_pending_tasks() -> List[ScheduledTask]:
-        """获取需要执行的任务"""
-        with SessionLocal() as db:
-            now = datetime.now()
-            return db.query(ScheduledTask).filter(
+    async def list_tasks_as_dicts(user_id: str, active_only: bool = False) -> List[Dict[str, Any]]:
+        """列表端点专用：直接消费Core行映射生成dict，完全跳过ORM实例构建"""
+        async with session_scope() as db:
+            table = ScheduledTask.__table__
+            stmt = select(table).where(table.c.user_id == user_id)
+            if active_only:
+                stmt = stmt.where(table.c.is_active == True)
+            result = await db.execute(stmt.order_by(desc(table.c.created_at)))
+            return _rows_to_dicts(result.mappings().all(), _TASK_DT_COLUMNS)
+
+    @staticmethod
+    async def get_tasks_with_latest_history(user_id: str) -> List[Any]:
+        """获取用户任务及各自最近一条历史记录（单条JOIN查询，无逐任务N+1）"""
+        async with session_scope() as db:
+            latest = (
+                select(
+                    ResearchHistory.task_id,
+                    func.max(ResearchHistory.executed_at).label("latest_at")
+                )
+                .group_by(ResearchHistory.task_id)
+                .subquery()
+            )
+            stmt = (
+                select(ScheduledTask, ResearchHistory)
+                .outerjoin(latest, latest.c.task_id == ScheduledTask.id)
+                .outerjoin(
+                    ResearchHistory,
+                    and_(
+                        ResearchHistory.task_id == latest.c.task_id,
+                        ResearchHistory.executed_at == latest.c.latest_at
+                    )
+                )
+                .where(ScheduledTask.user_id == user_id)
+                .order_by(desc(ScheduledTask.created_at))
+            )
+            result = await db.execute(stmt)
+            return result.all()
+
+    @staticmethod
+    async def get_all_active_tasks(limit: Optional[int] = None,
+                                   after_id: Optional[str] = None) -> List[ScheduledTask]:
+        """获取激活的任务（keyset分页：按id排序，传入上一页最后一个id继续）"""
+        async with session_scope() as db:
+            stmt = select(ScheduledTask).where(ScheduledTask.is_active == True)
+            if after_id is not None:
+                stmt = stmt.where(ScheduledTask.id > after_id)
+            stmt = stmt.order_by(asc(ScheduledTask.id))
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await db.execute(stmt)
+            return result.scalars().all()
+
+    @staticmethod
+    async def stream_active_tasks(batch_size: int = 500):
+        """流式遍历所有激活任务（服务端游标分批取出，内存占用与表大小无关）"""
+        async with session_scope() as db:
+            result = await db.stream_scalars(
+                select(ScheduledTask).where(
+                    ScheduledTask.is_active == True
+                ).order_by(asc(ScheduledTask.id)).execution_options(yield_per=batch_size)
+            )
+            async for task in result:
+                yield task
+
+    @staticmethod
+    async def get_pending_tasks(limit: Optional[int] = None,
+                                after_id: Optional[str] = None) -> List[ScheduledTask]:
+        """获取需要执行的任务（keyset分页，同get_all_active_tasks）"""
+        async with session_scope() as db:
+            stmt = select(ScheduledTask).where(
                 and_(
                     ScheduledTask.is_active == True,
-                    ScheduledTask.next_run <= now
+                    ScheduledTask.next_run <= _DB_NOW
+                )
+            )
+            if after_id is not None:
+                stmt = stmt.where(ScheduledTask.id > after_id)
+            stmt = stmt.order_by(asc(ScheduledTask.id))
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await db.execute(stmt)
+            return result.scalars().all()
+
+    @staticmethod
+    async def claim_pending_tasks() -> List[ScheduledTask]:
+        """原子认领所有到期任务（单条UPDATE...RETURNING，避免SELECT后再逐个UPDATE的竞态）
+
+        认领同时把next_run推到下个周期，行立即不再满足WHERE条件，
+        后续tick或其他worker不会重复认领同一批任务
+        """
+        async with session_scope() as db:
+            try:
+                result = await db.execute(
+                    update(ScheduledTask).where(
+                        and_(
+                            ScheduledTask.is_active == True,
+                            ScheduledTask.next_run <= _DB_NOW
+                        )
+                    ).values(
+                        last_run=_DB_NOW,
+                        # 下次执行时间由数据库按interval_hours推算
+                        next_run=func.datetime(
+                            "now", "localtime",
+                            literal("+") + cast(ScheduledTask.interval_hours, String) + literal(" hours")
+                        )
+                    ).returning(ScheduledTask),
+                    execution_options={"synchronize_session": False}
                 )
-            ).all()
+                tasks = result.scalars().all()
+                await db.commit()
+                for task in tasks:
+                    _TASK_CACHE.pop(task.id)
+                return tasks
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to claim pending tasks: {e}")
+                raise
 
     @staticmethod
-    def update_task(task_id: str, update_data: Dict[str, Any]) -> Optional[ScheduledTask]:
-        """更新任务"""
-        with SessionLocal() as db:
+    async def update_task(task_id: str, update_data: Dict[str, Any]) -> Optional[ScheduledTask]:
+        """更新任务（列名白名单过滤后单条Core UPDATE，不做逐属性探测）"""
+        clean = {k: v for k, v in update_data.items() if k in _TASK_COLUMNS}
+        clean["updated_at"] = datetime.now()
+
+        async with session_scope() as db:
             try:
-                task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
-                if not task:
+                result = await db.execute(
+                    update(ScheduledTask)
+                    .where(ScheduledTask.id == task_id)
+                    .values(**clean)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    await db.rollback()
                     return None
-                
-                for key, value in update_data.items():
-                    if hasattr(task, key):
-                        setattr(task, key, value)
-                
-                task.updated_at = datetime.now()
-                db.commit()
-                db.refresh(task)
-                logger.info(f"Updated scheduled task: {task_id}")
+
+                # 关键词变更时同事务重建物化表行
+                if "keywords" in clean:
+                    await db.execute(
+                        delete(TaskKeyword).where(TaskKeyword.task_id == task_id)
+                    )
+                    if clean["keywords"]:
+                        await db.execute(
+                            insert(TaskKeyword),
+                            [{"task_id": task_id, "keyword": kw} for kw in clean["keywords"]]
+                        )
+
+                await db.commit()
+                _TASK_CACHE.pop(task_id)
+
+                refreshed = await db.execute(
+                    select(ScheduledTask).where(ScheduledTask.id == task_id)
+                )
+                task = refreshed.scalars().first()
+                logger.info("Updated scheduled task: %s", task_id)
                 return task
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to update scheduled task {task_id}: {e}")
                 raise
 
     @staticmethod
-    def delete_task(task_id: str) -> bool:
+    async def delete_task(task_id: str) -> bool:
         """删除任务"""
-        with SessionLocal() as db:
+        async with session_scope() as db:
             try:
-                task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
+                result = await db.execute(
+                    select(ScheduledTask).where(ScheduledTask.id == task_id)
+                )
+                task = result.scalars().first()
                 if not task:
                     return False
-                
-                db.delete(task)
-                db.commit()
-                logger.info(f"Deleted scheduled task: {task_id}")
+
+                await db.execute(
+                    delete(TaskKeyword).where(TaskKeyword.task_id == task_id)
+                )
+                # 内容行批量删除，避免级联逐条加载历史的content关系
+                await db.execute(
+                    delete(ResearchHistoryContent).where(
+                        ResearchHistoryContent.history_id.in_(
+                            select(ResearchHistory.id).where(ResearchHistory.task_id == task_id)
+                        )
+                    )
+                )
+                await db.delete(task)
+                await db.commit()
+                _TASK_CACHE.pop(task_id)
+                logger.info("Deleted scheduled task: %s", task_id)
                 return True
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to delete scheduled task {task_id}: {e}")
                 raise
 
     @staticmethod
-    def update_task_execution_status(task_id: str, success: bool, execution_time: Optional[float] = None):
-        """更新任务执行状态"""
-        with SessionLocal() as db:
+    async def update_task_execution_status(task_id: str, success: bool, execution_time: Optional[float] = None):
+        """更新任务执行状态（单条列运算UPDATE，无需先SELECT，并发完成时计数不丢失）"""
+        async with session_scope() as db:
             try:
-                task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
-                if not task:
+                result = await db.execute(
+                    update(ScheduledTask).where(ScheduledTask.id == task_id).values(
+                        last_run=datetime.now(),
+                        total_runs=ScheduledTask.total_runs + 1,
+                        success_runs=ScheduledTask.success_runs + (1 if success else 0),
+                        failed_runs=ScheduledTask.failed_runs + (0 if success else 1),
+                        # 下次执行时间由数据库按interval_hours推算
+                        next_run=func.datetime(
+                            "now", "localtime",
+                            literal("+") + cast(ScheduledTask.interval_hours, String) + literal(" hours")
+                        )
+                    ),
+                    execution_options={"synchronize_session": False}
+                )
+                await db.commit()
+                if result.rowcount == 0:
                     return False
-                
-                task.last_run = datetime.now()
-                task.total_runs += 1
-                
-                if success:
-                    task.success_runs += 1
-                else:
-                    task.failed_runs += 1
-                
-                # 更新下次执行时间
-                task.update_next_run()
-                
-                db.commit()
-                logger.info(f"Updated execution status for task {task_id}: success={success}")
+
+                _TASK_CACHE.pop(task_id)
+                logger.debug("Updated execution status for task %s: success=%s", task_id, success)
                 return True
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to update execution status for task {task_id}: {e}")
                 raise
 
+    @staticmethod
+    async def finalize_execution(
+        task_id: str,
+        success: bool,
+        log_id: Optional[str] = None,
+        log_update: Optional[Dict[str, Any]] = None,
+        history_data: Optional[Union[HistoryCreate, Dict[str, Any]]] = None,
+    ) -> bool:
+        """一次执行收尾的全部写入合并进单个事务
+
+        任务统计UPDATE、执行日志UPDATE、可选的历史INSERT原先是两到三次
+        独立的connect/commit往返；这里一次commit落盘，完成临界路径上的
+        DB往返减半
+        """
+        async with session_scope() as db:
+            try:
+                result = await db.execute(
+                    update(ScheduledTask).where(ScheduledTask.id == task_id).values(
+                        last_run=datetime.now(),
+                        total_runs=ScheduledTask.total_runs + 1,
+                        success_runs=ScheduledTask.success_runs + (1 if success else 0),
+                        failed_runs=ScheduledTask.failed_runs + (0 if success else 1),
+                        # 下次执行时间由数据库按interval_hours推算
+                        next_run=func.datetime(
+                            "now", "localtime",
+                            literal("+") + cast(ScheduledTask.interval_hours, String) + literal(" hours")
+                        )
+                    ),
+                    execution_options={"synchronize_session": False}
+                )
+
+                if log_id and log_update:
+                    clean = {k: v for k, v in log_update.items() if k in _LOG_COLUMNS}
+                    if clean:
+                        await db.execute(
+                            update(TaskExecutionLog)
+                            .where(TaskExecutionLog.id == log_id)
+                            .values(**clean)
+                            .execution_options(synchronize_session=False)
+                        )
+
+                if history_data:
+                    history_data = _payload_to_dict(history_data)
+                    hot = {k: v for k, v in history_data.items() if k not in _HISTORY_CONTENT_COLUMNS}
+                    cold = {k: history_data[k] for k in _HISTORY_CONTENT_COLUMNS if k in history_data}
+                    history = ResearchHistory(**hot)
+                    db.add(history)
+                    if cold:
+                        await db.flush()  # 拿到history.id供内容行引用
+                        db.add(ResearchHistoryContent(history_id=history.id, **cold))
+
+                await db.commit()
+                _TASK_CACHE.pop(task_id)
+                logger.debug("Finalized execution for task %s: success=%s", task_id, success)
+                return result.rowcount > 0
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to finalize execution for task {task_id}: {e}")
+                raise
+
+    @staticmethod
+    async def update_task_execution_statuses(results: List[tuple]) -> int:
+        """批量更新执行状态（(task_id, success)列表，单条UPDATE走executemany）"""
+        if not results:
+            return 0
+
+        # 走Core表对象而非ORM实体，executemany参数无需携带主键列
+        table = ScheduledTask.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_task_id"))
+            .values(
+                last_run=_DB_NOW,
+                total_runs=table.c.total_runs + 1,
+                success_runs=table.c.success_runs + bindparam("b_success"),
+                failed_runs=table.c.failed_runs + bindparam("b_failed"),
+                # 下次执行时间由数据库按interval_hours推算
+                next_run=func.datetime(
+                    "now", "localtime",
+                    literal("+") + cast(table.c.interval_hours, String) + literal(" hours")
+                )
+            )
+        )
+        params = [
+            {"b_task_id": task_id, "b_success": 1 if success else 0, "b_failed": 0 if success else 1}
+            for task_id, success in results
+        ]
+
+        async with session_scope() as db:
+            try:
+                await db.execute(stmt, params)
+                await db.commit()
+                for task_id, _ in results:
+                    _TASK_CACHE.pop(task_id)
+                logger.debug("Updated execution status for %d tasks in bulk", len(results))
+                return len(results)
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to bulk update execution statuses: {e}")
+                raise
+
 
 class ResearchHistoryDAO:
     """研究历史数据访问对象"""
 
     @staticmethod
-    def create_history(history_data: Dict[str, Any]) -> ResearchHistory:
-        """创建研究历史记录"""
-        with SessionLocal() as db:
+    async def create_history(history_data: Union[HistoryCreate, Dict[str, Any]]) -> ResearchHistory:
+        """创建研究历史记录（raw_result等冷列透明分流到内容表，同一事务写入）"""
+        history_data = _payload_to_dict(history_data)
+        hot = {k: v for k, v in history_data.items() if k not in _HISTORY_CONTENT_COLUMNS}
+        cold = {k: history_data[k] for k in _HISTORY_CONTENT_COLUMNS if k in history_data}
+
+        async with session_scope() as db:
             try:
-                history = ResearchHistory(**history_data)
+                history = ResearchHistory(**hot)
                 db.add(history)
-                db.commit()
-                db.refresh(history)
-                logger.info(f"Created research history: {history.id}")
+                if cold:
+                    await db.flush()  # 拿到history.id供内容行引用
+                    db.add(ResearchHistoryContent(history_id=history.id, **cold))
+                await db.commit()
+                logger.debug("Created research history: %s", history.id)
                 return history
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to create research history: {e}")
                 raise
 
     @staticmethod
-    def get_history_by_task(task_id: str, limit: int = 50) -> List[ResearchHistory]:
+    async def create_histories_bulk(rows: List[Dict[str, Any]]) -> List[str]:
+        """批量创建研究历史记录（executemany单语句插入，返回生成的ID列表）"""
+        if not rows:
+            return []
+
+        async with session_scope() as db:
+            try:
+                # 客户端预生成主键，插入后无需逐行refresh
+                hot_rows = []
+                cold_rows = []
+                for row in rows:
+                    row.setdefault("id", str(uuid.uuid4()))
+                    hot_rows.append(
+                        {k: v for k, v in row.items() if k not in _HISTORY_CONTENT_COLUMNS}
+                    )
+                    cold = {k: row[k] for k in _HISTORY_CONTENT_COLUMNS if k in row}
+                    if cold:
+                        cold_rows.append({"history_id": row["id"], **cold})
+                await db.execute(insert(ResearchHistory), hot_rows)
+                if cold_rows:
+                    await db.execute(insert(ResearchHistoryContent), cold_rows)
+                await db.commit()
+                logger.info("Created %d research histories in bulk", len(rows))
+                return [row["id"] for row in rows]
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to bulk create research histories: {e}")
+                raise
+
+    @staticmethod
+    async def get_history_by_task(task_id: str, limit: int = 50) -> List[ResearchHistory]:
         """获取任务的历史记录"""
-        with SessionLocal() as db:
-            return db.query(ResearchHistory).filter(
-                ResearchHistory.task_id == task_id
-            ).order_by(desc(ResearchHistory.executed_at)).limit(limit).all()
+        async with session_scope() as db:
+            result = await db.execute(
+                _STMT_HISTORY_BY_TASK, {"task_id": task_id, "limit": limit}
+            )
+            return result.scalars().all()
+
+    @staticmethod
+    async def list_histories_as_dicts(task_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """列表端点专用：直接消费Core行映射生成dict，跳过ORM实例构建"""
+        async with session_scope() as db:
+            table = ResearchHistory.__table__
+            result = await db.execute(
+                select(table)
+                .where(table.c.task_id == task_id)
+                .order_by(desc(table.c.executed_at))
+                .limit(limit)
+            )
+            return _rows_to_dicts(result.mappings().all(), _HISTORY_DT_COLUMNS)
+
+    @staticmethod
+    async def get_history_by_task_summary(task_id: str, limit: int = 50) -> List[Any]:
+        """获取任务历史的轻量列元组（排除raw_result等大文本字段）"""
+        async with session_scope() as db:
+            result = await db.execute(
+                select(
+                    ResearchHistory.id,
+                    ResearchHistory.task_id,
+                    ResearchHistory.executed_at,
+                    ResearchHistory.execution_duration,
+                    ResearchHistory.status,
+                    ResearchHistory.sources_count,
+                    ResearchHistory.trend_score,
+                    ResearchHistory.sentiment_score,
+                ).where(
+                    ResearchHistory.task_id == task_id
+                ).order_by(desc(ResearchHistory.executed_at)).limit(limit)
+            )
+            return result.all()
+
+    @staticmethod
+    async def get_history_content(history_id: str) -> Optional[ResearchHistoryContent]:
+        """获取历史记录的冷数据（原始报告、信息源列表），仅详情路径调用"""
+        async with session_scope() as db:
+            result = await db.execute(
+                select(ResearchHistoryContent).where(
+                    ResearchHistoryContent.history_id == history_id
+                )
+            )
+            return result.scalars().first()
 
     @staticmethod
-    def get_latest_history(task_id: str) -> Optional[ResearchHistory]:
+    async def get_latest_history(task_id: str) -> Optional[ResearchHistory]:
         """获取任务的最新历史记录"""
-        with SessionLocal() as db:
-            return db.query(ResearchHistory).filter(
-                ResearchHistory.task_id == task_id
-            ).order_by(desc(ResearchHistory.executed_at)).first()
+        async with session_scope() as db:
+            result = await db.execute(_STMT_LATEST_HISTORY, {"task_id": task_id})
+            return result.scalars().first()
 
     @staticmethod
-    def get_successful_histories(task_id: str, limit: int = 10) -> List[ResearchHistory]:
+    async def get_successful_histories(task_id: str, limit: int = 10) -> List[ResearchHistory]:
         """获取成功执行的历史记录"""
-        with SessionLocal() as db:
-            return db.query(ResearchHistory).filter(
-                and_(
-                    ResearchHistory.task_id == task_id,
-                    ResearchHistory.status == "success"
-                )
-            ).order_by(desc(ResearchHistory.executed_at)).limit(limit).all()
+        async with session_scope() as db:
+            result = await db.execute(
+                _STMT_SUCCESSFUL_HISTORIES, {"task_id": task_id, "limit": limit}
+            )
+            return result.scalars().all()
 
     @staticmethod
-    def get_history_by_date_range(task_id: str, start_date: datetime, end_date: datetime) -> List[ResearchHistory]:
+    async def get_history_by_date_range(task_id: str, start_date: datetime, end_date: datetime) -> List[ResearchHistory]:
         """获取指定时间范围的历史记录"""
-        with SessionLocal() as db:
-            return db.query(ResearchHistory).filter(
-                and_(
-                    ResearchHistory.task_id == task_id,
-                    ResearchHistory.executed_at >= start_date,
-                    ResearchHistory.executed_at <= end_date
-                )
-            ).order_by(asc(ResearchHistory.executed_at)).all()
+        async with session_scope() as db:
+            result = await db.execute(
+                select(ResearchHistory).where(
+                    and_(
+                        ResearchHistory.task_id == task_id,
+                        ResearchHistory.executed_at >= start_date,
+                        ResearchHistory.executed_at <= end_date
+                    )
+                ).order_by(asc(ResearchHistory.executed_at))
+            )
+            return result.scalars().all()
 
     @staticmethod
-    def update_history(history_id: str, update_data: Dict[str, Any]) -> Optional[ResearchHistory]:
-        """更新历史记录"""
-        with SessionLocal() as db:
+    async def update_history(history_id: str, update_data: Dict[str, Any]) -> Optional[ResearchHistory]:
+        """更新历史记录（列名白名单过滤后单条Core UPDATE，冷列分流到内容表）"""
+        clean = {k: v for k, v in update_data.items() if k in _HISTORY_COLUMNS}
+        cold = {k: v for k, v in update_data.items() if k in _HISTORY_CONTENT_COLUMNS}
+        if not clean and not cold:
+            return None
+
+        async with session_scope() as db:
             try:
-                history = db.query(ResearchHistory).filter(ResearchHistory.id == history_id).first()
-                if not history:
-                    return None
-                
-                for key, value in update_data.items():
-                    if hasattr(history, key):
-                        setattr(history, key, value)
-                
-                db.commit()
-                db.refresh(history)
-                return history
+                if clean:
+                    result = await db.execute(
+                        update(ResearchHistory)
+                        .where(ResearchHistory.id == history_id)
+                        .values(**clean)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount == 0:
+                        await db.rollback()
+                        return None
+
+                if cold:
+                    result = await db.execute(
+                        update(ResearchHistoryContent)
+                        .where(ResearchHistoryContent.history_id == history_id)
+                        .values(**cold)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount == 0:
+                        # 此前没有内容行（如创建时无raw_result），补插入
+                        db.add(ResearchHistoryContent(history_id=history_id, **cold))
+
+                await db.commit()
+
+                refreshed = await db.execute(
+                    select(ResearchHistory).where(ResearchHistory.id == history_id)
+                )
+                return refreshed.scalars().first()
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to update research history {history_id}: {e}")
                 raise
 
@@ -224,104 +817,213 @@ class TrendDataDAO:
     """趋势数据访问对象"""
 
     @staticmethod
-    def create_trend_data(trend_data: Dict[str, Any]) -> TrendData:
+    async def create_trend_data(trend_data: Dict[str, Any]) -> TrendData:
         """创建趋势数据"""
-        with SessionLocal() as db:
+        async with session_scope() as db:
             try:
                 trend = TrendData(**trend_data)
                 db.add(trend)
-                db.commit()
-                db.refresh(trend)
-                logger.info(f"Created trend data: {trend.id}")
+                await db.commit()
+                _LATEST_TREND_CACHE.pop(trend.task_id)
+                logger.debug("Created trend data: %s", trend.id)
                 return trend
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to create trend data: {e}")
                 raise
 
     @staticmethod
-    def get_trend_data_by_task(task_id: str, limit: int = 30) -> List[TrendData]:
+    async def create_trends_bulk(rows: List[Dict[str, Any]]) -> List[str]:
+        """批量创建趋势数据（executemany单语句插入，返回生成的ID列表）"""
+        if not rows:
+            return []
+
+        async with session_scope() as db:
+            try:
+                # 客户端预生成主键，插入后无需逐行refresh
+                for row in rows:
+                    row.setdefault("id", str(uuid.uuid4()))
+                await db.execute(insert(TrendData), rows)
+                await db.commit()
+                for row in rows:
+                    _LATEST_TREND_CACHE.pop(row["task_id"])
+                logger.info("Created %d trend data rows in bulk", len(rows))
+                return [row["id"] for row in rows]
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to bulk create trend data: {e}")
+                raise
+
+    @staticmethod
+    async def get_trend_data_by_task(task_id: str, limit: int = 30) -> List[TrendData]:
         """获取任务的趋势数据"""
-        with SessionLocal() as db:
-            return db.query(TrendData).filter(
-                TrendData.task_id == task_id
-            ).order_by(desc(TrendData.analysis_date)).limit(limit).all()
+        async with session_scope() as db:
+            result = await db.execute(
+                select(TrendData).where(
+                    TrendData.task_id == task_id
+                ).order_by(desc(TrendData.analysis_date)).limit(limit)
+            )
+            return result.scalars().all()
 
     @staticmethod
-    def get_latest_trend_data(task_id: str) -> Optional[TrendData]:
-        """获取最新的趋势数据"""
-        with SessionLocal() as db:
-            return db.query(TrendData).filter(
-                TrendData.task_id == task_id
-            ).order_by(desc(TrendData.analysis_date)).first()
+    async def get_latest_trend_data(task_id: str) -> Optional[TrendData]:
+        """获取最新的趋势数据（短TTL缓存，新趋势写入时失效）"""
+        cached = _LATEST_TREND_CACHE.get(task_id)
+        if cached is not None:
+            return cached
+
+        async with session_scope() as db:
+            result = await db.execute(_STMT_LATEST_TREND, {"task_id": task_id})
+            trend = result.scalars().first()
+            if trend is not None:
+                _LATEST_TREND_CACHE.set(task_id, trend)
+            return trend
 
     @staticmethod
-    def get_trend_data_by_period(task_id: str, days: int = 30) -> List[TrendData]:
+    async def get_trend_data_by_period(task_id: str, days: int = 30) -> List[TrendData]:
         """获取指定时期的趋势数据"""
-        with SessionLocal() as db:
+        async with session_scope() as db:
             start_date = datetime.now() - timedelta(days=days)
-            return db.query(TrendData).filter(
-                and_(
-                    TrendData.task_id == task_id,
-                    TrendData.analysis_date >= start_date
-                )
-            ).order_by(asc(TrendData.analysis_date)).all()
+            result = await db.execute(
+                select(TrendData).where(
+                    and_(
+                        TrendData.task_id == task_id,
+                        TrendData.analysis_date >= start_date
+                    )
+                ).order_by(asc(TrendData.analysis_date))
+            )
+            return result.scalars().all()
 
 
 class TaskExecutionLogDAO:
     """任务执行日志数据访问对象"""
 
     @staticmethod
-    def create_log(log_data: Dict[str, Any]) -> TaskExecutionLog:
+    async def create_log(log_data: Union[ExecutionLogCreate, Dict[str, Any]]) -> TaskExecutionLog:
         """创建执行日志"""
-        with SessionLocal() as db:
+        async with session_scope() as db:
             try:
-                log = TaskExecutionLog(**log_data)
+                log = TaskExecutionLog(**_payload_to_dict(log_data))
                 db.add(log)
-                db.commit()
-                db.refresh(log)
+                await db.commit()
                 return log
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to create execution log: {e}")
                 raise
 
     @staticmethod
-    def update_log(log_id: str, update_data: Dict[str, Any]) -> Optional[TaskExecutionLog]:
-        """更新执行日志"""
-        with SessionLocal() as db:
+    async def create_logs_bulk(rows: List[Dict[str, Any]]) -> List[str]:
+        """批量创建执行日志（executemany单语句插入，返回生成的ID列表）"""
+        if not rows:
+            return []
+
+        async with session_scope() as db:
+            try:
+                for row in rows:
+                    row.setdefault("id", str(uuid.uuid4()))
+                await db.execute(insert(TaskExecutionLog), rows)
+                await db.commit()
+                return [row["id"] for row in rows]
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to bulk create execution logs: {e}")
+                raise
+
+    @staticmethod
+    async def update_log(log_id: str, update_data: Dict[str, Any]) -> Optional[TaskExecutionLog]:
+        """更新执行日志（列名白名单过滤后单条Core UPDATE）"""
+        clean = {k: v for k, v in update_data.items() if k in _LOG_COLUMNS}
+        if not clean:
+            return None
+
+        async with session_scope() as db:
             try:
-                log = db.query(TaskExecutionLog).filter(TaskExecutionLog.id == log_id).first()
-                if not log:
+                result = await db.execute(
+                    update(TaskExecutionLog)
+                    .where(TaskExecutionLog.id == log_id)
+                    .values(**clean)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    await db.rollback()
                     return None
-                
-                for key, value in update_data.items():
-                    if hasattr(log, key):
-                        setattr(log, key, value)
-                
-                db.commit()
-                db.refresh(log)
-                return log
+
+                await db.commit()
+
+                refreshed = await db.execute(
+                    select(TaskExecutionLog).where(TaskExecutionLog.id == log_id)
+                )
+                return refreshed.scalars().first()
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Failed to update execution log {log_id}: {e}")
                 raise
 
     @staticmethod
-    def get_logs_by_task(task_id: str, limit: int = 100) -> List[TaskExecutionLog]:
+    async def append_log_message(
+        log_id: str,
+        message: str,
+        timestamp: Optional[datetime] = None,
+        log_update: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """追加一条日志消息（纯INSERT进子表，不再读-改-写log_messages数组）
+
+        可选的log_update（如execution_step/progress_percentage）在同一事务内
+        以白名单过滤后的小UPDATE落库，单次往返完成进度推进
+        """
+        async with session_scope() as db:
+            try:
+                await db.execute(
+                    insert(ExecutionLogMessage).values(
+                        log_id=log_id,
+                        timestamp=timestamp or datetime.now(),
+                        message=message
+                    )
+                )
+                if log_update:
+                    clean = {k: v for k, v in log_update.items() if k in _LOG_COLUMNS}
+                    if clean:
+                        await db.execute(
+                            update(TaskExecutionLog)
+                            .where(TaskExecutionLog.id == log_id)
+                            .values(**clean)
+                            .execution_options(synchronize_session=False)
+                        )
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Failed to append log message for {log_id}: {e}")
+                raise
+
+    @staticmethod
+    async def get_log_messages(log_id: str) -> List[ExecutionLogMessage]:
+        """按追加顺序获取某次执行的全部日志消息"""
+        async with session_scope() as db:
+            result = await db.execute(
+                select(ExecutionLogMessage).where(
+                    ExecutionLogMessage.log_id == log_id
+                ).order_by(asc(ExecutionLogMessage.id))
+            )
+            return result.scalars().all()
+
+    @staticmethod
+    async def get_logs_by_task(task_id: str, limit: int = 100) -> List[TaskExecutionLog]:
         """获取任务的执行日志"""
-        with SessionLocal() as db:
-            return db.query(TaskExecutionLog).filter(
-                TaskExecutionLog.task_id == task_id
-            ).order_by(desc(TaskExecutionLog.started_at)).limit(limit).all()
+        async with session_scope() as db:
+            result = await db.execute(
+                select(TaskExecutionLog).where(
+                    TaskExecutionLog.task_id == task_id
+                ).order_by(desc(TaskExecutionLog.started_at)).limit(limit)
+            )
+            return result.scalars().all()
 
     @staticmethod
-    def get_running_logs() -> List[TaskExecutionLog]:
+    async def get_running_logs() -> List[TaskExecutionLog]:
         """获取正在运行的任务日志"""
-        with SessionLocal() as db:
-            return db.query(TaskExecutionLog).filter(
-                TaskExecutionLog.status == "running"
-            ).all()
+        async with session_scope() as db:
+            result = await db.execute(_STMT_RUNNING_LOGS)
+            return result.scalars().all()
 
 
 # 统计和分析函数
@@ -329,28 +1031,34 @@ class AnalyticsDAO:
     """数据分析和统计访问对象"""
 
     @staticmethod
-    def get_task_statistics(task_id: str) -> Dict[str, Any]:
+    async def get_task_statistics(task_id: str) -> Dict[str, Any]:
         """获取任务统计信息"""
-        with SessionLocal() as db:
-            task = db.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
+        async with session_scope() as db:
+            result = await db.execute(
+                select(ScheduledTask).where(ScheduledTask.id == task_id)
+            )
+            task = result.scalars().first()
             if not task:
                 return {}
 
-            # 获取历史记录统计
-            total_histories = db.query(ResearchHistory).filter(ResearchHistory.task_id == task_id).count()
-            successful_histories = db.query(ResearchHistory).filter(
-                and_(ResearchHistory.task_id == task_id, ResearchHistory.status == "success")
-            ).count()
-
-            # 获取平均趋势分数
-            avg_trend_score = db.query(func.avg(ResearchHistory.trend_score)).filter(
-                and_(ResearchHistory.task_id == task_id, ResearchHistory.trend_score.isnot(None))
-            ).scalar()
+            # 获取历史记录统计（单条聚合查询，避免多次往返）
+            total_histories, successful_histories, avg_trend_score = (await db.execute(
+                select(
+                    func.count(),
+                    func.sum(case((ResearchHistory.status == "success", 1), else_=0)),
+                    func.avg(ResearchHistory.trend_score)
+                ).select_from(ResearchHistory).where(
+                    ResearchHistory.task_id == task_id
+                )
+            )).one()
+            successful_histories = successful_histories or 0
 
             # 获取最新趋势数据
-            latest_trend = db.query(TrendData).filter(
-                TrendData.task_id == task_id
-            ).order_by(desc(TrendData.analysis_date)).first()
+            latest_trend = (await db.execute(
+                select(TrendData).where(
+                    TrendData.task_id == task_id
+                ).order_by(desc(TrendData.analysis_date)).limit(1)
+            )).scalars().first()
 
             return {
                 "task_info": task.to_dict(),
@@ -363,23 +1071,98 @@ class AnalyticsDAO:
             }
 
     @staticmethod
-    def get_user_statistics(user_id: str) -> Dict[str, Any]:
+    async def get_task_statistics_batch(task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """批量获取多个任务的统计信息（按task_id分组聚合，避免逐任务查询）"""
+        if not task_ids:
+            return {}
+
+        async with session_scope() as db:
+            # 一次性取出所有任务
+            tasks = (await db.execute(
+                select(ScheduledTask).where(ScheduledTask.id.in_(task_ids))
+            )).scalars().all()
+            if not tasks:
+                return {}
+
+            found_ids = [task.id for task in tasks]
+
+            # 按任务分组的历史记录统计
+            history_rows = (await db.execute(
+                select(
+                    ResearchHistory.task_id,
+                    func.count(),
+                    func.sum(case((ResearchHistory.status == "success", 1), else_=0)),
+                    func.avg(ResearchHistory.trend_score)
+                ).where(
+                    ResearchHistory.task_id.in_(found_ids)
+                ).group_by(ResearchHistory.task_id)
+            )).all()
+            history_stats = {row[0]: row[1:] for row in history_rows}
+
+            # 每个任务的最新趋势数据（按分析时间取最大值）
+            latest_dates = select(
+                TrendData.task_id.label("task_id"),
+                func.max(TrendData.analysis_date).label("max_date")
+            ).where(
+                TrendData.task_id.in_(found_ids)
+            ).group_by(TrendData.task_id).subquery()
+
+            latest_trends = (await db.execute(
+                select(TrendData).join(
+                    latest_dates,
+                    and_(
+                        TrendData.task_id == latest_dates.c.task_id,
+                        TrendData.analysis_date == latest_dates.c.max_date
+                    )
+                )
+            )).scalars().all()
+            trend_map = {trend.task_id: trend for trend in latest_trends}
+
+            statistics = {}
+            now = datetime.now()
+            for task in tasks:
+                total, successful, avg_score = history_stats.get(task.id, (0, 0, None))
+                successful = successful or 0
+                latest_trend = trend_map.get(task.id)
+                statistics[task.id] = {
+                    "task_info": task.to_dict(),
+                    "total_executions": total,
+                    "successful_executions": successful,
+                    "success_rate": successful / total if total > 0 else 0,
+                    "average_trend_score": float(avg_score) if avg_score else 0.0,
+                    "latest_trend_data": latest_trend.to_dict() if latest_trend else None,
+                    "uptime_days": (now - task.created_at).days if task.created_at else 0
+                }
+            return statistics
+
+    @staticmethod
+    async def get_user_statistics(user_id: str) -> Dict[str, Any]:
         """获取用户统计信息"""
-        with SessionLocal() as db:
-            total_tasks = db.query(ScheduledTask).filter(ScheduledTask.user_id == user_id).count()
-            active_tasks = db.query(ScheduledTask).filter(
-                and_(ScheduledTask.user_id == user_id, ScheduledTask.is_active == True)
-            ).count()
+        async with session_scope() as db:
+            total_tasks = (await db.execute(
+                select(func.count()).select_from(ScheduledTask).where(
+                    ScheduledTask.user_id == user_id
+                )
+            )).scalar()
+            active_tasks = (await db.execute(
+                select(func.count()).select_from(ScheduledTask).where(
+                    and_(ScheduledTask.user_id == user_id, ScheduledTask.is_active == True)
+                )
+            )).scalar()
 
             # 获取总执行次数
-            total_executions = db.query(func.sum(ScheduledTask.total_runs)).filter(
-                ScheduledTask.user_id == user_id
-            ).scalar() or 0
+            total_executions = (await db.execute(
+                select(func.sum(ScheduledTask.total_runs)).where(
+                    ScheduledTask.user_id == user_id
+                )
+            )).scalar() or 0
 
             # 获取成功执行次数
-            successful_executions = db.query(func.sum(ScheduledTask.success_runs)).filter(
-                ScheduledTask.user_id == user_id
-            ).scalar() or 0
+            successful_executions = (await db.execute(
+                select(func.sum(ScheduledTask.success_runs)).where(
+                    ScheduledTask.user_id == user_id
+                )
+            )).scalar() or 0
 
             return {
                 "total_tasks": total_tasks,
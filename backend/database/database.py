@@ -3,9 +3,13 @@
 Database connection and configuration management
 """
 import os
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import create_engine, event
+from time import monotonic
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import logging
 
@@ -13,63 +17,165 @@ logger = logging.getLogger(__name__)
 
 # 数据库文件路径
 DATABASE_PATH = os.getenv("DATABASE_PATH", "./backend/database/scheduled_research.db")
-DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"
+SYNC_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-# 创建数据库引擎
-engine = create_engine(
+# 创建异步数据库引擎（业务代码统一使用）
+# 默认队列连接池代替StaticPool，并发DAO调用不再串行在单个连接上
+engine = create_async_engine(
     DATABASE_URL,
     connect_args={
         "check_same_thread": False,  # SQLite特定配置
         "timeout": 20,  # 连接超时
     },
-    poolclass=StaticPool,
+    pool_size=10,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    pool_use_lifo=True,  # 后进先出，提升连接缓存局部性
+    insertmanyvalues_page_size=1000,  # 批量插入每条INSERT携带的行数
     echo=bool(os.getenv("DEBUG_DB", False))  # 开发环境下显示SQL语句
 )
 
-# 创建SessionLocal类
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 同步引擎仅用于Alembic迁移和建表等离线操作
+sync_engine = create_engine(
+    SYNC_DATABASE_URL,
+    connect_args={
+        "check_same_thread": False,
+        "timeout": 20,
+    },
+    poolclass=StaticPool,
+    echo=bool(os.getenv("DEBUG_DB", False))
+)
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    """
+    每个新连接上启用WAL和性能相关PRAGMA
+    WAL允许多读单写并发，NORMAL同步大幅降低commit的fsync开销
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB内存映射
+    cursor.execute("PRAGMA cache_size=-20000")  # 约20MB页缓存
+    cursor.execute("PRAGMA busy_timeout=5000")  # WAL下写写冲突时等待而非立即报错
+    cursor.close()
+
+
+event.listens_for(engine.sync_engine, "connect")(_set_sqlite_pragmas)
+event.listens_for(sync_engine, "connect")(_set_sqlite_pragmas)
+
+# 创建AsyncSessionLocal类
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # 创建Base类
 Base = declarative_base()
 
-def get_database():
+# 当前请求/任务绑定的会话；DAO通过session_scope复用，不再每次新开
+current_session: ContextVar[Optional[AsyncSession]] = ContextVar("current_session", default=None)
+
+@asynccontextmanager
+async def session_scope():
+    """
+    获取会话：上下文中已有会话则直接复用（参与调用方事务），
+    否则新开会话并在作用域内绑定到contextvar，退出时关闭
+    """
+    existing = current_session.get()
+    if existing is not None:
+        yield existing
+        return
+
+    async with AsyncSessionLocal() as session:
+        token = current_session.set(session)
+        try:
+            yield session
+        finally:
+            current_session.reset(token)
+
+async def get_database():
     """
     获取数据库会话
     Get database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+# 初始化和健康检查的快速路径状态
+_INIT_DONE = False
+_HEALTH_CACHE_TTL = 1.0  # 健康检查结果缓存时长（秒）
+_health_cache = {"result": None, "checked_at": 0.0}
 
 def init_database():
     """
-    初始化数据库，创建所有表
+    初始化数据库，创建所有表（进程内幂等，重复调用直接返回）
     Initialize database and create all tables
     """
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
+
     try:
         # 确保数据库目录存在
         os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
-        
-        # 创建所有表
-        Base.metadata.create_all(bind=engine)
+
+        # create_all逐表checkfirst，既幂等又能为旧库补建新增表（schema升级路径）；
+        # 进程内重复调用由_INIT_DONE短路
+        Base.metadata.create_all(bind=sync_engine)
         logger.info(f"Database initialized successfully at {DATABASE_PATH}")
+        _INIT_DONE = True
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 def check_database_connection():
     """
-    检查数据库连接是否正常
+    检查数据库连接是否正常（结果短暂缓存，探活不会压垮数据库）
     Check if database connection is working
     """
+    now = monotonic()
+    if _health_cache["result"] is not None and now - _health_cache["checked_at"] < _HEALTH_CACHE_TTL:
+        return _health_cache["result"]
+
     try:
         from sqlalchemy import text
-        with engine.connect() as conn:
+        with sync_engine.connect() as conn:
             conn.execute(text("SELECT 1"))
         logger.info("Database connection successful")
-        return True
+        result = True
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        result = False
+
+    _health_cache["result"] = result
+    _health_cache["checked_at"] = now
+    return result
+
+async def check_database_connection_async():
+    """
+    异步版本的连接检查（与同步版本共享缓存，供async路由使用）
+    Async database connection check
+    """
+    now = monotonic()
+    if _health_cache["result"] is not None and now - _health_cache["checked_at"] < _HEALTH_CACHE_TTL:
+        return _health_cache["result"]
+
+    try:
+        from sqlalchemy import text
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database connection successful")
+        result = True
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
-        return False
+        result = False
+
+    _health_cache["result"] = result
+    _health_cache["checked_at"] = now
+    return result
@@ -10,7 +10,6 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from .database import init_database, check_database_connection
 from .models import ScheduledTask, ResearchHistory, TrendData, TaskExecutionLog
 import logging
 
@@ -22,14 +21,47 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_sample_data():
+INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS ix_task_active_nextrun ON scheduled_tasks (is_active, next_run)",
+    "CREATE INDEX IF NOT EXISTS ix_task_user_active ON scheduled_tasks (user_id, is_active)",
+    "CREATE INDEX IF NOT EXISTS ix_history_task_exec ON research_histories (task_id, executed_at)",
+    "CREATE INDEX IF NOT EXISTS ix_history_task_status ON research_histories (task_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_history_task_status_time ON research_histories (task_id, status, executed_at)",
+    "CREATE INDEX IF NOT EXISTS ix_trend_task_date ON trend_data (task_id, analysis_date)",
+]
+
+
+def ensure_indexes(conn=None):
+    """为已存在的数据库补建复合索引（create_all不会更新已有表）"""
+    from sqlalchemy import text
+    from .database import sync_engine
+
+    try:
+        if conn is not None:
+            for statement in INDEX_STATEMENTS:
+                conn.execute(text(statement))
+        else:
+            with sync_engine.begin() as standalone_conn:
+                for statement in INDEX_STATEMENTS:
+                    standalone_conn.execute(text(statement))
+        logger.info("Database indexes ensured")
+    except Exception as e:
+        logger.error(f"Failed to ensure database indexes: {e}")
+        raise
+
+
+async def create_sample_data():
     """创建示例数据（仅用于开发和测试）"""
-    from .dao import ScheduledTaskDAO
+    import uuid
+    from sqlalchemy import insert
     from datetime import datetime, timedelta
-    
-    try:
-        # 创建示例定时任务
-        sample_task_data = {
+
+    from .database import AsyncSessionLocal
+    from .models import ScheduledTask, TaskKeyword
+
+    # 示例任务统一累积后一次executemany插入，单事务完成
+    sample_rows = [
+        {
             "topic": "人工智能技术发展动态",
             "keywords": ["人工智能", "AI技术", "机器学习", "深度学习", "技术趋势"],
             "description": "追踪人工智能领域的最新技术发展和行业动态",
@@ -43,13 +75,8 @@ def create_sample_data():
             "language": "zh-CN",
             "enable_notifications": True,
             "notification_threshold": 7.0
-        }
-        
-        task = ScheduledTaskDAO.create_task(sample_task_data)
-        logger.info(f"Created sample task: {task.id} - {task.topic}")
-        
-        # 创建另一个示例任务
-        sample_task_data_2 = {
+        },
+        {
             "topic": "区块链技术与加密货币市场",
             "keywords": ["区块链", "比特币", "以太坊", "DeFi", "NFT", "Web3"],
             "description": "监控区块链技术发展和加密货币市场变化",
@@ -63,13 +90,27 @@ def create_sample_data():
             "language": "zh-CN",
             "enable_notifications": True,
             "notification_threshold": 6.5
-        }
-        
-        task2 = ScheduledTaskDAO.create_task(sample_task_data_2)
-        logger.info(f"Created sample task: {task2.id} - {task2.topic}")
-        
+        },
+    ]
+
+    # 预生成id以便同事务写入关键词物化行（与create_task的同步步骤保持一致）
+    keyword_rows = []
+    for row in sample_rows:
+        row["id"] = str(uuid.uuid4())
+        row["next_run"] = datetime.now() + timedelta(hours=row["interval_hours"])
+        keyword_rows.extend(
+            {"task_id": row["id"], "keyword": kw} for kw in row["keywords"]
+        )
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(ScheduledTask), sample_rows)
+            await db.execute(insert(TaskKeyword), keyword_rows)
+            await db.commit()
+
+        logger.info(f"Created {len(sample_rows)} sample tasks")
         return True
-        
+
     except Exception as e:
         logger.error(f"Failed to create sample data: {e}")
         return False
@@ -78,24 +119,27 @@ def create_sample_data():
 def main():
     """主函数：初始化数据库"""
     logger.info("Starting database initialization...")
-    
+
     try:
-        # 检查数据库连接
-        logger.info("Checking database connection...")
-        if not check_database_connection():
-            logger.error("Database connection failed!")
-            return False
-        
-        # 初始化数据库表
-        logger.info("Creating database tables...")
-        init_database()
-        logger.info("Database tables created successfully!")
-        
+        # 探活、建表、补索引合并为一次连接/一个事务，减少启动时的I/O往返
+        from sqlalchemy import text
+        from .database import sync_engine, Base, DATABASE_PATH
+
+        os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+
+        with sync_engine.begin() as conn:
+            conn.execute(text("SELECT 1"))
+            Base.metadata.create_all(bind=conn)
+            ensure_indexes(conn)
+
+        logger.info("Database tables and indexes created successfully!")
+
         # 询问是否创建示例数据
         create_samples = os.getenv("CREATE_SAMPLE_DATA", "false").lower() == "true"
         if create_samples:
             logger.info("Creating sample data...")
-            if create_sample_data():
+            import asyncio
+            if asyncio.run(create_sample_data()):
                 logger.info("Sample data created successfully!")
             else:
                 logger.warning("Failed to create sample data, but database initialization completed.")
@@ -3,26 +3,58 @@
 Data models for scheduled research functionality
 """
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, Text, Float, JSON, ForeignKey
+    Column, Integer, String, DateTime, Boolean, Text, Float, JSON, ForeignKey, Index, inspect, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional
 import uuid
 
 from .database import Base
 
 
+def _compile_to_dict(cls):
+    """为模型生成专用to_dict并编译挂载：字段列表在导入时固化为字面代码，
+    调用时没有字段循环和类型分支，只剩一次字典构建"""
+    parts = []
+    for c in inspect(cls).columns:
+        if isinstance(c.type, DateTime):
+            parts.append(
+                f"        {c.name!r}: v.isoformat() if (v := d.get({c.name!r})) is not None else None,"
+            )
+        else:
+            parts.append(f"        {c.name!r}: d.get({c.name!r}),")
+    src = (
+        "def to_dict(self) -> dict:\n"
+        "    d = self.__dict__\n"
+        "    return {\n" + "\n".join(parts) + "\n    }\n"
+    )
+    namespace = {}
+    exec(compile(src, f"<to_dict {cls.__name__}>", "exec"), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "转换为字典格式"
+    cls.to_dict = to_dict
+
+
 class ScheduledTask(Base):
     """
     定时研究任务模型
     Scheduled research task model
     """
     __tablename__ = "scheduled_tasks"
+    __table_args__ = (
+        # 调度器扫描到期任务的热点过滤条件
+        Index("ix_task_active_nextrun", "is_active", "next_run"),
+        # 用户维度统计/列表的过滤索引
+        Index("ix_task_user_active", "user_id", "is_active"),
+    )
 
     # 基础字段
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4()),
+        server_default=text("(lower(hex(randomblob(16))))")  # 绕过ORM的裸SQL插入由库端生成
+    )
     user_id = Column(String, nullable=False, default="default_user")  # 用户ID，未来扩展用户系统时使用
     
     # 任务配置
@@ -52,8 +84,9 @@ class ScheduledTask(Base):
     notification_threshold = Column(Float, default=0.0)  # 通知阈值（趋势变化分数）
     
     # 时间戳
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, default=datetime.now)
+    # 无onupdate：仅语义更新（update_task显式赋值）刷新，统计计数UPDATE不重写该列
+    updated_at = Column(DateTime, default=datetime.now)
     last_run = Column(DateTime, nullable=True)  # 上次执行时间
     
     # 状态统计
@@ -61,50 +94,17 @@ class ScheduledTask(Base):
     success_runs = Column(Integer, default=0)  # 成功执行次数
     failed_runs = Column(Integer, default=0)  # 失败执行次数
     
-    # 关联关系
-    research_histories = relationship("ResearchHistory", back_populates="task", cascade="all, delete-orphan")
-    trend_data = relationship("TrendData", back_populates="task", cascade="all, delete-orphan")
+    # 关联关系（lazy="raise"强制调用方显式eager load，避免异步会话下的隐式N+1）
+    research_histories = relationship(
+        "ResearchHistory", back_populates="task", cascade="all, delete-orphan", lazy="raise"
+    )
+    trend_data = relationship(
+        "TrendData", back_populates="task", cascade="all, delete-orphan", lazy="raise"
+    )
 
     def __repr__(self):
         return f"<ScheduledTask(id={self.id}, topic={self.topic}, active={self.is_active})>"
 
-    def to_dict(self) -> Dict:
-        """转换为字典格式"""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "topic": self.topic,
-            "keywords": self.keywords,
-            "description": self.description,
-            "interval_hours": self.interval_hours,
-            "is_active": self.is_active,
-            "next_run": self.next_run.isoformat() if self.next_run else None,
-            "analysis_depth": self.analysis_depth,
-            "source_types": self.source_types,
-            "report_type": self.report_type,
-            "report_source": self.report_source,
-            "tone": self.tone,
-            "query_domains": self.query_domains,
-            "max_sources": self.max_sources,
-            "language": self.language,
-            "enable_notifications": self.enable_notifications,
-            "notification_threshold": self.notification_threshold,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_run": self.last_run.isoformat() if self.last_run else None,
-            "total_runs": self.total_runs,
-            "success_runs": self.success_runs,
-            "failed_runs": self.failed_runs,
-        }
-
-    def update_next_run(self):
-        """更新下次执行时间"""
-        self.next_run = datetime.now() + timedelta(hours=self.interval_hours)
-
-    def should_run(self) -> bool:
-        """检查是否应该执行"""
-        return self.is_active and self.next_run and datetime.now() >= self.next_run
-
 
 class ResearchHistory(Base):
     """
@@ -112,59 +112,69 @@ class ResearchHistory(Base):
     Research history model
     """
     __tablename__ = "research_histories"
+    __table_args__ = (
+        # 历史列表按任务+时间倒序、成功记录按任务+状态过滤
+        Index("ix_history_task_exec", "task_id", "executed_at"),
+        Index("ix_history_task_status", "task_id", "status"),
+        # 统计聚合的覆盖索引，按任务+状态+时间聚合无需回表
+        Index("ix_history_task_status_time", "task_id", "status", "executed_at"),
+    )
 
     # 基础字段
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4()),
+        server_default=text("(lower(hex(randomblob(16))))")  # 绕过ORM的裸SQL插入由库端生成
+    )
     task_id = Column(String, ForeignKey("scheduled_tasks.id"), nullable=False)
     
     # 执行信息
-    executed_at = Column(DateTime, default=func.now())
+    executed_at = Column(DateTime, default=datetime.now)
     execution_duration = Column(Float, nullable=True)  # 执行时长（秒）
     status = Column(String(20), nullable=False, default="success")  # success, failed, partial
     error_message = Column(Text, nullable=True)  # 错误信息
     
-    # 研究结果
-    raw_result = Column(Text, nullable=True)  # 原始研究结果
+    # 研究结果（大文本raw_result等冷列拆到ResearchHistoryContent，热扫描不读大块）
     summary = Column(Text, nullable=True)  # AI生成的摘要
     key_findings = Column(JSON, nullable=True)  # 关键发现列表
     key_changes = Column(JSON, nullable=True)  # 相比上次的关键变化
-    
+
     # 统计信息
     sources_count = Column(Integer, default=0)  # 使用的信息源数量
     tokens_used = Column(Integer, default=0)  # 使用的token数量
     trend_score = Column(Float, nullable=True)  # 趋势变化分数 (0-10)
     sentiment_score = Column(Float, nullable=True)  # 情感分数 (-1 to 1)
-    
+
     # 元数据
     research_config = Column(JSON, nullable=True)  # 研究配置快照
-    sources_used = Column(JSON, nullable=True)  # 使用的信息源列表
-    
-    # 关联关系
-    task = relationship("ScheduledTask", back_populates="research_histories")
+
+    # 关联关系（lazy="raise"同ScheduledTask侧，杜绝隐式反向加载）
+    task = relationship("ScheduledTask", back_populates="research_histories", lazy="raise")
+    # passive_deletes：删除路径由DAO批量清理内容行，级联时不逐条加载
+    content = relationship(
+        "ResearchHistoryContent", back_populates="history", uselist=False,
+        cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<ResearchHistory(id={self.id}, task_id={self.task_id}, status={self.status})>"
 
-    def to_dict(self) -> Dict:
-        """转换为字典格式"""
-        return {
-            "id": self.id,
-            "task_id": self.task_id,
-            "executed_at": self.executed_at.isoformat() if self.executed_at else None,
-            "execution_duration": self.execution_duration,
-            "status": self.status,
-            "error_message": self.error_message,
-            "raw_result": self.raw_result,
-            "summary": self.summary,
-            "key_findings": self.key_findings,
-            "key_changes": self.key_changes,
-            "sources_count": self.sources_count,
-            "tokens_used": self.tokens_used,
-            "trend_score": self.trend_score,
-            "sentiment_score": self.sentiment_score,
-            "research_config": self.research_config,
-            "sources_used": self.sources_used,
-        }
+
+class ResearchHistoryContent(Base):
+    """
+    研究历史冷数据模型（垂直拆分）
+    原始报告等大块字段单独成表，统计扫描research_histories时不再为其付I/O
+    """
+    __tablename__ = "research_history_contents"
+
+    history_id = Column(String, ForeignKey("research_histories.id"), primary_key=True)
+    raw_result = Column(Text, nullable=True)  # 原始研究结果
+    sources_used = Column(JSON, nullable=True)  # 使用的信息源列表
+
+    # 关联关系（lazy="raise"同各模型，详情路径需显式eager load）
+    history = relationship("ResearchHistory", back_populates="content", lazy="raise")
+
+    def __repr__(self):
+        return f"<ResearchHistoryContent(history_id={self.history_id})>"
 
 
 class TrendData(Base):
@@ -173,15 +183,22 @@ class TrendData(Base):
     Trend analysis data model
     """
     __tablename__ = "trend_data"
+    __table_args__ = (
+        # 趋势查询按任务+分析时间过滤排序
+        Index("ix_trend_task_date", "task_id", "analysis_date"),
+    )
 
     # 基础字段
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4()),
+        server_default=text("(lower(hex(randomblob(16))))")  # 绕过ORM的裸SQL插入由库端生成
+    )
     task_id = Column(String, ForeignKey("scheduled_tasks.id"), nullable=False)
     
     # 时间周期
     period_start = Column(DateTime, nullable=False)
     period_end = Column(DateTime, nullable=False)
-    analysis_date = Column(DateTime, default=func.now())
+    analysis_date = Column(DateTime, default=datetime.now)
     
     # 趋势分析
     keyword_trends = Column(JSON, nullable=True)  # 关键词趋势变化 {keyword: trend_score}
@@ -203,34 +220,12 @@ class TrendData(Base):
     anomaly_detected = Column(Boolean, default=False)  # 是否检测到异常
     anomaly_description = Column(Text, nullable=True)  # 异常描述
     
-    # 关联关系
-    task = relationship("ScheduledTask", back_populates="trend_data")
+    # 关联关系（lazy="raise"同ScheduledTask侧，杜绝隐式反向加载）
+    task = relationship("ScheduledTask", back_populates="trend_data", lazy="raise")
 
     def __repr__(self):
         return f"<TrendData(id={self.id}, task_id={self.task_id}, period={self.period_start}-{self.period_end})>"
 
-    def to_dict(self) -> Dict:
-        """转换为字典格式"""
-        return {
-            "id": self.id,
-            "task_id": self.task_id,
-            "period_start": self.period_start.isoformat() if self.period_start else None,
-            "period_end": self.period_end.isoformat() if self.period_end else None,
-            "analysis_date": self.analysis_date.isoformat() if self.analysis_date else None,
-            "keyword_trends": self.keyword_trends,
-            "sentiment_changes": self.sentiment_changes,
-            "topic_evolution": self.topic_evolution,
-            "new_topics": self.new_topics,
-            "emerging_keywords": self.emerging_keywords,
-            "trending_sources": self.trending_sources,
-            "activity_level": self.activity_level,
-            "change_magnitude": self.change_magnitude,
-            "confidence_score": self.confidence_score,
-            "comparison_data": self.comparison_data,
-            "anomaly_detected": self.anomaly_detected,
-            "anomaly_description": self.anomaly_description,
-        }
-
 
 class TaskExecutionLog(Base):
     """
@@ -239,18 +234,21 @@ class TaskExecutionLog(Base):
     """
     __tablename__ = "task_execution_logs"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4()),
+        server_default=text("(lower(hex(randomblob(16))))")  # 绕过ORM的裸SQL插入由库端生成
+    )
     task_id = Column(String, ForeignKey("scheduled_tasks.id"), nullable=False)
     
     # 执行信息
-    started_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime, default=datetime.now)
     completed_at = Column(DateTime, nullable=True)
     status = Column(String(20), nullable=False)  # running, completed, failed, cancelled
     
     # 执行详情
     execution_step = Column(String(100), nullable=True)  # 当前执行步骤
     progress_percentage = Column(Float, default=0.0)  # 执行进度百分比
-    log_messages = Column(JSON, nullable=True)  # 日志消息列表
+    log_messages = Column(JSON, nullable=True)  # 日志消息列表（遗留列；增量消息已改写入execution_log_messages子表）
     
     # 资源使用
     memory_usage = Column(Float, nullable=True)  # 内存使用量(MB)
@@ -260,18 +258,42 @@ class TaskExecutionLog(Base):
     def __repr__(self):
         return f"<TaskExecutionLog(id={self.id}, task_id={self.task_id}, status={self.status})>"
 
-    def to_dict(self) -> Dict:
-        """转换为字典格式"""
-        return {
-            "id": self.id,
-            "task_id": self.task_id,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "status": self.status,
-            "execution_step": self.execution_step,
-            "progress_percentage": self.progress_percentage,
-            "log_messages": self.log_messages,
-            "memory_usage": self.memory_usage,
-            "cpu_usage": self.cpu_usage,
-            "api_calls_made": self.api_calls_made,
-        }
+
+class ExecutionLogMessage(Base):
+    """
+    执行日志消息子表
+    逐条INSERT追加，替代对log_messages JSON数组的整列读-改-写
+    （第N条消息不再重写前N-1条，消除O(N²)写放大）
+    """
+    __tablename__ = "execution_log_messages"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    log_id = Column(String, ForeignKey("task_execution_logs.id"), nullable=False, index=True)
+    timestamp = Column(DateTime, default=datetime.now)
+    message = Column(Text, nullable=False)
+
+    def __repr__(self):
+        return f"<ExecutionLogMessage(log_id={self.log_id}, message={self.message[:30]})>"
+
+
+class TaskKeyword(Base):
+    """
+    任务关键词物化表
+    按关键词过滤任务时走(keyword)索引，不再全表扫描并逐行解码keywords JSON
+    """
+    __tablename__ = "task_keywords"
+    __table_args__ = (
+        Index("ix_keyword", "keyword"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(String, ForeignKey("scheduled_tasks.id"), nullable=False, index=True)
+    keyword = Column(String(200), nullable=False)
+
+    def __repr__(self):
+        return f"<TaskKeyword(task_id={self.task_id}, keyword={self.keyword})>"
+
+
+# 导入时为各模型生成专用to_dict（关系属性不参与序列化，与原手写版一致）
+for _cls in (ScheduledTask, ResearchHistory, ResearchHistoryContent, TrendData, TaskExecutionLog):
+    _compile_to_dict(_cls)
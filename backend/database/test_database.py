@@ -33,7 +33,7 @@ def test_database_connection():
     return check_database_connection()
 
 
-def test_task_operations():
+async def test_task_operations():
     """测试定时任务操作"""
     logger.info("Testing scheduled task operations...")
     
@@ -52,27 +52,27 @@ def test_task_operations():
         }
         
         # 创建任务
-        task = ScheduledTaskDAO.create_task(task_data)
+        task = await ScheduledTaskDAO.create_task(task_data)
         logger.info(f"✅ Created task: {task.id}")
         
         # 获取任务
-        retrieved_task = ScheduledTaskDAO.get_task_by_id(task.id)
+        retrieved_task = await ScheduledTaskDAO.get_task_by_id(task.id)
         assert retrieved_task is not None, "Failed to retrieve created task"
         logger.info(f"✅ Retrieved task: {retrieved_task.topic}")
         
         # 更新任务
         update_data = {"description": "更新后的描述", "interval_hours": 12}
-        updated_task = ScheduledTaskDAO.update_task(task.id, update_data)
+        updated_task = await ScheduledTaskDAO.update_task(task.id, update_data)
         assert updated_task.description == "更新后的描述", "Failed to update task"
         logger.info(f"✅ Updated task description")
         
         # 获取用户任务列表
-        user_tasks = ScheduledTaskDAO.get_tasks_by_user("default_user")
+        user_tasks = await ScheduledTaskDAO.get_tasks_by_user("default_user")
         assert len(user_tasks) >= 1, "Failed to get user tasks"
         logger.info(f"✅ Found {len(user_tasks)} user tasks")
         
         # 测试待执行任务查询
-        pending_tasks = ScheduledTaskDAO.get_pending_tasks()
+        pending_tasks = await ScheduledTaskDAO.get_pending_tasks()
         logger.info(f"✅ Found {len(pending_tasks)} pending tasks")
         
         return task.id
@@ -82,7 +82,7 @@ def test_task_operations():
         raise
 
 
-def test_research_history_operations(task_id: str):
+async def test_research_history_operations(task_id: str):
     """测试研究历史操作"""
     logger.info("Testing research history operations...")
     
@@ -102,22 +102,28 @@ def test_research_history_operations(task_id: str):
         }
         
         # 创建历史记录
-        history = ResearchHistoryDAO.create_history(history_data)
+        history = await ResearchHistoryDAO.create_history(history_data)
         logger.info(f"✅ Created research history: {history.id}")
         
         # 获取任务历史
-        task_histories = ResearchHistoryDAO.get_history_by_task(task_id)
+        task_histories = await ResearchHistoryDAO.get_history_by_task(task_id)
         assert len(task_histories) >= 1, "Failed to get task histories"
         logger.info(f"✅ Found {len(task_histories)} histories for task")
         
         # 获取最新历史
-        latest_history = ResearchHistoryDAO.get_latest_history(task_id)
+        latest_history = await ResearchHistoryDAO.get_latest_history(task_id)
         assert latest_history is not None, "Failed to get latest history"
         logger.info(f"✅ Retrieved latest history: {latest_history.summary}")
+
+        # 获取冷数据（原始结果拆分存储在内容表）
+        content = await ResearchHistoryDAO.get_history_content(history.id)
+        assert content is not None and content.raw_result == history_data["raw_result"], \
+            "Failed to get history content"
+        logger.info(f"✅ Retrieved history content: {len(content.raw_result)} chars")
         
         # 更新历史记录
         update_data = {"summary": "更新后的摘要", "trend_score": 8.0}
-        updated_history = ResearchHistoryDAO.update_history(history.id, update_data)
+        updated_history = await ResearchHistoryDAO.update_history(history.id, update_data)
         assert updated_history.trend_score == 8.0, "Failed to update history"
         logger.info(f"✅ Updated history trend score to {updated_history.trend_score}")
         
@@ -128,7 +134,41 @@ def test_research_history_operations(task_id: str):
         raise
 
 
-def test_trend_data_operations(task_id: str):
+async def test_bulk_operations(task_id: str):
+    """测试批量插入路径（单条executemany语句写入N行）"""
+    logger.info("Testing bulk insert operations...")
+
+    # 行数可通过环境变量调大，兼作批量写入的性能冒烟测试
+    rows_count = int(os.getenv("BULK_TEST_ROWS", "200"))
+
+    try:
+        base_time = datetime.now()
+        history_rows = [
+            {
+                "task_id": task_id,
+                "executed_at": base_time - timedelta(minutes=i),
+                "summary": f"批量摘要 {i}",
+                "sources_count": i % 10,
+                "trend_score": (i % 100) / 10.0,
+                "status": "success"
+            }
+            for i in range(rows_count)
+        ]
+
+        history_ids = await ResearchHistoryDAO.create_histories_bulk(history_rows)
+        assert len(history_ids) == rows_count, "Bulk history insert returned wrong id count"
+        logger.info(f"✅ Bulk inserted {len(history_ids)} histories")
+
+        task_histories = await ResearchHistoryDAO.get_history_by_task(task_id, limit=rows_count + 10)
+        assert len(task_histories) >= rows_count, "Bulk inserted histories not found"
+        logger.info(f"✅ Verified {len(task_histories)} histories after bulk insert")
+
+    except Exception as e:
+        logger.error(f"❌ Bulk operations test failed: {e}")
+        raise
+
+
+async def test_trend_data_operations(task_id: str):
     """测试趋势数据操作"""
     logger.info("Testing trend data operations...")
     
@@ -156,16 +196,16 @@ def test_trend_data_operations(task_id: str):
         }
         
         # 创建趋势数据
-        trend = TrendDataDAO.create_trend_data(trend_data)
+        trend = await TrendDataDAO.create_trend_data(trend_data)
         logger.info(f"✅ Created trend data: {trend.id}")
         
         # 获取任务趋势数据
-        task_trends = TrendDataDAO.get_trend_data_by_task(task_id)
+        task_trends = await TrendDataDAO.get_trend_data_by_task(task_id)
         assert len(task_trends) >= 1, "Failed to get task trends"
         logger.info(f"✅ Found {len(task_trends)} trend data for task")
         
         # 获取最新趋势数据
-        latest_trend = TrendDataDAO.get_latest_trend_data(task_id)
+        latest_trend = await TrendDataDAO.get_latest_trend_data(task_id)
         assert latest_trend is not None, "Failed to get latest trend"
         logger.info(f"✅ Retrieved latest trend: activity_level={latest_trend.activity_level}")
         
@@ -176,18 +216,18 @@ def test_trend_data_operations(task_id: str):
         raise
 
 
-def test_analytics_operations(task_id: str):
+async def test_analytics_operations(task_id: str):
     """测试分析统计操作"""
     logger.info("Testing analytics operations...")
     
     try:
         # 获取任务统计
-        task_stats = AnalyticsDAO.get_task_statistics(task_id)
+        task_stats = await AnalyticsDAO.get_task_statistics(task_id)
         assert "task_info" in task_stats, "Failed to get task statistics"
         logger.info(f"✅ Task statistics: {task_stats['total_executions']} executions")
         
         # 获取用户统计
-        user_stats = AnalyticsDAO.get_user_statistics("default_user")
+        user_stats = await AnalyticsDAO.get_user_statistics("default_user")
         assert "total_tasks" in user_stats, "Failed to get user statistics"
         logger.info(f"✅ User statistics: {user_stats['total_tasks']} tasks")
         
@@ -196,13 +236,13 @@ def test_analytics_operations(task_id: str):
         raise
 
 
-def cleanup_test_data(task_id: str):
+async def cleanup_test_data(task_id: str):
     """清理测试数据"""
     logger.info("Cleaning up test data...")
     
     try:
         # 删除测试任务（会级联删除相关数据）
-        success = ScheduledTaskDAO.delete_task(task_id)
+        success = await ScheduledTaskDAO.delete_task(task_id)
         if success:
             logger.info("✅ Test data cleaned up successfully")
         else:
@@ -212,7 +252,7 @@ def cleanup_test_data(task_id: str):
         logger.error(f"❌ Cleanup failed: {e}")
 
 
-def run_all_tests():
+async def run_all_tests():
     """运行所有测试"""
     logger.info("🚀 Starting database functionality tests...")
     
@@ -226,23 +266,26 @@ def run_all_tests():
             raise Exception("Database connection test failed")
         
         # 测试任务操作
-        task_id = test_task_operations()
+        task_id = await test_task_operations()
         
         # 测试研究历史操作
-        history_id = test_research_history_operations(task_id)
-        
+        history_id = await test_research_history_operations(task_id)
+
+        # 测试批量插入路径
+        await test_bulk_operations(task_id)
+
         # 测试趋势数据操作
-        trend_id = test_trend_data_operations(task_id)
+        trend_id = await test_trend_data_operations(task_id)
         
         # 测试分析统计操作
-        test_analytics_operations(task_id)
+        await test_analytics_operations(task_id)
         
         logger.info("🎉 All database tests passed successfully!")
         
         # 询问是否清理测试数据
         cleanup = os.getenv("CLEANUP_TEST_DATA", "true").lower() == "true"
         if cleanup:
-            cleanup_test_data(task_id)
+            await cleanup_test_data(task_id)
         
         return True
         
@@ -252,6 +295,6 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    success = asyncio.run(run_all_tests())
     if not success:
         sys.exit(1)
@@ -3,13 +3,15 @@
 Scheduled Research Configuration - Optimized for performance and resource usage
 """
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 
 class ScheduledResearchConfig:
     """定时研究专用配置"""
-    
-    # 基础性能配置
-    BASIC_CONFIG = {
+
+    # 基础性能配置（MappingProxyType防止意外修改共享基础配置）
+    BASIC_CONFIG = MappingProxyType({
         "MAX_SEARCH_RESULTS_PER_QUERY": 3,
         "MAX_SUBTOPICS": 2,
         "MAX_ITERATIONS": 2,
@@ -23,10 +25,10 @@ class ScheduledResearchConfig:
         "SUMMARY_TOKEN_LIMIT": 400,
         "FAST_TOKEN_LIMIT": 2000,
         "SMART_TOKEN_LIMIT": 4000,
-    }
-    
+    })
+
     # 详细分析配置
-    DETAILED_CONFIG = {
+    DETAILED_CONFIG = MappingProxyType({
         "MAX_SEARCH_RESULTS_PER_QUERY": 5,
         "MAX_SUBTOPICS": 3,
         "MAX_ITERATIONS": 3,
@@ -40,10 +42,10 @@ class ScheduledResearchConfig:
         "TEMPERATURE": 0.4,
         "FAST_TOKEN_LIMIT": 3000,
         "SMART_TOKEN_LIMIT": 5000,
-    }
-    
+    })
+
     # 深度分析配置
-    DEEP_CONFIG = {
+    DEEP_CONFIG = MappingProxyType({
         "MAX_SEARCH_RESULTS_PER_QUERY": 7,
         "MAX_SUBTOPICS": 4,
         "MAX_ITERATIONS": 4,
@@ -57,83 +59,90 @@ class ScheduledResearchConfig:
         "TEMPERATURE": 0.4,
         "FAST_TOKEN_LIMIT": 3000,
         "SMART_TOKEN_LIMIT": 6000,
+    })
+
+    # 深度到基础配置的映射（类定义时构建一次）
+    _DEPTH_MAP = {
+        "basic": BASIC_CONFIG,
+        "detailed": DETAILED_CONFIG,
+        "deep": DEEP_CONFIG
     }
-    
+
     @classmethod
     def get_config_by_depth(cls, analysis_depth: str) -> Dict[str, Any]:
-        """根据分析深度获取配置"""
-        config_map = {
-            "basic": cls.BASIC_CONFIG,
-            "detailed": cls.DETAILED_CONFIG,
-            "deep": cls.DEEP_CONFIG
-        }
-        return config_map.get(analysis_depth, cls.BASIC_CONFIG).copy()
-    
+        """根据分析深度获取配置（返回可修改的副本）"""
+        return dict(cls._DEPTH_MAP.get(analysis_depth, cls.BASIC_CONFIG))
+
     @classmethod
     def get_optimized_config(cls, task) -> Dict[str, Any]:
-        """获取针对任务优化的配置"""
-        base_config = cls.get_config_by_depth(task.analysis_depth)
-        
+        """获取针对任务优化的配置（按任务指纹memoize，调度tick内重复调用不重算）"""
+        cached = cls._optimized_by_fingerprint(
+            task.analysis_depth,
+            task.language,
+            task.report_source,
+            bool(task.query_domains),
+            len(task.keywords) if task.keywords else 1,
+        )
+        return dict(cached)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _optimized_by_fingerprint(analysis_depth: str, language: str, report_source: str,
+                                  has_query_domains: bool, keyword_count: int) -> Dict[str, Any]:
+        """按影响配置的任务特征指纹计算优化配置，结果常驻缓存"""
+        base_config = ScheduledResearchConfig.get_config_by_depth(analysis_depth)
+
         # 根据任务特性进一步优化
         optimizations = {}
-        
+
         # 语言优化
-        if task.language == "zh-CN":
+        if language == "zh-CN":
             optimizations["LANGUAGE"] = "chinese"
         else:
             optimizations["LANGUAGE"] = "english"
-        
+
         # 源类型优化
-        if task.report_source == "local":
+        if report_source == "local":
             optimizations["MAX_SCRAPER_WORKERS"] = 2  # 本地文档不需要太多worker
             optimizations["MAX_SEARCH_RESULTS_PER_QUERY"] = 1
-        
+
         # 域名限制优化
-        if task.query_domains:
+        if has_query_domains:
             # 有域名限制时减少并发，避免被限制
             optimizations["MAX_SCRAPER_WORKERS"] = min(base_config["MAX_SCRAPER_WORKERS"], 4)
-        
+
         # 关键词数量优化
-        keyword_count = len(task.keywords) if task.keywords else 1
         if keyword_count > 5:
             # 关键词较多时减少子主题数量
             optimizations["MAX_SUBTOPICS"] = max(1, base_config["MAX_SUBTOPICS"] - 1)
-        
+
         # 合并配置
         base_config.update(optimizations)
-        return base_config
+        return MappingProxyType(base_config)
     
+    # 深度到超时时间的映射（类定义时构建一次）
+    _TIMEOUT_MAP = {
+        "basic": 120,      # 2分钟 - 快速分析
+        "detailed": 300,   # 5分钟 - 详细分析
+        "deep": 600        # 10分钟 - 深度分析
+    }
+
+    # 深度到LLM配置的映射（类定义时构建一次，basic优先快速模型）
+    _LLM_CONFIG_MAP = {
+        "basic": MappingProxyType({"model_preference": "fast", "max_retries": 2, "timeout": 30}),
+        "detailed": MappingProxyType({"model_preference": "smart", "max_retries": 3, "timeout": 60}),
+        "deep": MappingProxyType({"model_preference": "smart", "max_retries": 3, "timeout": 90}),
+    }
+
     @classmethod
     def get_timeout_by_depth(cls, analysis_depth: str) -> int:
         """根据分析深度获取超时时间"""
-        timeout_map = {
-            "basic": 120,      # 2分钟 - 快速分析
-            "detailed": 300,   # 5分钟 - 详细分析
-            "deep": 600        # 10分钟 - 深度分析
-        }
-        return timeout_map.get(analysis_depth, 180)
-    
+        return cls._TIMEOUT_MAP.get(analysis_depth, 180)
+
     @classmethod
     def get_llm_config(cls, analysis_depth: str) -> Dict[str, Any]:
-        """获取LLM配置"""
-        if analysis_depth == "basic":
-            return {
-                "model_preference": "fast",  # 优先使用快速模型
-                "max_retries": 2,
-                "timeout": 30
-            }
-        elif analysis_depth == "detailed":
-            return {
-                "model_preference": "smart",  # 使用智能模型
-                "max_retries": 3,
-                "timeout": 60
-            }
-        else:  # deep
-            return {
-                "model_preference": "smart",  # 深度分析也用智能模型
-                "max_retries": 3,
-                "timeout": 90
-            }
+        """获取LLM配置（返回可修改的副本）"""
+        return dict(cls._LLM_CONFIG_MAP.get(analysis_depth, cls._LLM_CONFIG_MAP["deep"]))
     
     @classmethod
     def get_retriever_config(cls, task) -> Dict[str, Any]:
@@ -151,40 +160,27 @@ class ScheduledResearchConfig:
         
         return config
 
+# 各深度的查询模板参数：(关键词截断数, 固定增强词后缀)，导入时固化
+_QUERY_TEMPLATES = MappingProxyType({
+    "basic": (3, ""),                              # 基础查询 - 简洁明了
+    "detailed": (5, " 趋势 发展"),                  # 详细查询 - 包含趋势分析要求
+    "deep": (None, " 深度分析 市场趋势 技术发展"),  # 深度查询 - 全面的研究方向
+})
+
+
 class ScheduledResearchPrompts:
     """定时研究专用提示词"""
-    
+
     @staticmethod
     def generate_trend_research_query(task) -> str:
-        """生成趋势研究查询"""
-        base_query = task.topic
-        keywords = task.keywords or []
-        
-        # 构建增强的查询
-        if task.analysis_depth == "basic":
-            # 基础查询 - 简洁明了
-            query_parts = [base_query]
-            if keywords:
-                query_parts.extend(keywords[:3])  # 最多3个关键词
-            return " ".join(query_parts)
-        
-        elif task.analysis_depth == "detailed":
-            # 详细查询 - 包含趋势分析要求
-            trend_terms = ["趋势", "发展", "变化", "现状", "前景"]
-            query_parts = [base_query]
-            if keywords:
-                query_parts.extend(keywords[:5])
-            query_parts.extend(trend_terms[:2])
-            return " ".join(query_parts)
-        
-        else:  # deep
-            # 深度查询 - 全面的研究方向
-            analysis_terms = ["深度分析", "市场趋势", "技术发展", "未来展望", "影响因素"]
-            query_parts = [base_query]
-            if keywords:
-                query_parts.extend(keywords)
-            query_parts.extend(analysis_terms[:3])
-            return " ".join(query_parts)
+        """生成趋势研究查询（按深度查表拼接，不再逐次构建中间列表）"""
+        keyword_limit, suffix = _QUERY_TEMPLATES.get(
+            task.analysis_depth, _QUERY_TEMPLATES["deep"]
+        )
+        keywords = task.keywords
+        if keywords:
+            return f"{task.topic} {' '.join(keywords[:keyword_limit])}{suffix}"
+        return f"{task.topic}{suffix}"
     
     @staticmethod
     def get_research_instructions(task) -> str:
@@ -219,8 +215,9 @@ class ScheduledResearchPrompts:
 """
 
 # 环境变量配置
+@lru_cache(maxsize=1)
 def get_env_config() -> Dict[str, Any]:
-    """从环境变量获取配置"""
+    """从环境变量获取配置（进程内只解析一次，环境在启动后视为不变）"""
     return {
         # API配置
         "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
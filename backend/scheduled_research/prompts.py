@@ -1,96 +1,38 @@
 """
 定时研究专用提示词系统
 Scheduled Research Prompts System
+
+静态指令脚手架在导入时固化为模块常量，并统一放在提示词开头，
+动态数据（主题、研究数据、历史记录）追加在末尾。前缀稳定后，
+LLM供应商的prompt缓存可以命中静态部分，降低输入token成本和首token延迟。
 """
+from collections import deque
+from collections.abc import Reversible
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from string import Template
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Any, Final, Optional
 
 
-class ScheduledResearchPrompts:
-    """定时研究和趋势分析专用提示词"""
-    
-    @staticmethod
-    def generate_trend_research_query(topic: str, keywords: List[str], analysis_depth: str = "basic") -> str:
-        """
-        生成趋势研究查询提示词
-        
-        Args:
-            topic: 研究主题
-            keywords: 关键词列表  
-            analysis_depth: 分析深度（basic/detailed/deep）
-            
-        Returns:
-            优化的研究查询
-        """
-        
-        # 根据分析深度调整查询策略
-        depth_modifiers = {
-            "basic": "最新发展和主要趋势",
-            "detailed": "详细趋势分析、影响因素和市场变化",
-            "deep": "深度趋势研究、预测分析、行业影响和未来展望"
-        }
-        
-        modifier = depth_modifiers.get(analysis_depth, depth_modifiers["basic"])
-        keywords_str = "、".join(keywords)
-        
-        query = f"""
-研究主题: {topic}
-关键词: {keywords_str}
-研究重点: {modifier}
+def _recent_records(records: Optional[Iterable[Dict]], limit: int) -> List[Dict]:
+    """
+    取最近limit条历史记录，O(limit)而非整段切片拷贝
 
-请重点关注以下方面:
-1. 最新发展动态和变化趋势
-2. 关键事件和重要节点
-3. 市场反应和影响评估
-4. 专家观点和分析报告
-5. 数据指标和量化趋势
+    list/deque等可反向迭代的序列走reversed+islice，只触碰末尾limit条；
+    一次性迭代器退化为deque(maxlen=limit)，内存占用同样以limit条封顶。
+    调用方维护增长型历史时建议直接传deque(maxlen=K)。
+    """
+    if not records:
+        return []
+    if isinstance(records, Reversible):
+        return list(islice(reversed(records), limit))[::-1]
+    return list(deque(records, maxlen=limit))
 
-时间范围: 近期至当前（优先最新信息）
-信息来源: 权威媒体、官方发布、专业分析
-        """.strip()
-        
-        return query
-
-    @staticmethod 
-    def generate_trend_analysis_prompt(
-        topic: str,
-        current_data: str,
-        historical_data: Optional[List[Dict]] = None,
-        keywords: Optional[List[str]] = None
-    ) -> str:
-        """
-        生成趋势分析提示词
-        
-        Args:
-            topic: 研究主题
-            current_data: 当前研究数据
-            historical_data: 历史数据记录
-            keywords: 关键词列表
-            
-        Returns:
-            趋势分析提示词
-        """
-        
-        historical_context = ""
-        if historical_data:
-            historical_context = "\n### 历史数据参考:\n"
-            for i, record in enumerate(historical_data[-3:], 1):  # 最近3条记录
-                date = record.get('executed_at', '未知时间')
-                summary = record.get('summary', '无摘要')[:200]
-                historical_context += f"{i}. {date}: {summary}...\n"
-        
-        keywords_context = ""
-        if keywords:
-            keywords_context = f"\n### 关键监控词汇: {', '.join(keywords)}\n"
-        
-        prompt = f"""
-你是一位专业的趋势分析专家，请对以下主题进行深度趋势分析：
 
-### 研究主题: {topic}
-{keywords_context}
-### 当前研究数据:
-{current_data}
-{historical_context}
+# 趋势分析脚手架（静态前缀）
+_TREND_ANALYSIS_SCAFFOLD: Final[str] = """
+你是一位专业的趋势分析专家，请对给定主题进行深度趋势分析。
 
 请按照以下结构进行分析：
 
@@ -128,52 +70,12 @@ class ScheduledResearchPrompts:
 - 9-10: 极高活跃度，突破性变化
 
 请确保分析客观、准确，并重点突出与历史数据的差异和新发现。
-        """.strip()
-        
-        return prompt
+""".strip()
 
-    @staticmethod
-    def generate_summary_prompt(
-        topic: str,
-        research_data: str,
-        trend_analysis: str,
-        focus_on_changes: bool = True
-    ) -> str:
-        """
-        生成动态摘要提示词
-        
-        Args:
-            topic: 研究主题
-            research_data: 研究数据
-            trend_analysis: 趋势分析结果
-            focus_on_changes: 是否重点关注变化
-            
-        Returns:
-            摘要生成提示词
-        """
-        
-        focus_instruction = ""
-        if focus_on_changes:
-            focus_instruction = """
-特别要求：请重点突出以下内容
-- 最新发生的重要变化
-- 与之前状态的显著差异
-- 新出现的趋势和信号
-- 关键转折点和突破
-            """
-        
-        prompt = f"""
-你是一位专业的信息摘要专家，请为以下定时研究结果生成简洁而全面的摘要：
-
-### 研究主题: {topic}
 
-### 原始研究数据:
-{research_data}
-
-### 趋势分析结果:
-{trend_analysis}
-
-{focus_instruction}
+# 摘要生成脚手架（静态前缀）
+_SUMMARY_SCAFFOLD: Final[str] = """
+你是一位专业的信息摘要专家，请为给定的定时研究结果生成简洁而全面的摘要。
 
 请生成一个结构化的摘要，包含：
 
@@ -181,7 +83,7 @@ class ScheduledResearchPrompts:
 - 3-5个最重要的发现点
 - 用简洁明了的语言描述
 
-## 🔄 关键变化 
+## 🔄 关键变化
 - 列出最重要的变化事项（如有）
 - 每个变化用一句话描述
 
@@ -202,32 +104,28 @@ class ScheduledResearchPrompts:
 2. 语言简洁、重点突出
 3. 突出时效性和变化性
 4. 适合快速阅读和理解
-        """.strip()
-        
-        return prompt
+""".strip()
 
-    @staticmethod
-    def generate_keyword_extraction_prompt(text: str, existing_keywords: List[str]) -> str:
-        """
-        生成关键词提取提示词
-        
-        Args:
-            text: 源文本
-            existing_keywords: 现有关键词
-            
-        Returns:
-            关键词提取提示词
-        """
-        
-        existing_str = "、".join(existing_keywords) if existing_keywords else "无"
-        
-        prompt = f"""
-请从以下文本中提取最重要和最相关的关键词：
+# 摘要生成的变化关注附加指令（静态，按开关拼接在脚手架之后）
+_SUMMARY_FOCUS_INSTRUCTION: Final[str] = """
+特别要求：请重点突出以下内容
+- 最新发生的重要变化
+- 与之前状态的显著差异
+- 新出现的趋势和信号
+- 关键转折点和突破
+""".strip()
 
-### 现有关键词参考: {existing_str}
+# 摘要提示词只有带/不带变化关注指令两个静态前缀，导入时各拼好一份，
+# 按focus_on_changes布尔值索引，调用时不再做条件拼接
+_SUMMARY_PREFIX_BY_FOCUS: Final = (
+    f"{_SUMMARY_SCAFFOLD}\n\n",
+    f"{_SUMMARY_SCAFFOLD}\n\n{_SUMMARY_FOCUS_INSTRUCTION}\n\n",
+)
 
-### 待分析文本:
-{text}
+
+# 关键词提取脚手架（静态前缀）
+_KEYWORD_EXTRACTION_SCAFFOLD: Final[str] = """
+请从给定文本中提取最重要和最相关的关键词。
 
 请按照以下要求提取关键词：
 
@@ -251,38 +149,12 @@ class ScheduledResearchPrompts:
 5. 按重要性排序
 
 请确保提取的关键词准确反映文本的核心内容和趋势特征。
-        """.strip()
-        
-        return prompt
-
-    @staticmethod
-    def generate_anomaly_detection_prompt(
-        current_data: str,
-        historical_pattern: str,
-        threshold_score: float = 7.0
-    ) -> str:
-        """
-        生成异常检测提示词
-        
-        Args:
-            current_data: 当前数据
-            historical_pattern: 历史模式
-            threshold_score: 异常阈值
-            
-        Returns:
-            异常检测提示词
-        """
-        
-        prompt = f"""
-你是一位专业的数据异常检测分析师，请分析以下数据是否存在异常模式：
-
-### 当前数据:
-{current_data}
+""".strip()
 
-### 历史模式参考:
-{historical_pattern}
 
-### 异常检测阈值: {threshold_score}分（满分10分）
+# 异常检测脚手架（静态前缀）
+_ANOMALY_DETECTION_SCAFFOLD: Final[str] = """
+你是一位专业的数据异常检测分析师，请分析给定数据是否存在异常模式。
 
 请进行以下分析：
 
@@ -320,48 +192,12 @@ class ScheduledResearchPrompts:
 - 监控重点调整建议
 
 请基于客观分析给出专业判断，重点识别真正值得关注的异常模式。
-        """.strip()
-        
-        return prompt
+""".strip()
 
-    @staticmethod
-    def generate_prediction_prompt(
-        topic: str,
-        current_trends: str,
-        historical_data: List[Dict],
-        prediction_horizon: str = "1个月"
-    ) -> str:
-        """
-        生成趋势预测提示词
-        
-        Args:
-            topic: 研究主题
-            current_trends: 当前趋势
-            historical_data: 历史数据
-            prediction_horizon: 预测时间范围
-            
-        Returns:
-            趋势预测提示词
-        """
-        
-        historical_summary = ""
-        if historical_data:
-            historical_summary = "\n### 历史发展轨迹:\n"
-            for record in historical_data[-5:]:  # 最近5条记录
-                date = record.get('executed_at', '未知时间')
-                trend_score = record.get('trend_score', 0)
-                summary = record.get('summary', '无摘要')[:100]
-                historical_summary += f"- {date}: 趋势分数{trend_score}, {summary}...\n"
-        
-        prompt = f"""
-你是一位专业的趋势预测分析师，请基于以下信息对主题进行前瞻性分析：
-
-### 研究主题: {topic}
-### 预测时间范围: {prediction_horizon}
 
-### 当前趋势状况:
-{current_trends}
-{historical_summary}
+# 趋势预测脚手架（静态前缀）
+_PREDICTION_SCAFFOLD: Final[str] = """
+你是一位专业的趋势预测分析师，请基于给定信息对主题进行前瞻性分析。
 
 请进行以下预测分析：
 
@@ -402,47 +238,12 @@ class ScheduledResearchPrompts:
 - 1-4分: 低可信度，变数较多
 
 请基于数据和逻辑进行客观预测，避免过度主观判断。
-        """.strip()
-        
-        return prompt
-
-    @staticmethod
-    def generate_comparative_analysis_prompt(
-        topic: str,
-        current_data: str,
-        comparison_data: List[Dict],
-        comparison_timeframe: str = "同期历史数据"
-    ) -> str:
-        """
-        生成对比分析提示词
-        
-        Args:
-            topic: 研究主题
-            current_data: 当前数据
-            comparison_data: 对比数据
-            comparison_timeframe: 对比时间框架
-            
-        Returns:
-            对比分析提示词
-        """
-        
-        comparison_context = ""
-        if comparison_data:
-            comparison_context = f"\n### {comparison_timeframe}:\n"
-            for i, data in enumerate(comparison_data, 1):
-                date = data.get('executed_at', '未知时间')
-                summary = data.get('summary', '无摘要')[:150]
-                trend_score = data.get('trend_score', 0)
-                comparison_context += f"{i}. {date} (趋势分数: {trend_score})\n   {summary}...\n\n"
-        
-        prompt = f"""
-你是一位专业的对比分析专家，请对以下数据进行深度对比分析：
+""".strip()
 
-### 研究主题: {topic}
 
-### 当前数据:
-{current_data}
-{comparison_context}
+# 对比分析脚手架（静态前缀）
+_COMPARATIVE_ANALYSIS_SCAFFOLD: Final[str] = """
+你是一位专业的对比分析专家，请对给定数据进行深度对比分析。
 
 请进行以下对比分析：
 
@@ -489,6 +290,242 @@ class ScheduledResearchPrompts:
 - 对未来发展的启示
 
 请确保对比分析客观、全面，突出最有价值的发现和洞察。
-        """.strip()
-        
-        return prompt
+""".strip()
+
+
+# 查询模板原型：深度修饰词在导入时按深度特化，不在调用时替换
+_TREND_QUERY_TPL_STR: Final[str] = """研究主题: $topic
+关键词: $keywords
+研究重点: $modifier
+
+请重点关注以下方面:
+1. 最新发展动态和变化趋势
+2. 关键事件和重要节点
+3. 市场反应和影响评估
+4. 专家观点和分析报告
+5. 数据指标和量化趋势
+
+时间范围: 近期至当前（优先最新信息）
+信息来源: 权威媒体、官方发布、专业分析"""
+
+_DEPTH_MODIFIERS: Final = MappingProxyType({
+    "basic": "最新发展和主要趋势",
+    "detailed": "详细趋势分析、影响因素和市场变化",
+    "deep": "深度趋势研究、预测分析、行业影响和未来展望"
+})
+
+# 每个深度一个已烘焙修饰词的模板，调用时只剩topic/keywords两个占位替换
+_QUERY_TPL_BY_DEPTH: Final = MappingProxyType({
+    depth: Template(_TREND_QUERY_TPL_STR.replace("$modifier", modifier))
+    for depth, modifier in _DEPTH_MODIFIERS.items()
+})
+
+
+class ScheduledResearchPrompts:
+    """定时研究和趋势分析专用提示词"""
+
+    @staticmethod
+    def generate_trend_research_query(topic: str, keywords: List[str], analysis_depth: str = "basic") -> str:
+        """
+        生成趋势研究查询提示词
+
+        Args:
+            topic: 研究主题
+            keywords: 关键词列表
+            analysis_depth: 分析深度（basic/detailed/deep）
+
+        Returns:
+            优化的研究查询
+        """
+        tpl = _QUERY_TPL_BY_DEPTH.get(analysis_depth, _QUERY_TPL_BY_DEPTH["basic"])
+        return tpl.substitute(topic=topic, keywords="、".join(keywords))
+
+    @staticmethod
+    def generate_trend_analysis_prompt(
+        topic: str,
+        current_data: str,
+        historical_data: Optional[Iterable[Dict]] = None,
+        keywords: Optional[List[str]] = None
+    ) -> str:
+        """
+        生成趋势分析提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            topic: 研究主题
+            current_data: 当前研究数据
+            historical_data: 历史数据记录，任意可迭代对象；只消费最近3条，
+                增长型历史建议传deque(maxlen=K)以保持常数开销
+            keywords: 关键词列表
+
+        Returns:
+            趋势分析提示词
+        """
+
+        recent_records = _recent_records(historical_data, 3)
+        historical_context = ""
+        if recent_records:
+            historical_context = "\n### 历史数据参考:\n"
+            for i, record in enumerate(recent_records, 1):  # 最近3条记录
+                date = record.get('executed_at', '未知时间')
+                summary = record.get('summary', '无摘要')[:200]
+                historical_context += f"{i}. {date}: {summary}...\n"
+
+        keywords_context = ""
+        if keywords:
+            keywords_context = f"\n### 关键监控词汇: {', '.join(keywords)}\n"
+
+        return (
+            f"{_TREND_ANALYSIS_SCAFFOLD}\n\n"
+            f"### 研究主题: {topic}\n"
+            f"{keywords_context}"
+            f"### 当前研究数据:\n{current_data}\n"
+            f"{historical_context}"
+        )
+
+    @staticmethod
+    def generate_summary_prompt(
+        topic: str,
+        research_data: str,
+        trend_analysis: str,
+        focus_on_changes: bool = True
+    ) -> str:
+        """
+        生成动态摘要提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            topic: 研究主题
+            research_data: 研究数据
+            trend_analysis: 趋势分析结果
+            focus_on_changes: 是否重点关注变化
+
+        Returns:
+            摘要生成提示词
+        """
+
+        return (
+            f"{_SUMMARY_PREFIX_BY_FOCUS[focus_on_changes]}"
+            f"### 研究主题: {topic}\n\n"
+            f"### 原始研究数据:\n{research_data}\n\n"
+            f"### 趋势分析结果:\n{trend_analysis}"
+        )
+
+    @staticmethod
+    def generate_keyword_extraction_prompt(text: str, existing_keywords: List[str]) -> str:
+        """
+        生成关键词提取提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            text: 源文本
+            existing_keywords: 现有关键词
+
+        Returns:
+            关键词提取提示词
+        """
+
+        existing_str = "、".join(existing_keywords) if existing_keywords else "无"
+
+        return (
+            f"{_KEYWORD_EXTRACTION_SCAFFOLD}\n\n"
+            f"### 现有关键词参考: {existing_str}\n\n"
+            f"### 待分析文本:\n{text}"
+        )
+
+    @staticmethod
+    def generate_anomaly_detection_prompt(
+        current_data: str,
+        historical_pattern: str,
+        threshold_score: float = 7.0
+    ) -> str:
+        """
+        生成异常检测提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            current_data: 当前数据
+            historical_pattern: 历史模式
+            threshold_score: 异常阈值
+
+        Returns:
+            异常检测提示词
+        """
+
+        return (
+            f"{_ANOMALY_DETECTION_SCAFFOLD}\n\n"
+            f"### 异常检测阈值: {threshold_score}分（满分10分）\n\n"
+            f"### 当前数据:\n{current_data}\n\n"
+            f"### 历史模式参考:\n{historical_pattern}"
+        )
+
+    @staticmethod
+    def generate_prediction_prompt(
+        topic: str,
+        current_trends: str,
+        historical_data: Iterable[Dict],
+        prediction_horizon: str = "1个月"
+    ) -> str:
+        """
+        生成趋势预测提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            topic: 研究主题
+            current_trends: 当前趋势
+            historical_data: 历史数据，任意可迭代对象；只消费最近5条，
+                增长型历史建议传deque(maxlen=K)以保持常数开销
+            prediction_horizon: 预测时间范围
+
+        Returns:
+            趋势预测提示词
+        """
+
+        recent_records = _recent_records(historical_data, 5)
+        historical_summary = ""
+        if recent_records:
+            historical_summary = "\n### 历史发展轨迹:\n"
+            for record in recent_records:  # 最近5条记录
+                date = record.get('executed_at', '未知时间')
+                trend_score = record.get('trend_score', 0)
+                summary = record.get('summary', '无摘要')[:100]
+                historical_summary += f"- {date}: 趋势分数{trend_score}, {summary}...\n"
+
+        return (
+            f"{_PREDICTION_SCAFFOLD}\n\n"
+            f"### 研究主题: {topic}\n"
+            f"### 预测时间范围: {prediction_horizon}\n\n"
+            f"### 当前趋势状况:\n{current_trends}\n"
+            f"{historical_summary}"
+        )
+
+    @staticmethod
+    def generate_comparative_analysis_prompt(
+        topic: str,
+        current_data: str,
+        comparison_data: List[Dict],
+        comparison_timeframe: str = "同期历史数据"
+    ) -> str:
+        """
+        生成对比分析提示词（静态脚手架在前，动态数据在后）
+
+        Args:
+            topic: 研究主题
+            current_data: 当前数据
+            comparison_data: 对比数据
+            comparison_timeframe: 对比时间框架
+
+        Returns:
+            对比分析提示词
+        """
+
+        comparison_context = ""
+        if comparison_data:
+            comparison_context = f"\n### {comparison_timeframe}:\n"
+            for i, data in enumerate(comparison_data, 1):
+                date = data.get('executed_at', '未知时间')
+                summary = data.get('summary', '无摘要')[:150]
+                trend_score = data.get('trend_score', 0)
+                comparison_context += f"{i}. {date} (趋势分数: {trend_score})\n   {summary}...\n\n"
+
+        return (
+            f"{_COMPARATIVE_ANALYSIS_SCAFFOLD}\n\n"
+            f"### 研究主题: {topic}\n\n"
+            f"### 当前数据:\n{current_data}\n"
+            f"{comparison_context}"
+        )
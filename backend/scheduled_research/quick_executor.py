@@ -3,18 +3,50 @@
 Quick Task Executor - Optimized version for immediate execution
 """
 import asyncio
+import hashlib
+import json
 import logging
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+import orjson
+
 from gpt_researcher.agent import GPTResearcher
 from gpt_researcher.utils.enum import ReportType, ReportSource, Tone
 
-from .config import ScheduledResearchConfig, ScheduledResearchPrompts
+from .config import ScheduledResearchConfig, ScheduledResearchPrompts, get_env_config
 
 logger = logging.getLogger(__name__)
 
+# 同指纹任务短时间内重复触发时直接复用结果，不重跑研究管线。
+# TTL按分析深度分级：趋势研究忌陈旧结果，浅层研究数据时效性要求最高，
+# 深度研究本身跨度大、重跑成本也最高，允许更长的复用窗口
+_RESULT_CACHE_TTL = 900.0  # 未知深度的兜底（15分钟）
+_CACHE_TTL_BY_DEPTH = MappingProxyType({
+    "basic": 600.0,      # 10分钟
+    "detailed": 1800.0,  # 30分钟
+    "deep": 3600.0       # 1小时
+})
+
+# 摘要清理的Markdown标记删除表（单次C级遍历，替代链式replace）
+_STRIP_TBL = str.maketrans("", "", "#*")
+
+# 摘要快速路径的扫描窗口：只保留200字时无需清理整份报告
+_SUMMARY_WINDOW = 1024
+
+# 快速配置的不变部分在导入时冻结，每次调用只补query和report_source
+_QUICK_HEADERS = MappingProxyType({"User-Agent": "GPT-Researcher-Quick/1.0"})
+_QUICK_CFG_BASE = MappingProxyType({
+    "report_type": "research_report",  # 固定使用最快的报告类型
+    "tone": Tone.Objective,  # 固定使用客观语调
+    "max_subtopics": 1,  # 最小子主题数
+    "verbose": False,
+    "headers": _QUICK_HEADERS
+})
+
 
 class QuickResearchExecutor:
     """
@@ -25,64 +57,154 @@ class QuickResearchExecutor:
     3. 优先使用快速模型
     4. 减少不必要的中间步骤
     """
-    
+
+    # 长生命周期执行器不留__dict__，属性固定为槽位
+    __slots__ = (
+        "max_concurrent_tasks", "_sem", "_in_flight",
+        "_result_cache", "_researcher_pools", "_artifacts", "_inflight_results",
+    )
+
     def __init__(self):
         self.max_concurrent_tasks = 2  # 限制并发数
-        self.running_tasks = set()
-    
+        # 信号量把超限请求排队等待而非直接拒绝，事件循环内FIFO调度
+        self._sem = asyncio.Semaphore(self.max_concurrent_tasks)
+        self._in_flight = 0
+        # 精确命中缓存：指纹 -> (过期时刻, 结果)
+        self._result_cache: Dict[str, tuple] = {}
+        # 空闲researcher池：按report_source分桶，复用已初始化的LLM客户端和检索器
+        self._researcher_pools: Dict[str, asyncio.Queue] = {}
+        # 调度时预构建的工件：task_id -> 查询串，触发路径直接取用
+        self._artifacts: Dict[str, str] = {}
+        # single-flight去重：指纹 -> 进行中研究的Future，同指纹并发请求共享一次执行
+        self._inflight_results: Dict[str, asyncio.Future] = {}
+
+    def warm_task_artifacts(self, task):
+        """任务被调度/更新时预构建查询，把提示构建成本移出触发路径"""
+        try:
+            self._artifacts[task.id] = self._build_quick_query(task)
+        except Exception as e:
+            logger.debug("Task artifact warmup failed for %s: %s", task.id, e)
+
+    def invalidate_task_artifacts(self, task_id: str):
+        """任务删除时清理预构建工件"""
+        self._artifacts.pop(task_id, None)
+
+    @staticmethod
+    def _cache_key(task) -> str:
+        """任务研究指纹：主题+关键词+深度+来源归一化后哈希"""
+        fingerprint = [
+            task.topic.strip().lower(),
+            sorted(k.strip().lower() for k in (task.keywords or [])),
+            task.analysis_depth,
+            task.report_source,
+        ]
+        return hashlib.sha1(
+            json.dumps(fingerprint, ensure_ascii=False).encode()
+        ).hexdigest()
+
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存结果（副本，附cached标记）"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            self._result_cache.pop(key, None)
+            return None
+        return {**result, "cached": True, "execution_time": 0.0}
+
+    def _store_result(self, key: str, result: Dict[str, Any], analysis_depth: str):
+        """缓存成功结果（TTL按分析深度分级），顺带清理过期项防止无界增长"""
+        now = time.monotonic()
+        if len(self._result_cache) >= 100:
+            self._result_cache = {
+                k: v for k, v in self._result_cache.items() if v[0] > now
+            }
+        ttl = _CACHE_TTL_BY_DEPTH.get(analysis_depth, _RESULT_CACHE_TTL)
+        self._result_cache[key] = (now + ttl, result)
+
     async def execute_quick_research(self, task) -> Dict[str, Any]:
         """
         快速执行研究任务
-        
+
         Args:
             task: ScheduledTask对象
-            
+
         Returns:
             Dict包含执行结果
         """
         start_time = time.time()
         task_id = task.id
-        
-        # 检查并发限制
-        if len(self.running_tasks) >= self.max_concurrent_tasks:
-            return {
-                "success": False,
-                "error": "系统繁忙，请稍后再试",
-                "execution_time": 0
-            }
-        
-        self.running_tasks.add(task_id)
-        
+
+        cache_key = None
+        if get_env_config()["ENABLE_CACHING"]:
+            cache_key = self._cache_key(task)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"Quick research cache hit: {task.topic}")
+                return cached
+
+            # 同指纹研究已在执行中：不重跑管线，直接等它的结果（single-flight）
+            inflight = self._inflight_results.get(cache_key)
+            if inflight is not None:
+                logger.info(f"Quick research joined in-flight run: {task.topic}")
+                return await inflight
+
+        fut = None
+        if cache_key is not None:
+            fut = asyncio.get_running_loop().create_future()
+            self._inflight_results[cache_key] = fut
+
+        try:
+            async with self._sem:
+                self._in_flight += 1
+                try:
+                    result = await self._do_quick_research(task, task_id, start_time, cache_key)
+                finally:
+                    self._in_flight -= 1
+            if fut is not None:
+                fut.set_result(result)
+            return result
+        finally:
+            if cache_key is not None:
+                self._inflight_results.pop(cache_key, None)
+                # 首个调用方被取消等异常路径：让等待方同步感知，而非永久挂起
+                if fut is not None and not fut.done():
+                    fut.cancel()
+
+    async def _do_quick_research(self, task, task_id, start_time, cache_key=None) -> Dict[str, Any]:
+        """执行研究主体（已在并发信号量内）"""
         try:
             logger.info(f"Quick research started: {task.topic}")
             
-            # 构建优化的查询
-            query = self._build_quick_query(task)
-            
-            # 创建快速配置
-            researcher_config = self._create_quick_config(task, query)
-            
-            # 创建研究器实例
-            researcher = GPTResearcher(**researcher_config)
-            
-            # 应用快速优化
-            self._apply_quick_optimizations(researcher, task)
-            
+            # 优先取调度时预构建的查询，未预热时现场构建
+            query = self._artifacts.get(task_id) or self._build_quick_query(task)
+
+            # 取用研究器实例（优先复用池中已初始化的）
+            researcher = self._acquire_researcher(task, query)
+
             # 执行研究 - 使用更短的超时
             timeout = self._get_quick_timeout(task.analysis_depth)
-            
+
             try:
-                # 并发执行研究和报告生成准备
-                research_data = await asyncio.wait_for(
-                    researcher.conduct_research(),
-                    timeout=timeout
-                )
-                
+                # 研究期间并行预热报告LLM，研究结束后报告生成命中热连接/热缓存
+                warmup_task = asyncio.create_task(self._warmup_report_llm(researcher))
+                try:
+                    research_data = await asyncio.wait_for(
+                        researcher.conduct_research(),
+                        timeout=timeout
+                    )
+                finally:
+                    if not warmup_task.done():
+                        warmup_task.cancel()
+                    else:
+                        await warmup_task
+
                 report = await asyncio.wait_for(
                     researcher.write_report(),
                     timeout=30  # 报告生成最多30秒
                 )
-                
+
             except asyncio.TimeoutError:
                 logger.warning(f"Quick research timeout for task {task_id}")
                 # 快速模式下直接返回超时
@@ -97,7 +219,7 @@ class QuickResearchExecutor:
             execution_time = time.time() - start_time
             
             # 生成简化的摘要
-            summary = self._generate_quick_summary(task, report)
+            summary = await self._generate_quick_summary_async(task, report)
             
             result = {
                 "success": True,
@@ -108,7 +230,11 @@ class QuickResearchExecutor:
                 "query_used": query,
                 "mode": "quick"
             }
-            
+
+            if cache_key is not None:
+                self._store_result(cache_key, result, task.analysis_depth)
+
+            self._release_researcher(task, researcher)
             logger.info(f"Quick research completed in {execution_time:.1f}s: {task.topic}")
             return result
             
@@ -119,9 +245,63 @@ class QuickResearchExecutor:
                 "error": str(e),
                 "execution_time": time.time() - start_time
             }
-        finally:
-            self.running_tasks.discard(task_id)
-    
+
+    def _acquire_researcher(self, task, query):
+        """从池中取出空闲researcher复用，池空时才新建实例"""
+        pool = self._researcher_pools.get(task.report_source)
+        researcher = None
+        if pool is not None:
+            try:
+                researcher = pool.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+
+        if researcher is None:
+            researcher = GPTResearcher(**self._create_quick_config(task, query))
+        else:
+            self._reset_researcher(researcher, query)
+
+        self._apply_quick_optimizations(researcher, task)
+        return researcher
+
+    @staticmethod
+    def _reset_researcher(researcher, query):
+        """复用前清空上一轮研究的可变状态"""
+        researcher.query = query
+        researcher.visited_urls.clear()
+        researcher.context = []
+        researcher.research_sources = []
+        researcher.research_images = []
+        researcher.research_costs = 0.0
+
+    def _release_researcher(self, task, researcher):
+        """任务成功后归还researcher；池满时直接丢弃，异常路径不归还"""
+        pool = self._researcher_pools.setdefault(
+            task.report_source, asyncio.Queue(maxsize=self.max_concurrent_tasks)
+        )
+        try:
+            pool.put_nowait(researcher)
+        except asyncio.QueueFull:
+            pass
+
+    async def _warmup_report_llm(self, researcher):
+        """预热报告LLM - 研究阶段并行发起1-token请求
+
+        提前建立报告模型的客户端连接并触发提供商端提示缓存，
+        使write_report启动时无需冷启动；失败只记日志，不影响主流程
+        """
+        try:
+            from gpt_researcher.utils.llm import create_chat_completion
+            await create_chat_completion(
+                messages=[{"role": "user", "content": "ok"}],
+                model=researcher.cfg.smart_llm_model,
+                llm_provider=researcher.cfg.smart_llm_provider,
+                temperature=0,
+                max_tokens=1
+            )
+        except Exception as e:
+            logger.debug("Report LLM warmup skipped: %s", e)
+
     def _build_quick_query(self, task) -> str:
         """构建快速查询 - 简化版本"""
         base_query = task.topic
@@ -135,15 +315,7 @@ class QuickResearchExecutor:
     
     def _create_quick_config(self, task, query) -> Dict[str, Any]:
         """创建快速配置"""
-        return {
-            "query": query,
-            "report_type": "research_report",  # 固定使用最快的报告类型
-            "report_source": task.report_source,
-            "tone": Tone.Objective,  # 固定使用客观语调
-            "max_subtopics": 1,  # 最小子主题数
-            "verbose": False,
-            "headers": {"User-Agent": "GPT-Researcher-Quick/1.0"}
-        }
+        return {**_QUICK_CFG_BASE, "query": query, "report_source": task.report_source}
     
     def _apply_quick_optimizations(self, researcher, task):
         """应用快速优化"""
@@ -174,41 +346,84 @@ class QuickResearchExecutor:
         }
         return timeout_map.get(analysis_depth, 90)
     
+    @staticmethod
+    def _summary_prefix(report: str) -> Optional[str]:
+        """只清理报告前_SUMMARY_WINDOW个字符，够凑出200字摘要就不碰其余部分
+
+        窗口内清理并去掉左侧空白后，若右侧去空白仍超过200字，说明完整
+        清理结果必然超过200字且前200字完全落在窗口内，可直接截取；
+        否则返回None，由调用方退回全文清理路径（重度标记/空白的罕见情况）
+        """
+        head = report[:_SUMMARY_WINDOW].translate(_STRIP_TBL).lstrip()
+        if len(head.rstrip()) > 200:
+            return head[:200]
+        return None
+
+    async def _generate_quick_summary_async(self, task, report: str) -> str:
+        """生成快速摘要：优先走前缀窗口快速路径（只触碰~1KB，事件循环内
+        直接算完）；窗口不够用的长报告才把全文清理扫描放线程池"""
+        if report:
+            prefix = self._summary_prefix(report)
+            if prefix is not None:
+                return f"快速研究完成。{prefix}..."
+            if len(report) > 1024:
+                return await asyncio.to_thread(self._generate_quick_summary, task, report)
+        return self._generate_quick_summary(task, report)
+
     def _generate_quick_summary(self, task, report: str) -> str:
         """生成快速摘要"""
         # 简单的摘要生成 - 取报告前200字
         if not report:
             return "研究完成，但未能生成有效内容"
-        
-        # 清理报告内容
-        clean_report = report.replace('#', '').replace('*', '').strip()
-        
+
+        # 清理报告内容：translate单次C级遍历，替代两次replace的三趟扫描
+        clean_report = report.translate(_STRIP_TBL).strip()
+
         # 取前200个字符作为摘要
         if len(clean_report) > 200:
             summary = clean_report[:200] + "..."
         else:
             summary = clean_report
-        
+
         return f"快速研究完成。{summary}"
     
     async def get_system_status(self) -> Dict[str, Any]:
         """获取系统状态"""
         return {
-            "running_tasks": len(self.running_tasks),
+            "running_tasks": self._in_flight,
             "max_concurrent": self.max_concurrent_tasks,
-            "available_slots": self.max_concurrent_tasks - len(self.running_tasks),
+            "available_slots": self.max_concurrent_tasks - self._in_flight,
             "mode": "quick_executor"
         }
 
 
+@dataclass(slots=True)
+class _ProgressEvent:
+    """单条进度事件：槽位实例替代临时dict，每事件少一张属性哈希表；
+    orjson原生支持dataclass编码，线上字段与原dict完全一致"""
+    task_id: str
+    message: str
+    progress: int
+    error: bool
+    timestamp: str = ""  # 冲刷时统一盖章
+    type: str = "quick_research_progress"
+
+
 class StreamingQuickExecutor(QuickResearchExecutor):
     """
     流式快速执行器 - 支持实时进度推送
     """
-    
+
+    __slots__ = ("websocket_manager", "_pending_progress", "_flush_handle")
+
+    # 进度事件合并窗口：窗口内的事件攒成一个批量消息发送
+    _FLUSH_INTERVAL = 0.1
+
     def __init__(self, websocket_manager=None):
         super().__init__()
         self.websocket_manager = websocket_manager
+        self._pending_progress: list = []
+        self._flush_handle = None
     
     async def execute_streaming_research(self, task, websocket=None) -> Dict[str, Any]:
         """
@@ -216,34 +431,52 @@ class StreamingQuickExecutor(QuickResearchExecutor):
         """
         start_time = time.time()
         task_id = task.id
-        
+
         # 发送开始消息
         await self._send_progress(task_id, "开始快速研究...", 0, websocket)
-        
-        if len(self.running_tasks) >= self.max_concurrent_tasks:
-            await self._send_progress(task_id, "系统繁忙，请稍后再试", 0, websocket, error=True)
-            return {"success": False, "error": "系统繁忙"}
-        
-        self.running_tasks.add(task_id)
-        
+
+        cache_key = None
+        if get_env_config()["ENABLE_CACHING"]:
+            cache_key = self._cache_key(task)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                await self._send_progress(task_id, "命中近期研究结果，直接返回", 100, websocket)
+                return {**cached, "mode": "streaming_quick"}
+
+        # 超限时排队等待空位，不再直接返回"系统繁忙"
+        async with self._sem:
+            self._in_flight += 1
+            try:
+                return await self._do_streaming_research(task, task_id, start_time, websocket, cache_key)
+            finally:
+                self._in_flight -= 1
+
+    async def _do_streaming_research(self, task, task_id, start_time, websocket, cache_key=None) -> Dict[str, Any]:
+        """执行流式研究主体（已在并发信号量内）"""
         try:
             # 初始化阶段
             await self._send_progress(task_id, "准备研究环境...", 10, websocket)
             
-            query = self._build_quick_query(task)
-            researcher_config = self._create_quick_config(task, query)
-            researcher = GPTResearcher(**researcher_config)
-            self._apply_quick_optimizations(researcher, task)
-            
+            query = self._artifacts.get(task_id) or self._build_quick_query(task)
+            researcher = self._acquire_researcher(task, query)
+
             # 研究阶段
             await self._send_progress(task_id, "正在搜索相关信息...", 30, websocket)
             
             timeout = self._get_quick_timeout(task.analysis_depth)
-            research_data = await asyncio.wait_for(
-                researcher.conduct_research(),
-                timeout=timeout
-            )
-            
+            # 研究期间并行预热报告LLM（同execute_quick_research）
+            warmup_task = asyncio.create_task(self._warmup_report_llm(researcher))
+            try:
+                research_data = await asyncio.wait_for(
+                    researcher.conduct_research(),
+                    timeout=timeout
+                )
+            finally:
+                if not warmup_task.done():
+                    warmup_task.cancel()
+                else:
+                    await warmup_task
+
             # 生成报告阶段
             await self._send_progress(task_id, "正在生成研究报告...", 70, websocket)
             
@@ -258,13 +491,17 @@ class StreamingQuickExecutor(QuickResearchExecutor):
             result = {
                 "success": True,
                 "report": report,
-                "summary": self._generate_quick_summary(task, report),
+                "summary": await self._generate_quick_summary_async(task, report),
                 "sources_count": len(getattr(researcher, 'visited_urls', set())),
                 "execution_time": time.time() - start_time,
                 "query_used": query,
                 "mode": "streaming_quick"
             }
-            
+
+            if cache_key is not None:
+                self._store_result(cache_key, result, task.analysis_depth)
+
+            self._release_researcher(task, researcher)
             return result
             
         except asyncio.TimeoutError:
@@ -273,29 +510,60 @@ class StreamingQuickExecutor(QuickResearchExecutor):
         except Exception as e:
             await self._send_progress(task_id, f"研究失败: {str(e)}", 0, websocket, error=True)
             return {"success": False, "error": str(e)}
-        finally:
-            self.running_tasks.discard(task_id)
-    
-    async def _send_progress(self, task_id: str, message: str, progress: int, 
+
+    async def _send_progress(self, task_id: str, message: str, progress: int,
                            websocket=None, error: bool = False):
-        """发送进度消息"""
-        progress_data = {
-            "type": "quick_research_progress",
-            "task_id": task_id,
-            "message": message,
-            "progress": progress,
-            "timestamp": datetime.now().isoformat(),
-            "error": error
-        }
-        
-        if websocket:
+        """发送进度消息（短窗口内合并成批量消息，减少send往返和重复编码）"""
+        self._pending_progress.append(
+            (websocket, _ProgressEvent(task_id, message, progress, error))
+        )
+
+        if error or progress >= 100:
+            # 终态事件立即冲刷，完成/失败消息不滞后
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            await self._flush_progress()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                self._FLUSH_INTERVAL,
+                lambda: asyncio.ensure_future(self._flush_progress())
+            )
+
+    async def _flush_progress(self):
+        """冲刷积攒的进度事件：时间戳和编码只在真正发送时计算一次"""
+        self._flush_handle = None
+        pending = self._pending_progress
+        if not pending:
+            return
+        self._pending_progress = []
+
+        # 时间戳每次冲刷只算一次：100ms窗口内的事件共享同一毫秒级时刻
+        timestamp = datetime.now().isoformat()
+        # 未挂manager时不攒全量事件列表，只按socket分组
+        events = [] if self.websocket_manager else None
+        by_socket: Dict[int, tuple] = {}
+        for ws, event in pending:
+            event.timestamp = timestamp
+            if events is not None:
+                events.append(event)
+            if ws is not None:
+                by_socket.setdefault(id(ws), (ws, []))[1].append(event)
+
+        for ws, socket_events in by_socket.values():
             try:
-                await websocket.send_json(progress_data)
+                # orjson直接编码为bytes，跳过send_json的stdlib序列化
+                await ws.send_bytes(
+                    orjson.dumps({"type": "quick_research_progress_batch", "events": socket_events})
+                )
             except Exception as e:
                 logger.warning(f"Failed to send progress: {e}")
-        
+
         if self.websocket_manager:
             try:
-                await self.websocket_manager.broadcast_scheduled_result(progress_data)
+                await self.websocket_manager.broadcast_scheduled_result(
+                    {"type": "quick_research_progress_batch", "events": events}
+                )
             except Exception as e:
                 logger.warning(f"Failed to broadcast progress: {e}")
@@ -18,15 +18,20 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 
-from ..database import ScheduledTaskDAO, SessionLocal
+from sqlalchemy import select
+
+from ..database import ScheduledTaskDAO, AsyncSessionLocal
 from ..database.models import ScheduledTask
+from .scheduler_manager import _job_id
 
 logger = logging.getLogger(__name__)
 
 
 class SchedulerHealthChecker:
     """调度器健康检查和修复工具"""
-    
+
+    __slots__ = ("scheduler_manager",)
+
     def __init__(self, scheduler_manager):
         self.scheduler_manager = scheduler_manager
     
@@ -41,13 +46,19 @@ class SchedulerHealthChecker:
         
         try:
             # 获取所有任务（包括暂停的）
-            with SessionLocal() as db:
-                all_tasks = db.query(ScheduledTask).all()
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(select(ScheduledTask))
+                all_tasks = result.scalars().all()
                 results["checked_tasks"] = len(all_tasks)
-            
+
+            # 一次get_jobs()建好job索引，循环内不再逐个查jobstore
+            jobs_by_id = {
+                job.id: job for job in self.scheduler_manager.scheduler.get_jobs()
+            }
+
             for task in all_tasks:
                 try:
-                    await self._fix_single_task(task, results)
+                    await self._fix_single_task(task, jobs_by_id, results)
                 except Exception as e:
                     results["failed_tasks"] += 1
                     results["details"].append({
@@ -65,11 +76,11 @@ class SchedulerHealthChecker:
             logger.error(f"Health check failed: {e}")
             raise
     
-    async def _fix_single_task(self, task: ScheduledTask, results: Dict):
-        """修复单个任务"""
-        job_id = f"research_task_{task.id}"
-        job = self.scheduler_manager.scheduler.get_job(job_id)
-        
+    async def _fix_single_task(self, task: ScheduledTask, jobs_by_id: Dict, results: Dict):
+        """修复单个任务（job由调用方批量预取）"""
+        job_id = _job_id(task.id)
+        job = jobs_by_id.get(job_id)
+
         # 检查任务状态
         if task.is_active and not job:
             # 任务应该是活跃的，但调度器中没有job - 需要重新调度
@@ -109,7 +120,9 @@ class SchedulerHealthChecker:
 
 class ImprovedSchedulerManager:
     """改进的调度器管理器，修复暂停/恢复问题"""
-    
+
+    __slots__ = ("original", "health_checker")
+
     def __init__(self, original_manager):
         self.original = original_manager
         self.health_checker = SchedulerHealthChecker(original_manager)
@@ -118,7 +131,7 @@ class ImprovedSchedulerManager:
         """增强的暂停任务功能"""
         try:
             # 1. 先移除调度器中的job（而不是暂停）
-            job_id = f"research_task_{task_id}"
+            job_id = _job_id(task_id)
             job = self.original.scheduler.get_job(job_id)
             
             if job:
@@ -126,7 +139,7 @@ class ImprovedSchedulerManager:
                 logger.info(f"Removed job for task: {task_id}")
             
             # 2. 更新数据库状态为暂停
-            ScheduledTaskDAO.update_task(task_id, {
+            await ScheduledTaskDAO.update_task(task_id, {
                 "is_active": False,
                 "updated_at": datetime.now()
             })
@@ -142,64 +155,100 @@ class ImprovedSchedulerManager:
     async def enhanced_resume_task(self, task_id: str) -> bool:
         """增强的恢复任务功能"""
         try:
-            # 1. 获取任务信息
-            task = ScheduledTaskDAO.get_task_by_id(task_id)
-            if not task:
-                logger.error(f"Task not found: {task_id}")
-                return False
-            
-            # 2. 更新数据库状态为活跃
-            ScheduledTaskDAO.update_task(task_id, {
+            # 1. 更新数据库状态为活跃（update_task返回更新后的任务，任务不存在返回None，
+            #    兼作存在性检查，无需前后各一次get_task_by_id）
+            updated_task = await ScheduledTaskDAO.update_task(task_id, {
                 "is_active": True,
                 "updated_at": datetime.now()
             })
-            
-            # 3. 重新获取更新后的任务
-            updated_task = ScheduledTaskDAO.get_task_by_id(task_id)
-            
-            # 4. 重新调度任务
+            if not updated_task:
+                logger.error(f"Task not found: {task_id}")
+                return False
+
+            # 2. 重新调度任务
             await self.original._schedule_task(updated_task)
-            
-            # 5. 记录恢复操作
+
+            # 3. 记录恢复操作
             logger.info(f"Enhanced resume completed for task: {task_id}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Enhanced resume failed for task {task_id}: {e}")
             return False
     
+    async def fast_startup_resync(self) -> Dict[str, Any]:
+        """启动专用的快速重同步
+
+        内存jobstore重启后必然为空（见模块docstring），因此启动时无需像
+        check_and_fix_paused_tasks那样逐任务回查调度器：所有活跃任务一律
+        需要重新调度，一次DAO查询后并发schedule即可。
+        check_and_fix_paused_tasks保留用于运行期的状态漂移检测。
+        """
+        active_tasks = await ScheduledTaskDAO.get_all_active_tasks()
+
+        outcomes = await asyncio.gather(
+            *(self.original._schedule_task(task) for task in active_tasks),
+            return_exceptions=True
+        )
+
+        failed = 0
+        for task, outcome in zip(active_tasks, outcomes):
+            if isinstance(outcome, Exception):
+                failed += 1
+                logger.error(f"Failed to schedule task {task.id} on startup: {outcome}")
+
+        result = {
+            "total_active_tasks": len(active_tasks),
+            "successfully_scheduled": len(active_tasks) - failed,
+            "failed_count": failed,
+            "timestamp": datetime.now().isoformat()
+        }
+        logger.info(f"Fast startup resync completed: {result}")
+        return result
+
     async def force_resync_all_tasks(self) -> Dict[str, Any]:
-        """强制重新同步所有任务"""
+        """强制重新同步所有任务（批量摘除job后有界并发重调度）"""
         try:
             logger.info("Starting force resync of all tasks...")
-            
-            # 1. 清除所有调度器中的job
-            for job in self.original.scheduler.get_jobs():
-                if job.id.startswith("research_task_"):
-                    self.original.scheduler.remove_job(job.id)
-            
+
+            # 1. 一次取出研究job列表后批量移除
+            stale_jobs = [
+                job for job in self.original.scheduler.get_jobs()
+                if job.id.startswith("research_task_")
+            ]
+            for job in stale_jobs:
+                self.original.scheduler.remove_job(job.id)
+
             # 2. 重新加载所有活跃任务
-            active_tasks = ScheduledTaskDAO.get_all_active_tasks()
-            
-            # 3. 重新调度所有活跃任务
-            scheduled_count = 0
-            for task in active_tasks:
-                try:
-                    await self.original._schedule_task(task)
-                    scheduled_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to reschedule task {task.id}: {e}")
-            
+            active_tasks = await ScheduledTaskDAO.get_all_active_tasks()
+
+            # 3. 有界并发重调度，串行逐个await改为gather
+            sem = asyncio.Semaphore(8)
+
+            async def reschedule_one(task) -> bool:
+                async with sem:
+                    try:
+                        await self.original._schedule_task(task)
+                        return True
+                    except Exception as e:
+                        logger.error(f"Failed to reschedule task {task.id}: {e}")
+                        return False
+
+            outcomes = await asyncio.gather(
+                *(reschedule_one(task) for task in active_tasks)
+            )
+            scheduled_count = sum(outcomes)
+
             result = {
                 "total_active_tasks": len(active_tasks),
                 "successfully_scheduled": scheduled_count,
                 "failed_count": len(active_tasks) - scheduled_count,
                 "timestamp": datetime.now().isoformat()
             }
-            
+
             logger.info(f"Force resync completed: {result}")
             return result
-            
+
         except Exception as e:
             logger.error(f"Force resync failed: {e}")
             raise
@@ -221,11 +270,12 @@ def patch_scheduler_manager(scheduler_manager):
     scheduler_manager.force_resync_all_tasks = enhanced_manager.force_resync_all_tasks
     scheduler_manager.health_checker = enhanced_manager.health_checker
     
-    # 添加自动修复功能
+    # 添加自动修复功能（启动时jobstore必然为空，走快速重同步；
+    # 运行期漂移仍由health_checker.check_and_fix_paused_tasks负责）
     async def auto_fix_on_startup():
         """启动时自动修复任务状态"""
         try:
-            await enhanced_manager.health_checker.check_and_fix_paused_tasks()
+            await enhanced_manager.fast_startup_resync()
             logger.info("Startup auto-fix completed")
         except Exception as e:
             logger.error(f"Startup auto-fix failed: {e}")
@@ -254,44 +304,48 @@ async def diagnose_scheduler_issues(scheduler_manager) -> Dict[str, Any]:
         diagnosis["total_jobs"] = len(jobs)
         
         # 检查数据库任务
-        all_tasks = ScheduledTaskDAO.get_tasks_by_user("default_user")
+        all_tasks = await ScheduledTaskDAO.get_tasks_by_user("default_user")
         active_tasks = [t for t in all_tasks if t.is_active]
         inactive_tasks = [t for t in all_tasks if not t.is_active]
-        
+
         diagnosis["active_tasks_in_db"] = len(active_tasks)
         diagnosis["inactive_tasks_in_db"] = len(inactive_tasks)
-        
-        # 检查不一致性
-        for task in active_tasks:
-            job_id = f"research_task_{task.id}"
-            job = scheduler_manager.scheduler.get_job(job_id)
-            
-            if not job:
-                diagnosis["issues"].append({
-                    "type": "missing_job",
-                    "task_id": task.id,
-                    "topic": task.topic,
-                    "description": "Active task missing from scheduler"
-                })
-        
-        for job in jobs:
-            if job.id.startswith("research_task_"):
-                task_id = job.id.replace("research_task_", "")
-                task = ScheduledTaskDAO.get_task_by_id(task_id)
-                
-                if not task:
-                    diagnosis["issues"].append({
-                        "type": "orphan_job",
-                        "job_id": job.id,
-                        "description": "Scheduler job without corresponding database task"
-                    })
-                elif not task.is_active:
-                    diagnosis["issues"].append({
-                        "type": "inactive_job",
-                        "task_id": task.id,
-                        "topic": task.topic,
-                        "description": "Inactive task still has scheduler job"
-                    })
+
+        # 一次性构建两侧ID集合后做集合差运算，不再逐job回查数据库
+        tasks_by_id = {t.id: t for t in all_tasks}
+        job_task_ids = {
+            job.id[len("research_task_"):]
+            for job in jobs if job.id.startswith("research_task_")
+        }
+        active_ids = {t.id for t in active_tasks}
+
+        # 活跃任务缺少job
+        for task_id in active_ids - job_task_ids:
+            task = tasks_by_id[task_id]
+            diagnosis["issues"].append({
+                "type": "missing_job",
+                "task_id": task.id,
+                "topic": task.topic,
+                "description": "Active task missing from scheduler"
+            })
+
+        # job没有对应任务
+        for task_id in job_task_ids - tasks_by_id.keys():
+            diagnosis["issues"].append({
+                "type": "orphan_job",
+                "job_id": _job_id(task_id),
+                "description": "Scheduler job without corresponding database task"
+            })
+
+        # 暂停任务仍挂着job
+        for task_id in (job_task_ids & tasks_by_id.keys()) - active_ids:
+            task = tasks_by_id[task_id]
+            diagnosis["issues"].append({
+                "type": "inactive_job",
+                "task_id": task.id,
+                "topic": task.topic,
+                "description": "Inactive task still has scheduler job"
+            })
         
         # 生成建议
         if diagnosis["issues"]:
@@ -4,25 +4,57 @@ Scheduler Manager - Manages and schedules research tasks
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Callable
+import os
+import sys
 import threading
-import json
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Dict, Callable
+
+import orjson
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 
-from ..database import ScheduledTaskDAO, ResearchHistoryDAO, TaskExecutionLogDAO
+from ..database import (
+    ScheduledTaskDAO, ResearchHistoryDAO, TaskExecutionLogDAO, session_scope,
+    ExecutionLogCreate, HistoryCreate
+)
 from .task_executor import ResearchTaskExecutor
 from .quick_executor import QuickResearchExecutor, StreamingQuickExecutor
 
 logger = logging.getLogger(__name__)
 
+# 每tick都要走的DAO方法在导入时绑定为模块名：
+# 调用点少付一次"类属性+方法属性"的两级LOAD_ATTR
+_get_task_by_id = ScheduledTaskDAO.get_task_by_id
+_create_log = TaskExecutionLogDAO.create_log
+_append_log_message = TaskExecutionLogDAO.append_log_message
+_finalize_execution = ScheduledTaskDAO.finalize_execution
+
+# 结果广播的合并参数：一个批次最多攒多少条、最长等多久
+_BROADCAST_MAX_BATCH = 50
+_BROADCAST_FLUSH_SECONDS = 0.1
+
+# 同时执行的研究任务上限：每个研究任务都吃大量网络I/O和LLM调用，
+# 多个任务同tick到期时不限流会把下游API和本机内存一起打爆
+_MAX_RESEARCH_CONCURRENCY = int(os.getenv("MAX_RESEARCH_CONCURRENCY", "4"))
+
+
+def _job_id(task_id: str) -> str:
+    """定时研究job的调度器ID
+
+    intern后同一任务的各调用点拿到同一字符串对象，jobstore字典里的
+    比较/哈希退化为指针比较；也省去各处重复拼前缀
+    """
+    return sys.intern("research_task_" + task_id)
+
 
 class ScheduledResearchManager:
     """
@@ -42,14 +74,35 @@ class ScheduledResearchManager:
         self.task_executor = ResearchTaskExecutor(websocket_manager=websocket_manager)
         self.quick_executor = QuickResearchExecutor()
         self.streaming_executor = StreamingQuickExecutor(websocket_manager=websocket_manager)
-        self.running_tasks = {}  # 正在运行的任务记录
+        # 每任务一把锁：locked()即"正在运行"，取代非原子的dict查/写/finally弹出
+        self._task_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # 结果广播队列：完成消息先入队，由flusher协程合并成批量帧发送
+        # （有界队列提供背压，极端堆积时put等待而非无界吃内存）
+        self._broadcast_q: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._broadcast_flusher_task = None
+        # 快速触发等fire-and-forget任务的强引用集合：裸create_task的返回值
+        # 不保存会被事件循环GC掉，任务可能中途消失且异常无人回收
+        self._fire_and_forget: set = set()
+        # 全局执行并发闸：重入守卫只防同一任务，不防N个不同任务同时到期
+        self._research_sem = asyncio.Semaphore(_MAX_RESEARCH_CONCURRENCY)
+        # 初始化完成后依次执行的钩子（如startup_fix的自动修复），
+        # 替代对initialize方法本身的包装替换
+        self.post_init_hooks: List[Callable] = []
+        # 逐job连续失败计数，错误监听器据此指数退避下一次执行
+        self._consecutive_failures: Dict[str, int] = defaultdict(int)
         self._is_initialized = False
         
         # 配置调度器
         self._setup_scheduler()
     
     def _setup_scheduler(self):
-        """配置APScheduler调度器"""
+        """配置APScheduler调度器
+
+        jobstore保持内存实现：调度状态的持久源是scheduled_tasks表，
+        启动时由_load_existing_tasks重建；再挂SQLAlchemyJobStore会出现
+        两份真相（scheduler_fix的修复逻辑也以数据库为准），且本类的
+        绑定方法job无法按模块路径序列化。
+        """
         jobstores = {
             'default': MemoryJobStore()
         }
@@ -61,7 +114,7 @@ class ScheduledResearchManager:
         job_defaults = {
             'coalesce': True,  # 合并多个相同的任务
             'max_instances': 1,  # 每个任务最多只能有一个实例运行
-            'misfire_grace_time': 300  # 任务错过执行时间的容忍度（秒）
+            'misfire_grace_time': 300  # 兜底容忍度；定时研究job按间隔另算（见_misfire_grace）
         }
         
         self.scheduler = AsyncIOScheduler(
@@ -84,51 +137,99 @@ class ScheduledResearchManager:
         try:
             logger.info("Initializing scheduled research manager...")
             
+            # 先加载任务后启动调度器：未启动时add_job只是往pending列表
+            # 追加（不取jobstore锁、不逐个唤醒调度循环），start()再把全部
+            # 任务一次性批量入库——等效于bulk add
+            await self._load_existing_tasks()
+
             # 启动调度器
             if not self.scheduler.running:
                 self.scheduler.start()
                 logger.info("APScheduler started successfully")
-            
-            # 加载数据库中的活跃任务
-            await self._load_existing_tasks()
-            
+
+            # 启动结果广播flusher
+            if self.websocket_manager and self._broadcast_flusher_task is None:
+                self._broadcast_flusher_task = asyncio.create_task(self._broadcast_flusher())
+
             self._is_initialized = True
             logger.info("Scheduled research manager initialized successfully")
-            
+
+            # 执行注册的初始化后钩子
+            for hook in self.post_init_hooks:
+                await hook(self)
+
         except Exception as e:
             logger.error(f"Failed to initialize scheduled research manager: {e}")
             raise
     
-    async def _load_existing_tasks(self):
-        """从数据库加载现有的活跃任务"""
+    async def _load_existing_tasks(self, batch_size: int = 500):
+        """从数据库流式加载现有的活跃任务
+
+        服务端游标分批取出（内存占用与表大小无关），每攒满一批并发注册，
+        不再整表读入后逐个await
+        """
         try:
-            active_tasks = ScheduledTaskDAO.get_all_active_tasks()
-            logger.info(f"Loading {len(active_tasks)} active tasks from database")
-            
-            for task in active_tasks:
-                await self._schedule_task(task)
-                
-            logger.info(f"Successfully loaded {len(active_tasks)} scheduled tasks")
-            
+            loaded = 0
+            failed = 0
+            batch: List = []
+
+            async def _schedule_one(task):
+                nonlocal loaded, failed
+                try:
+                    await self._schedule_task(task)
+                    loaded += 1
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Failed to schedule task {task.id} during load: {e}")
+
+            async def _flush(tasks):
+                # TaskGroup保证批内任务不外漏；单任务失败在_schedule_one
+                # 内消化计数，不取消同批其余任务
+                async with asyncio.TaskGroup() as tg:
+                    for t in tasks:
+                        tg.create_task(_schedule_one(t))
+
+            async for task in ScheduledTaskDAO.stream_active_tasks(batch_size=batch_size):
+                batch.append(task)
+                if len(batch) >= batch_size:
+                    await _flush(batch)
+                    batch = []
+            if batch:
+                await _flush(batch)
+
+            logger.info(f"Successfully loaded {loaded} scheduled tasks ({failed} failed)")
+
         except Exception as e:
             logger.error(f"Failed to load existing tasks: {e}")
             raise
     
+    @staticmethod
+    def _misfire_grace(interval_hours: int) -> int:
+        """按任务间隔计算misfire容忍度：间隔的5%，下限5分钟、上限1小时
+
+        24小时任务晚几十分钟执行无伤大雅，不应按统一的300秒被判missed；
+        短间隔任务仍保持较紧的容忍度，避免错过的执行堆积补跑
+        """
+        return max(300, min(3600, int(interval_hours * 3600 * 0.05)))
+
     async def _schedule_task(self, task):
         """调度单个任务"""
         try:
-            job_id = f"research_task_{task.id}"
-            
-            # 如果任务已存在，先移除
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
-            # 创建间隔触发器
+            job_id = _job_id(task.id)
+
+            # 创建间隔触发器（同名job由add_job的replace_existing原子替换，
+            # 无需先get_job+remove_job各拿一次jobstore锁）
+            # next_run为空（新建任务）时首跑定在一个完整间隔之后：
+            # start_date=now会让APScheduler立刻走一遍到期判定/misfire修正，
+            # 批量加载时每个任务都白付一次
+            start_date = task.next_run or (
+                datetime.now() + timedelta(hours=task.interval_hours)
+            )
             trigger = IntervalTrigger(
                 hours=task.interval_hours,
-                start_date=task.next_run or datetime.now()
+                start_date=start_date
             )
-            
+
             # 添加任务到调度器
             self.scheduler.add_job(
                 func=self._execute_research_task,
@@ -136,65 +237,75 @@ class ScheduledResearchManager:
                 id=job_id,
                 args=[task.id],
                 name=f"Research: {task.topic}",
-                replace_existing=True
+                replace_existing=True,
+                misfire_grace_time=self._misfire_grace(task.interval_hours)
             )
             
+            # 预构建执行工件，触发时不再临场拼查询
+            self.quick_executor.warm_task_artifacts(task)
+            self.streaming_executor.warm_task_artifacts(task)
+
             logger.info(f"Scheduled task {task.id}: {task.topic} (every {task.interval_hours}h)")
-            
+
         except Exception as e:
             logger.error(f"Failed to schedule task {task.id}: {e}")
             raise
     
     async def _execute_research_task(self, task_id: str):
         """执行研究任务"""
+        # 同任务重入守卫：锁已被持有说明上一次执行尚未结束，直接跳过。
+        # 检查放在DB读之前，跳过路径不付任何I/O
+        lock = self._task_locks[task_id]
+        if lock.locked():
+            logger.warning(f"Task {task_id} is already running, skipping this execution")
+            return
+
+        async with lock:
+            # 全局并发闸在任务锁之内：同一任务的跳过判断不受排队影响
+            async with self._research_sem:
+                # 整次执行共用一个会话：下游DAO经session_scope复用contextvar里
+                # 的会话，不再每次调用都开/关一个（提交后连接即归还池）
+                async with session_scope():
+                    await self._run_research_task(task_id)
+
+    async def _run_research_task(self, task_id: str):
+        """研究任务执行主体（已持有该任务的执行锁）"""
         execution_log_id = None
-        
+
         try:
             # 获取任务详情
-            task = ScheduledTaskDAO.get_task_by_id(task_id)
+            task = await _get_task_by_id(task_id)
             if not task or not task.is_active:
                 logger.warning(f"Task {task_id} not found or inactive, skipping execution")
                 return
-            
-            # 检查是否已在运行
-            if task_id in self.running_tasks:
-                logger.warning(f"Task {task_id} is already running, skipping this execution")
-                return
-            
-            # 记录任务开始执行
-            self.running_tasks[task_id] = datetime.now()
-            
+
             # 创建执行日志
-            log_data = {
-                "task_id": task_id,
-                "status": "running",
-                "execution_step": "initializing",
-                "progress_percentage": 0.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": "Task execution started"}]
-            }
-            execution_log = TaskExecutionLogDAO.create_log(log_data)
+            log_data = ExecutionLogCreate(
+                task_id=task_id,
+                status="running",
+                execution_step="initializing",
+                progress_percentage=0.0
+            )
+            execution_log = await _create_log(log_data)
             execution_log_id = execution_log.id
+            await _append_log_message(execution_log_id, "Task execution started")
             
             logger.info(f"Starting execution of task {task_id}: {task.topic}")
             
             # 执行研究任务
             result = await self.task_executor.execute_task(task, execution_log_id)
-            
-            # 更新任务执行状态
-            ScheduledTaskDAO.update_task_execution_status(
+
+            # 任务统计与执行日志在同一事务收尾，一次commit替代两次往返
+            await _finalize_execution(
                 task_id=task_id,
                 success=result.get("success", False),
-                execution_time=result.get("execution_time")
-            )
-            
-            # 更新执行日志
-            if execution_log_id:
-                TaskExecutionLogDAO.update_log(execution_log_id, {
+                log_id=execution_log_id,
+                log_update={
                     "status": "completed" if result.get("success") else "failed",
                     "completed_at": datetime.now(),
-                    "progress_percentage": 100.0,
-                    "log_messages": result.get("log_messages", [])
-                })
+                    "progress_percentage": 100.0
+                }
+            )
             
             # 推送结果到前端（如果有WebSocket连接）
             if self.websocket_manager and result.get("success"):
@@ -204,20 +315,22 @@ class ScheduledResearchManager:
             
         except Exception as e:
             logger.error(f"Error executing task {task_id}: {e}")
-            
-            # 更新失败状态
-            ScheduledTaskDAO.update_task_execution_status(task_id=task_id, success=False)
-            
+
+            # 失败状态与日志同样单事务收尾；同一时刻只取一次now
+            now = datetime.now()
             if execution_log_id:
-                TaskExecutionLogDAO.update_log(execution_log_id, {
+                await _append_log_message(
+                    execution_log_id, f"Error: {str(e)}", timestamp=now
+                )
+            await _finalize_execution(
+                task_id=task_id,
+                success=False,
+                log_id=execution_log_id,
+                log_update={
                     "status": "failed",
-                    "completed_at": datetime.now(),
-                    "log_messages": [{"timestamp": datetime.now().isoformat(), "message": f"Error: {str(e)}"}]
-                })
-            
-        finally:
-            # 移除运行记录
-            self.running_tasks.pop(task_id, None)
+                    "completed_at": now
+                }
+            )
     
     async def _push_result_to_frontend(self, task, result):
         """推送结果到前端"""
@@ -233,20 +346,71 @@ class ScheduledResearchManager:
                 "sources_count": result.get("sources_count", 0)
             }
             
-            # 这里需要实现WebSocket推送逻辑
-            # 暂时记录日志
-            logger.info(f"Would push result to frontend: {json.dumps(message, ensure_ascii=False)}")
-            
+            # orjson的C编码器直接产出UTF-8（等价ensure_ascii=False），中文载荷下比stdlib快数倍
+            logger.info(f"Would push result to frontend: {orjson.dumps(message).decode()}")
+
+            # 入队交给flusher合并发送，而非每个结果一帧
+            await self._broadcast_q.put(message)
+
         except Exception as e:
             logger.error(f"Failed to push result to frontend: {e}")
+
+    async def _broadcast_flusher(self):
+        """广播冲刷协程：攒批后一次编码、一次群发
+
+        misfire补跑等场景下大量任务近乎同时完成，逐条broadcast是N次
+        JSON编码和N轮连接遍历；这里最多等_BROADCAST_FLUSH_SECONDS或攒满
+        _BROADCAST_MAX_BATCH条，合并为一个scheduled_result_batch帧
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await self._broadcast_q.get()
+            batch = [message]
+            deadline = loop.time() + _BROADCAST_FLUSH_SECONDS
+            while len(batch) < _BROADCAST_MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._broadcast_q.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.websocket_manager.broadcast_scheduled_result_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to broadcast result batch: {e}")
     
     def _job_executed_listener(self, event):
         """任务执行完成监听器"""
+        # 成功即清零退避计数，下次失败从最小退避重新开始
+        self._consecutive_failures.pop(event.job_id, None)
         logger.debug(f"Job {event.job_id} executed successfully")
-    
+
     def _job_error_listener(self, event):
-        """任务执行错误监听器"""
-        logger.error(f"Job {event.job_id} crashed: {event.exception}")
+        """任务执行错误监听器：连续失败按2^n分钟指数退避（上限64分钟）
+
+        上游LLM/检索服务抖动时，按原间隔硬重试只会继续打挂掉的API；
+        退避只推迟下一次运行时间，IntervalTrigger本身不变，恢复成功后
+        回到正常节奏
+        """
+        failures = self._consecutive_failures[event.job_id] + 1
+        self._consecutive_failures[event.job_id] = failures
+
+        backoff = timedelta(minutes=2 ** min(failures, 6))
+        try:
+            self.scheduler.modify_job(
+                event.job_id, next_run_time=datetime.now() + backoff
+            )
+            logger.error(
+                f"Job {event.job_id} crashed ({failures} consecutive), "
+                f"backing off {backoff}: {event.exception}"
+            )
+        except JobLookupError:
+            # 一次性job（手动触发）执行后已不在jobstore里，无可退避
+            logger.error(f"Job {event.job_id} crashed: {event.exception}")
     
     def _job_missed_listener(self, event):
         """任务错过执行监听器"""
@@ -258,7 +422,7 @@ class ScheduledResearchManager:
         """添加新的定时任务"""
         try:
             # 创建任务记录
-            task = ScheduledTaskDAO.create_task(task_data)
+            task = await ScheduledTaskDAO.create_task(task_data)
             
             # 调度任务
             await self._schedule_task(task)
@@ -274,7 +438,7 @@ class ScheduledResearchManager:
         """更新定时任务"""
         try:
             # 更新数据库记录
-            updated_task = ScheduledTaskDAO.update_task(task_id, update_data)
+            updated_task = await ScheduledTaskDAO.update_task(task_id, update_data)
             if not updated_task:
                 return False
             
@@ -282,10 +446,14 @@ class ScheduledResearchManager:
             if updated_task.is_active:
                 await self._schedule_task(updated_task)
             else:
-                # 如果任务被禁用，移除调度
-                job_id = f"research_task_{task_id}"
-                if self.scheduler.get_job(job_id):
-                    self.scheduler.remove_job(job_id)
+                # 如果任务被禁用，移除调度并丢弃预构建工件（避免改动后复用旧查询）
+                # remove_job直接调用，job不存在时捕获异常，省一次get_job查询
+                try:
+                    self.scheduler.remove_job(_job_id(task_id))
+                except JobLookupError:
+                    pass
+                self.quick_executor.invalidate_task_artifacts(task_id)
+                self.streaming_executor.invalidate_task_artifacts(task_id)
             
             logger.info(f"Updated scheduled task: {task_id}")
             return True
@@ -297,15 +465,18 @@ class ScheduledResearchManager:
     async def remove_task(self, task_id: str) -> bool:
         """移除定时任务"""
         try:
-            # 从调度器移除
-            job_id = f"research_task_{task_id}"
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
+            # 从调度器移除（job不存在时直接忽略，不额外get_job）
+            try:
+                self.scheduler.remove_job(_job_id(task_id))
+            except JobLookupError:
+                pass
+
             # 从数据库删除
-            success = ScheduledTaskDAO.delete_task(task_id)
-            
+            success = await ScheduledTaskDAO.delete_task(task_id)
+
             if success:
+                self.quick_executor.invalidate_task_artifacts(task_id)
+                self.streaming_executor.invalidate_task_artifacts(task_id)
                 logger.info(f"Removed scheduled task: {task_id}")
             
             return success
@@ -317,16 +488,16 @@ class ScheduledResearchManager:
     async def pause_task(self, task_id: str) -> bool:
         """暂停任务（改进版）"""
         try:
-            job_id = f"research_task_{task_id}"
-            job = self.scheduler.get_job(job_id)
-            
-            # 移除job而不是暂停，避免重启后状态不一致
-            if job:
-                self.scheduler.remove_job(job_id)
+            # 移除job而不是暂停，避免重启后状态不一致；
+            # job不存在时直接忽略，不先get_job再remove各查一次
+            try:
+                self.scheduler.remove_job(_job_id(task_id))
                 logger.info(f"Removed job for paused task: {task_id}")
+            except JobLookupError:
+                pass
             
             # 更新数据库状态
-            ScheduledTaskDAO.update_task(task_id, {
+            await ScheduledTaskDAO.update_task(task_id, {
                 "is_active": False,
                 "updated_at": datetime.now()
             })
@@ -340,19 +511,16 @@ class ScheduledResearchManager:
     async def resume_task(self, task_id: str) -> bool:
         """恢复任务（改进版）"""
         try:
-            # 1. 更新数据库状态
-            ScheduledTaskDAO.update_task(task_id, {
+            # 1. 更新数据库状态（返回更新后的任务，兼作存在性检查）
+            task = await ScheduledTaskDAO.update_task(task_id, {
                 "is_active": True,
                 "updated_at": datetime.now()
             })
-            
-            # 2. 获取更新后的任务信息
-            task = ScheduledTaskDAO.get_task_by_id(task_id)
             if not task:
                 logger.error(f"Task not found: {task_id}")
                 return False
-            
-            # 3. 重新调度任务（确保job正确创建）
+
+            # 2. 重新调度任务（确保job正确创建）
             await self._schedule_task(task)
             logger.info(f"Resumed scheduled task: {task_id}")
             return True
@@ -365,21 +533,24 @@ class ScheduledResearchManager:
         """立即触发任务执行"""
         try:
             # 获取任务
-            task = ScheduledTaskDAO.get_task_by_id(task_id)
+            task = await ScheduledTaskDAO.get_task_by_id(task_id)
             if not task:
                 return False
             
             if quick_mode:
-                # 使用快速执行器直接执行
+                # 使用快速执行器直接执行（任务行已在手，直接传入，不再回查）
                 logger.info(f"Quick triggering task: {task_id}")
-                asyncio.create_task(self._execute_quick_task(task_id))
+                quick_task = asyncio.create_task(self._execute_quick_task(task))
+                self._fire_and_forget.add(quick_task)
+                quick_task.add_done_callback(self._fire_and_forget.discard)
             else:
-                # 创建一次性任务
-                job_id = f"manual_trigger_{task_id}_{int(datetime.now().timestamp())}"
-                
+                # 创建一次性任务（job_id后缀与run_date取同一次now）
+                now = datetime.now()
+                job_id = f"manual_trigger_{task_id}_{int(now.timestamp())}"
+
                 self.scheduler.add_job(
                     func=self._execute_research_task,
-                    trigger=DateTrigger(run_date=datetime.now()),
+                    trigger=DateTrigger(run_date=now),
                     id=job_id,
                     args=[task_id],
                     name=f"Manual Trigger: {task.topic}"
@@ -392,14 +563,9 @@ class ScheduledResearchManager:
             logger.error(f"Failed to trigger task {task_id}: {e}")
             raise
     
-    async def _execute_quick_task(self, task_id: str):
-        """执行快速任务"""
+    async def _execute_quick_task(self, task):
+        """执行快速任务（任务行由触发方传入，避免同一tick内的重复读取）"""
         try:
-            task = ScheduledTaskDAO.get_task_by_id(task_id)
-            if not task:
-                logger.warning(f"Task {task_id} not found for quick execution")
-                return
-            
             # 使用快速执行器
             result = await self.quick_executor.execute_quick_research(task)
             
@@ -411,7 +577,7 @@ class ScheduledResearchManager:
                 if self.websocket_manager:
                     await self._broadcast_quick_result(task, result)
             else:
-                logger.error(f"Quick execution failed for task {task_id}: {result.get('error')}")
+                logger.error(f"Quick execution failed for task {task.id}: {result.get('error')}")
                 
         except Exception as e:
             logger.error(f"Quick task execution failed: {e}")
@@ -420,55 +586,55 @@ class ScheduledResearchManager:
         """保存快速执行结果"""
         try:
             # 创建研究历史记录
-            history_data = {
-                "task_id": task.id,
-                "executed_at": datetime.now(),
-                "execution_duration": result.get("execution_time", 0),
-                "status": "success",
-                "raw_result": result.get("report", ""),
-                "summary": result.get("summary", ""),
-                "key_findings": [],  # 快速模式暂不分析
-                "key_changes": [],   # 快速模式暂不分析
-                "sources_count": result.get("sources_count", 0),
-                "tokens_used": 0,    # 快速模式暂不统计
-                "trend_score": 5.0,  # 默认中等分数
-                "sentiment_score": 0.0,
-                "research_config": {
+            history_data = HistoryCreate(
+                task_id=task.id,
+                executed_at=datetime.now(),
+                execution_duration=result.get("execution_time", 0),
+                status="success",
+                raw_result=result.get("report", ""),
+                summary=result.get("summary", ""),
+                key_findings=[],  # 快速模式暂不分析
+                key_changes=[],   # 快速模式暂不分析
+                sources_count=result.get("sources_count", 0),
+                tokens_used=0,    # 快速模式暂不统计
+                trend_score=5.0,  # 默认中等分数
+                sentiment_score=0.0,
+                research_config={
                     "mode": "quick",
                     "analysis_depth": task.analysis_depth,
                     "query_used": result.get("query_used", "")
                 },
-                "sources_used": []
-            }
-            
-            ResearchHistoryDAO.create_history(history_data)
-            
-            # 更新任务执行统计
-            ScheduledTaskDAO.update_task_execution_status(
+                sources_used=[]
+            )
+
+            # 历史记录与任务统计在同一事务落盘
+            await _finalize_execution(
                 task_id=task.id,
                 success=True,
-                execution_time=result.get("execution_time", 0)
+                history_data=history_data
             )
-            
+
         except Exception as e:
             logger.error(f"Failed to save quick result: {e}")
     
     async def _broadcast_quick_result(self, task, result):
         """广播快速执行结果"""
         try:
+            # 与定时结果同构的scheduled_result条目：前端按同一分支处理
             message = {
-                "type": "quick_research_completed",
+                "type": "scheduled_result",
                 "task_id": task.id,
-                "task_topic": task.topic,
+                "topic": task.topic,
                 "summary": result.get("summary", ""),
                 "sources_count": result.get("sources_count", 0),
                 "execution_time": result.get("execution_time", 0),
                 "timestamp": datetime.now().isoformat(),
                 "trend_score": 5.0
             }
-            
-            await self.websocket_manager.broadcast_scheduled_result(message)
-            
+
+            # 与定时结果走同一条合并广播通道
+            await self._broadcast_q.put(message)
+
         except Exception as e:
             logger.error(f"Failed to broadcast quick result: {e}")
     
@@ -487,34 +653,71 @@ class ScheduledResearchManager:
             "running": self.scheduler.running,
             "total_jobs": len(jobs),
             "jobs": jobs,
-            "running_tasks": list(self.running_tasks.keys())
+            "running_tasks": [
+                task_id for task_id, lock in self._task_locks.items() if lock.locked()
+            ],
+            "max_research_concurrency": _MAX_RESEARCH_CONCURRENCY,
+            "available_research_slots": self._research_sem._value
         }
     
     async def shutdown(self):
         """关闭调度器"""
         try:
+            # 取消在途的fire-and-forget任务（快速触发等），等待其收尾
+            if self._fire_and_forget:
+                pending = list(self._fire_and_forget)
+                for t in pending:
+                    t.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                self._fire_and_forget.clear()
+
+            # 先停广播flusher，残留消息尽力冲刷一批后退出
+            if self._broadcast_flusher_task is not None:
+                self._broadcast_flusher_task.cancel()
+                try:
+                    await self._broadcast_flusher_task
+                except asyncio.CancelledError:
+                    pass
+                self._broadcast_flusher_task = None
+                if self.websocket_manager and not self._broadcast_q.empty():
+                    leftovers = []
+                    while not self._broadcast_q.empty():
+                        leftovers.append(self._broadcast_q.get_nowait())
+                    await self.websocket_manager.broadcast_scheduled_result_batch(leftovers)
+
             if self.scheduler and self.scheduler.running:
                 self.scheduler.shutdown(wait=True)
                 logger.info("Scheduled research manager shutdown successfully")
-                
+
         except Exception as e:
             logger.error(f"Error during scheduler shutdown: {e}")
 
 
-# 全局调度器实例
+# 全局调度器实例（创建用线程锁双重检查，初始化用协程锁串行化）
 _scheduler_manager_instance = None
+_singleton_lock = threading.Lock()
+_init_lock = asyncio.Lock()
 
 def get_scheduler_manager(websocket_manager=None) -> ScheduledResearchManager:
-    """获取全局调度器管理器实例"""
+    """获取全局调度器管理器实例
+
+    双重检查锁：并发启动路径（lifespan钩子+后台worker）同时进来时
+    只创建一个实例，否则会出现两套APScheduler重复派发job
+    """
     global _scheduler_manager_instance
-    
+
     if _scheduler_manager_instance is None:
-        _scheduler_manager_instance = ScheduledResearchManager(websocket_manager=websocket_manager)
-    
+        with _singleton_lock:
+            if _scheduler_manager_instance is None:
+                _scheduler_manager_instance = ScheduledResearchManager(
+                    websocket_manager=websocket_manager
+                )
+
     return _scheduler_manager_instance
 
 async def initialize_scheduler(websocket_manager=None):
-    """初始化全局调度器"""
+    """初始化全局调度器（协程锁防止两个并发调用同时跑initialize）"""
     manager = get_scheduler_manager(websocket_manager)
-    await manager.initialize()
+    async with _init_lock:
+        await manager.initialize()
     return manager
@@ -78,40 +78,28 @@ async def apply_startup_fixes(scheduler_manager) -> Dict[str, Any]:
     return fix_results
 
 
+async def _post_init_fix_hook(scheduler_manager) -> None:
+    """initialize完成后执行的修复钩子"""
+    fix_results = await apply_startup_fixes(scheduler_manager)
+
+    if fix_results["success"]:
+        logger.info("🎉 Enhanced initialization completed successfully")
+    else:
+        logger.warning("⚠️  Enhanced initialization completed with issues")
+
+
 def setup_startup_fixes(scheduler_manager):
     """
     设置启动时自动修复
-    
+
+    通过post_init_hooks注册，不再整体替换initialize方法
+    （包装闭包每次调用多付一层Python帧，且profiler里归因不清）
+
     Args:
         scheduler_manager: 调度器管理器实例
     """
-    
-    # 保存原始的初始化方法
-    original_initialize = scheduler_manager.initialize
-    
-    async def enhanced_initialize():
-        """增强的初始化方法，包含自动修复"""
-        try:
-            # 先执行原始初始化
-            await original_initialize()
-            
-            # 然后应用启动修复
-            fix_results = await apply_startup_fixes(scheduler_manager)
-            
-            # 记录修复结果
-            if fix_results["success"]:
-                logger.info("🎉 Enhanced initialization completed successfully")
-            else:
-                logger.warning("⚠️  Enhanced initialization completed with issues")
-            
-            return fix_results
-            
-        except Exception as e:
-            logger.error(f"❌ Enhanced initialization failed: {e}")
-            raise
-    
-    # 替换初始化方法
-    scheduler_manager.initialize = enhanced_initialize
-    
+    if _post_init_fix_hook not in scheduler_manager.post_init_hooks:
+        scheduler_manager.post_init_hooks.append(_post_init_fix_hook)
+
     logger.info("🔧 Startup fixes configured")
     return scheduler_manager
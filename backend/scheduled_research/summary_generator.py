@@ -2,25 +2,230 @@
 动态摘要生成器 - 生成AI驱动的智能摘要
 Dynamic Summary Generator - Generates AI-driven intelligent summaries
 """
+import copy
+import hashlib
+import io
 import logging
+import math
+import os
+from bisect import bisect_right
 import json
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
 
 from .prompts import ScheduledResearchPrompts
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# 段落筛选关键词：提前编译为交替正则，一次线性扫描代替逐词substring循环
+# （两个方法的关键词表不同，分别维护）
+_PARAGRAPH_KEYWORDS = ("突破", "创新", "发展", "增长", "变化", "趋势", "影响", "重要", "关键", "显著", "主要", "核心", "新兴")
+_PARAGRAPH_KW_RE = re.compile("|".join(map(re.escape, _PARAGRAPH_KEYWORDS)))
+
+_FINDING_KEYWORDS = ("突破", "创新", "发展", "增长", "下降", "变化", "趋势", "影响", "重要", "关键", "显著", "主要", "新兴", "提升", "改善", "挑战")
+_FINDING_KW_RE = re.compile("|".join(map(re.escape, _FINDING_KEYWORDS)))
+
+# 段落分割：预编译正则一次扫描，空行间夹杂空白也视为段落边界
+_PARA_RE = re.compile(r"\n\s*\n+")
+
+# 报告达到该长度时装配转入进程池：纯Python字符串工作绕开GIL，
+# 多任务并发时可随CPU核数横向扩展；短报告仍走线程路径（省去pickle开销）
+_PROCESS_OFFLOAD_MIN_REPORT = 2000
+
+# 摘要LRU缓存容量：同一任务在稳定话题下相邻轮次的输入完全一致，命中即跳过全部字符串组装
+_SUMMARY_CACHE_MAXSIZE = 256
+
+# 模糊缓存容量与归一化参数：报告常只差时间戳/数字等细节，
+# 规范化签名把这类近重复输入折叠到同一键上
+_FUZZY_CACHE_MAXSIZE = 1024
+_FUZZY_REPORT_PREFIX = 2000
+_FUZZY_NORMALIZE_RE = re.compile(r"[\d\s]+")
+
+def _strict_gt(threshold: float) -> float:
+    """
+    基线用严格'>'比较的阈值：上调到下一个可表示浮点，
+    使bisect_right在输入恰好等于阈值时仍取低档（如默认confidence 0.5仍是低置信度）
+    """
+    return math.nextafter(threshold, math.inf)
+
+
+# 评分分级表：bisect按有序阈值二分取档，替代逐级float比较的if梯子；
+# 严格'>'边界经_strict_gt微调，严格'<'边界保持原值，落点语义与基线逐级比较完全一致
+_TREND_STATUS_TH = (3.5, _strict_gt(7.5))
+_TREND_STATUS_LABELS = ("trending_down", "", "trending_up")  # 中间档空串 → 回退emerging/stable判断
+
+_TREND_DESC_TH = (3.5, 4.5, _strict_gt(6.0), _strict_gt(7.5))
+_TREND_DESC_LABELS = ("下降趋势", "温和下降趋势", "稳定趋势", "温和上升趋势", "强劲上升趋势")
+_ACTIVITY_DESC_TH = (_strict_gt(5.5), _strict_gt(7.0))
+_ACTIVITY_DESC_LABELS = ("活跃度一般", "中等活跃", "高度活跃")
+_CHANGE_DESC_TH = (_strict_gt(4.0), _strict_gt(7.0))
+_CHANGE_DESC_LABELS = ("轻微变化", "明显变化", "剧烈变化")
+_CONFIDENCE_DESC_TH = (_strict_gt(0.5), _strict_gt(0.8))
+_CONFIDENCE_DESC_LABELS = ("低置信度", "中等置信度", "高置信度")
+
+# 详细趋势分析的分档模板（{score}由调用处填充）
+_TREND_ANALYSIS_TH = (3.5, _strict_gt(6.0), _strict_gt(7.5))
+_TREND_ANALYSIS_TPLS = (
+    "**趋势强度：** 出现下降趋势 (评分: {score:.1f}/10)，关注度和活跃程度有所减少。",
+    "**趋势强度：** 保持相对稳定的发展态势 (评分: {score:.1f}/10)，没有明显的波动变化。",
+    "**趋势强度：** 表现出温和的上升趋势 (评分: {score:.1f}/10)，相关活动和讨论有所增加。",
+    "**趋势强度：** 当前呈现强劲上升趋势 (评分: {score:.1f}/10)，表明该话题正获得越来越多的关注和讨论。",
+)
+_ACTIVITY_ANALYSIS_TH = (_strict_gt(5.0), _strict_gt(7.0))
+_ACTIVITY_ANALYSIS_TPLS = (
+    "**活跃程度：** 活跃度相对较低 (评分: {score:.1f}/10)，可能需要寻找新的信息源或调整关键词。",
+    "**活跃程度：** 维持中等活跃水平 (评分: {score:.1f}/10)，有稳定的信息产出和关注。",
+    "**活跃程度：** 当前处于高度活跃状态 (评分: {score:.1f}/10)，信息更新频繁，讨论热烈。",
+)
+_CHANGE_ANALYSIS_TH = (_strict_gt(3.0), _strict_gt(6.0))
+_CHANGE_ANALYSIS_TPLS = (
+    "**变化程度：** 变化相对平缓 (评分: {score:.1f}/10)，保持了相对稳定的发展模式。",
+    "**变化程度：** 出现了一定程度的变化 (评分: {score:.1f}/10)，趋势正在逐步演进。",
+    "**变化程度：** 发生了显著变化 (评分: {score:.1f}/10)，出现了值得关注的新动向或转折点。",
+)
+_CONFIDENCE_ANALYSIS_TH = (_strict_gt(0.5), _strict_gt(0.8))
+_CONFIDENCE_ANALYSIS_TPLS = (
+    "**数据可靠性：** 低置信度 ({score:.1%}) - 历史数据有限，建议积累更多数据后再做判断。",
+    "**数据可靠性：** 中等置信度 ({score:.1%}) - 有一定的历史数据支撑，结论较为可靠。",
+    "**数据可靠性：** 高置信度 ({score:.1%}) - 基于充足的历史数据和高质量的信息源。",
+)
+
+# 综合摘要的固定段落模板（含原'\n'.join产生的段间换行），避免逐次重建f-string
+_SECTION_DETAILS = "\n详细分析：{}。"
+_SECTION_FINDINGS = "\n\n\n**主要发现：**\n{}"
+_SECTION_TRENDS = "\n\n\n**趋势分析：**\n{}"
+_SECTION_RECOMMENDATIONS = "\n\n\n**建议与后续关注：**\n{}"
+_SECTION_TIMESTAMP = "\n\n\n*数据更新时间: {}*"
+
+# 优先级分档：趋势分与变化幅度各自取档后按等级取大者
+_PRIORITY_LEVELS = ("low", "medium", "high")
+_PRIORITY_TREND_TH = (3.0, _strict_gt(8.0))
+_PRIORITY_TREND_RANKS = (1, 0, 2)  # 低分段medium、中段low、高分段high
+_PRIORITY_CHANGE_TH = (_strict_gt(4.0), _strict_gt(7.0))
+_PRIORITY_CHANGE_RANKS = (0, 1, 2)
+
+
+def _dedup_keep_order(items: List[str]) -> List[str]:
+    """保序去重：seen集合单次遍历，省去dict.fromkeys的中间dict构建"""
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+    return out
+
+
+async def _no_paragraphs() -> str:
+    """gather占位分支：报告过短时跳过段落提取，不占线程池工位"""
+    return ""
+
+
+@dataclass(slots=True)
+class _TaskView:
+    """跨进程传参用的任务裁剪视图：只保留装配所需字段，保证可pickle"""
+    topic: str
+    interval_hours: int
+
+
+# 子进程内的生成器单例：每个worker进程首次调用时创建并复用
+_WORKER_GENERATOR = None
+
+
+def _assemble_summary_data(topic: str, interval_hours: int,
+                           research_result: Dict[str, Any],
+                           trend_result: Dict[str, Any]) -> Dict[str, Any]:
+    """进程池工作函数（模块级以便pickle）：在子进程中同步完成全部字符串装配"""
+    global _WORKER_GENERATOR
+    if _WORKER_GENERATOR is None:
+        _WORKER_GENERATOR = DynamicSummaryGenerator()
+    return _WORKER_GENERATOR._generate_summary_data_sync(
+        _TaskView(topic, interval_hours), research_result, trend_result
+    )
+
+
+@dataclass(slots=True)
+class TrendView:
+    """
+    趋势分析结果的只读视图：入口处解析一次，
+    各helper以属性访问复用，免去逐方法重复的dict查找
+    """
+    trend_score: float = 5.0
+    activity_level: float = 5.0
+    change_magnitude: float = 0.0
+    confidence_score: float = 0.5
+    anomaly_detected: bool = False
+    anomaly_description: str = ""
+    new_topics: List[str] = field(default_factory=list)
+    emerging_keywords: List[str] = field(default_factory=list)
+    keyword_trends: Dict[str, float] = field(default_factory=dict)
+    sentiment_changes: Dict[str, Any] = field(default_factory=dict)
+    topic_evolution: Dict[str, Any] = field(default_factory=dict)
+    # 关键词表的并行数组视图（__post_init__填充）：阈值筛选走NumPy的C层向量比较，
+    # 各helper共享同一份数组，不再逐方法重跑Python比较循环
+    keyword_keys: Any = field(default=None, repr=False)
+    keyword_scores: Any = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.keyword_keys = np.array(list(self.keyword_trends), dtype=object)
+        # float64与原始Python float逐位一致，.1f格式化输出和阈值判断不受舍入影响
+        self.keyword_scores = np.fromiter(
+            self.keyword_trends.values(), dtype=np.float64, count=len(self.keyword_trends)
+        )
+
+    def keywords_above(self, threshold: float) -> List[str]:
+        """分数高于阈值的关键词（保持插入序）"""
+        return self.keyword_keys[self.keyword_scores > threshold].tolist()
+
+    def keywords_below(self, threshold: float) -> List[str]:
+        """分数低于阈值的关键词（保持插入序）"""
+        return self.keyword_keys[self.keyword_scores < threshold].tolist()
+
+    def keyword_pairs_above(self, threshold: float) -> List[Tuple[str, float]]:
+        """(关键词, 分数)对，分数高于阈值"""
+        mask = self.keyword_scores > threshold
+        return list(zip(self.keyword_keys[mask], self.keyword_scores[mask].tolist()))
+
+    def keyword_pairs_below(self, threshold: float) -> List[Tuple[str, float]]:
+        """(关键词, 分数)对，分数低于阈值"""
+        mask = self.keyword_scores < threshold
+        return list(zip(self.keyword_keys[mask], self.keyword_scores[mask].tolist()))
+
+    def keywords_between_count(self, low: float, high: float) -> int:
+        """落在[low, high]闭区间内的关键词数量"""
+        return int(np.count_nonzero((self.keyword_scores >= low) & (self.keyword_scores <= high)))
+
+    @classmethod
+    def from_dict(cls, trend_result: Dict[str, Any]) -> "TrendView":
+        """从趋势dict构建视图，未知键忽略、缺失/None键取默认值"""
+        return cls(**{
+            f.name: trend_result[f.name]
+            for f in fields(cls)
+            if trend_result.get(f.name) is not None
+        })
+
 
 class DynamicSummaryGenerator:
     """
     动态摘要生成器
     Generates dynamic summaries based on research results and trend analysis
     """
-    
+
     def __init__(self):
         """初始化摘要生成器"""
+        # 输入指纹 → summary_data 的LRU缓存（生成是输入的纯函数）
+        self._summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 第二级模糊缓存：规范化签名命中近重复输入（精确缓存miss时回退查询）
+        self._fuzzy_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 长报告装配用的进程池（惰性创建，避免worker子进程内再嵌套建池）
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         self.summary_templates = {
             "trending_up": "📈 {topic} 呈现上升趋势，活跃度显著提升",
             "trending_down": "📉 {topic} 活跃度有所下降，需要关注发展动向", 
@@ -43,633 +248,614 @@ class DynamicSummaryGenerator:
         """
         try:
             logger.info(f"Generating dynamic summary for: {task.topic}")
-            
-            # 简化分类，增加具体内容
-            summary_data = {
-                "summary": "",
-                "key_findings": [],
-                "key_changes": []
-            }
-            
-            # 生成综合性详细摘要（包含趋势、分析、建议等所有内容）
-            summary_data["summary"] = await self._generate_comprehensive_summary(task, research_result, trend_result)
-            
-            # 生成详细的关键发现（包含具体内容和分析）
-            summary_data["key_findings"] = self._extract_detailed_findings(research_result, trend_result)
-            
-            # 生成详细的变化分析（包含趋势变化和具体数据）
-            summary_data["key_changes"] = self._identify_detailed_changes(trend_result)
-            
+
+            # 生成结果只取决于话题与两份输入dict：指纹命中直接复用，
+            # 跳过全部下游的段落提取和字符串组装
+            cache_key = self._cache_key(task.topic, research_result, trend_result)
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                self._summary_cache.move_to_end(cache_key)
+                logger.info(f"Dynamic summary cache hit for: {task.topic}")
+                return copy.deepcopy(cached)
+
+            # 精确miss后查模糊层：报告只差时间戳/数字等细节时仍可复用
+            fuzzy_key = self._fuzzy_cache_key(task.topic, research_result, trend_result)
+            cached = self._fuzzy_cache.get(fuzzy_key)
+            if cached is not None:
+                self._fuzzy_cache.move_to_end(fuzzy_key)
+                logger.info(f"Dynamic summary fuzzy cache hit for: {task.topic}")
+                return copy.deepcopy(cached)
+
+            if len(research_result.get("report", "")) >= _PROCESS_OFFLOAD_MIN_REPORT:
+                # 长报告：整套装配下放进程池，绕开GIL，多任务时随核数扩展
+                loop = asyncio.get_running_loop()
+                summary_data = await loop.run_in_executor(
+                    self._get_process_pool(), _assemble_summary_data,
+                    task.topic, task.interval_hours, research_result, trend_result
+                )
+            else:
+                # 短报告：pickle开销不划算，留在本进程内并发装配。
+                # 趋势dict只解析一次，后续helper全部走属性访问
+                trend = TrendView.from_dict(trend_result)
+
+                # 摘要、发现、变化三路互不依赖：并发执行，墙钟时间收敛到
+                # 最慢一路而非三者之和（同步helper经to_thread下放线程池）
+                summary, key_findings, key_changes = await asyncio.gather(
+                    self._generate_comprehensive_summary(task, research_result, trend),
+                    asyncio.to_thread(self._extract_detailed_findings, research_result, trend),
+                    asyncio.to_thread(self._identify_detailed_changes, trend),
+                )
+
+                # 简化分类，增加具体内容
+                summary_data = {
+                    "summary": summary,
+                    "key_findings": key_findings,
+                    "key_changes": key_changes
+                }
+
+            # LRU插入：超容量时淘汰最久未使用项；存副本避免调用方原地修改污染缓存
+            cached_copy = copy.deepcopy(summary_data)
+            self._summary_cache[cache_key] = cached_copy
+            if len(self._summary_cache) > _SUMMARY_CACHE_MAXSIZE:
+                self._summary_cache.popitem(last=False)
+            self._fuzzy_cache[fuzzy_key] = cached_copy
+            if len(self._fuzzy_cache) > _FUZZY_CACHE_MAXSIZE:
+                self._fuzzy_cache.popitem(last=False)
+
             logger.info(f"Dynamic summary generated successfully")
-            
+
             return summary_data
             
         except Exception as e:
             logger.error(f"Dynamic summary generation failed: {e}")
             return self._create_fallback_summary(research_result, task)
-    
-    async def _generate_comprehensive_summary(self, task, research_result: Dict[str, Any], trend_result: Dict[str, Any]) -> str:
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """惰性创建装配进程池：首次长报告到达时才fork worker"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._process_pool
+
+    @staticmethod
+    def _cache_key(topic: str, research_result: Dict[str, Any], trend_result: Dict[str, Any]) -> str:
+        """计算输入指纹：sort_keys保证dict键序无关，sha256压缩为定长键"""
+        payload = json.dumps(
+            {"t": topic, "r": research_result, "tr": trend_result},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _fuzzy_cache_key(topic: str, research_result: Dict[str, Any], trend_result: Dict[str, Any]) -> str:
+        """
+        计算模糊指纹：报告取前缀并剥离数字/空白（时间戳、计数等易变细节），
+        趋势指标四舍五入到一位小数，使近重复输入折叠为同一键
+        """
+        report = _FUZZY_NORMALIZE_RE.sub("", research_result.get("report", "")[:_FUZZY_REPORT_PREFIX])
+        metrics = {
+            k: round(v, 1) if isinstance(v, float) else v
+            for k, v in sorted(trend_result.items())
+            if isinstance(v, (int, float, bool, str))
+        }
+        keyword_trends = trend_result.get("keyword_trends", {})
+        payload = json.dumps(
+            {
+                "t": topic,
+                "report": report,
+                "metrics": metrics,
+                "keywords": sorted(
+                    (k, round(v, 1)) for k, v in keyword_trends.items() if isinstance(v, (int, float))
+                ),
+                "new_topics": sorted(trend_result.get("new_topics", [])),
+            },
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _generate_comprehensive_summary(self, task, research_result: Dict[str, Any], trend: TrendView) -> str:
         """生成综合性详细摘要"""
         try:
-            # 获取趋势分数和状态
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            anomaly_detected = trend_result.get("anomaly_detected", False)
-            
-            # 确定趋势状态
-            if anomaly_detected:
-                trend_status = "anomaly"
-            elif trend_score > 7.5:
-                trend_status = "trending_up"
-            elif trend_score < 3.5:
-                trend_status = "trending_down"
-            elif len(trend_result.get("new_topics", [])) > 3:
-                trend_status = "emerging"
-            else:
-                trend_status = "stable"
-            
-            # 基础摘要模板
-            base_summary = self.summary_templates.get(trend_status, "").format(topic=task.topic)
-            
-            # 添加详细信息
-            details = []
-            
-            # 添加活跃度信息
-            if activity_level > 7.0:
-                details.append(f"当前活跃度较高 (评分: {activity_level:.1f}/10)")
-            elif activity_level < 4.0:
-                details.append(f"当前活跃度较低 (评分: {activity_level:.1f}/10)")
-            
-            # 添加新发现信息
-            new_topics = trend_result.get("new_topics", [])
-            if new_topics:
-                details.append(f"发现 {len(new_topics)} 个新相关话题")
-            
-            # 添加关键词趋势
-            keyword_trends = trend_result.get("keyword_trends", {})
-            trending_keywords = [k for k, v in keyword_trends.items() if v > 7.0]
-            if trending_keywords:
-                details.append(f"热门关键词: {', '.join(trending_keywords[:3])}")
-            
-            # 添加情感变化
-            sentiment_changes = trend_result.get("sentiment_changes", {})
-            for sentiment_type, data in sentiment_changes.items():
-                if isinstance(data, dict) and data.get("trend") in ["up", "down"]:
-                    if sentiment_type == "positive" and data.get("trend") == "up":
-                        details.append("正面情绪呈上升趋势")
-                    elif sentiment_type == "negative" and data.get("trend") == "up":
-                        details.append("负面情绪有所增加")
-            
-            # 构建详细的综合摘要
-            summary_parts = [base_summary]
-            
-            # 添加详细的数据分析
-            if details:
-                summary_parts.append(f"详细分析：{' '.join(details)}。")
-            
-            # 添加具体的研究内容摘录
+            # 段落摘录、趋势详情、建议三个helper只读同一份输入，
+            # 并发跑满线程池，耗时取最大分支
             report_content = research_result.get("report", "")
-            if report_content and len(report_content) > 100:
-                # 提取报告的关键段落
-                key_paragraphs = self._extract_key_paragraphs(report_content)
-                if key_paragraphs:
-                    summary_parts.append(f"\n\n**主要发现：**\n{key_paragraphs}")
-            
-            # 添加趋势分析详情
-            trend_details = self._generate_detailed_trend_analysis(trend_result)
-            if trend_details:
-                summary_parts.append(f"\n\n**趋势分析：**\n{trend_details}")
-            
-            # 添加行动建议和后续关注重点
-            recommendations = self._generate_comprehensive_recommendations(task, trend_result)
-            if recommendations:
-                summary_parts.append(f"\n\n**建议与后续关注：**\n{recommendations}")
-            
-            # 添加时间戳
-            timestamp = datetime.now().strftime("%Y年%m月%d日 %H:%M")
-            summary_parts.append(f"\n\n*数据更新时间: {timestamp}*")
-            
-            return '\n'.join(summary_parts)
-            
+            key_paragraphs, trend_details, recommendations = await asyncio.gather(
+                asyncio.to_thread(self._extract_key_paragraphs, report_content)
+                if report_content and len(report_content) > 100
+                else _no_paragraphs(),
+                asyncio.to_thread(self._generate_detailed_trend_analysis, trend),
+                asyncio.to_thread(self._generate_comprehensive_recommendations, task, trend),
+            )
+
+            return self._compose_comprehensive_summary(task, trend, key_paragraphs, trend_details, recommendations)
+
         except Exception as e:
             logger.error(f"Main summary generation failed: {e}")
             return f"关于 {task.topic} 的最新分析报告已生成。数据更新时间: {datetime.now().strftime('%Y年%m月%d日 %H:%M')}"
-    
+
+    def _compose_comprehensive_summary(self, task, trend: TrendView, key_paragraphs: str,
+                                       trend_details: str, recommendations: str) -> str:
+        """拼装综合摘要文本（纯同步，线程/进程两条路径共用）"""
+        # 获取趋势分数和状态
+        trend_score = trend.trend_score
+        activity_level = trend.activity_level
+
+        # 确定趋势状态
+        if trend.anomaly_detected:
+            trend_status = "anomaly"
+        else:
+            trend_status = _TREND_STATUS_LABELS[bisect_right(_TREND_STATUS_TH, trend_score)]
+            if not trend_status:
+                trend_status = "emerging" if len(trend.new_topics) > 3 else "stable"
+
+        # 基础摘要模板
+        base_summary = self.summary_templates.get(trend_status, "").format(topic=task.topic)
+
+        # 添加详细信息
+        details = []
+
+        # 添加活跃度信息
+        if activity_level > 7.0:
+            details.append(f"当前活跃度较高 (评分: {activity_level:.1f}/10)")
+        elif activity_level < 4.0:
+            details.append(f"当前活跃度较低 (评分: {activity_level:.1f}/10)")
+
+        # 添加新发现信息
+        if trend.new_topics:
+            details.append(f"发现 {len(trend.new_topics)} 个新相关话题")
+
+        # 添加关键词趋势
+        trending_keywords = trend.keywords_above(7.0)
+        if trending_keywords:
+            details.append(f"热门关键词: {', '.join(trending_keywords[:3])}")
+
+        # 添加情感变化
+        for sentiment_type, data in trend.sentiment_changes.items():
+            if isinstance(data, dict) and data.get("trend") in ["up", "down"]:
+                if sentiment_type == "positive" and data.get("trend") == "up":
+                    details.append("正面情绪呈上升趋势")
+                elif sentiment_type == "negative" and data.get("trend") == "up":
+                    details.append("负面情绪有所增加")
+
+        # 构建详细的综合摘要：单个StringIO流式写入，省去中间列表与逐段f-string
+        buf = io.StringIO()
+        buf.write(base_summary)
+
+        # 添加详细的数据分析
+        if details:
+            buf.write(_SECTION_DETAILS.format(' '.join(details)))
+
+        # 添加具体的研究内容摘录
+        if key_paragraphs:
+            buf.write(_SECTION_FINDINGS.format(key_paragraphs))
+
+        # 添加趋势分析详情
+        if trend_details:
+            buf.write(_SECTION_TRENDS.format(trend_details))
+
+        # 添加行动建议和后续关注重点
+        if recommendations:
+            buf.write(_SECTION_RECOMMENDATIONS.format(recommendations))
+
+        # 添加时间戳
+        timestamp = datetime.now().strftime("%Y年%m月%d日 %H:%M")
+        buf.write(_SECTION_TIMESTAMP.format(timestamp))
+
+        return buf.getvalue()
+
+    def _generate_summary_data_sync(self, task, research_result: Dict[str, Any],
+                                    trend_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        同步完成整套装配：进程池子进程内执行（无事件循环），
+        任务间并行由多进程承担，任务内按序执行即可
+        """
+        trend = TrendView.from_dict(trend_result)
+        report_content = research_result.get("report", "")
+
+        key_paragraphs = (
+            self._extract_key_paragraphs(report_content)
+            if report_content and len(report_content) > 100 else ""
+        )
+        trend_details = self._generate_detailed_trend_analysis(trend)
+        recommendations = self._generate_comprehensive_recommendations(task, trend)
+
+        return {
+            "summary": self._compose_comprehensive_summary(task, trend, key_paragraphs, trend_details, recommendations),
+            "key_findings": self._extract_detailed_findings(research_result, trend),
+            "key_changes": self._identify_detailed_changes(trend)
+        }
+
     def _extract_key_paragraphs(self, report_content: str) -> str:
         """从报告中提取关键段落"""
-        try:
-            # 分割成段落
-            paragraphs = [p.strip() for p in report_content.split('\n\n') if p.strip()]
-            if not paragraphs:
-                paragraphs = [p.strip() for p in report_content.split('\n') if p.strip() and len(p.strip()) > 50]
-            
-            # 选择最有价值的段落（长度适中，包含关键词）
-            key_paragraphs = []
-            important_keywords = ["突破", "创新", "发展", "增长", "变化", "趋势", "影响", "重要", "关键", "显著", "主要", "核心", "新兴"]
-            
-            for paragraph in paragraphs[:10]:  # 检查前10个段落
-                if 50 <= len(paragraph) <= 300:  # 长度适中
-                    keyword_count = sum(1 for keyword in important_keywords if keyword in paragraph)
-                    if keyword_count >= 1:  # 包含至少一个关键词
-                        key_paragraphs.append(paragraph)
-                        if len(key_paragraphs) >= 3:  # 最多选择3个段落
-                            break
-            
-            # 如果没有找到合适的段落，选择前几个较长的段落
-            if not key_paragraphs:
-                key_paragraphs = [p for p in paragraphs[:3] if len(p) > 30]
-            
-            return '\n\n'.join(key_paragraphs[:3])
-            
-        except Exception as e:
-            logger.error(f"Key paragraphs extraction failed: {e}")
-            return ""
+        # 分割成段落（单次正则扫描）
+        paragraphs = [p for p in map(str.strip, _PARA_RE.split(report_content)) if p]
+        if not paragraphs:
+            paragraphs = [p.strip() for p in report_content.split('\n') if p.strip() and len(p.strip()) > 50]
+        
+        # 选择最有价值的段落（长度适中，包含关键词）
+        key_paragraphs = []
 
-    def _generate_detailed_trend_analysis(self, trend_result: Dict[str, Any]) -> str:
+        for paragraph in paragraphs[:10]:  # 检查前10个段落
+            if 50 <= len(paragraph) <= 300:  # 长度适中
+                if _PARAGRAPH_KW_RE.search(paragraph):  # 包含至少一个关键词
+                    key_paragraphs.append(paragraph)
+                    if len(key_paragraphs) >= 3:  # 最多选择3个段落
+                        break
+        
+        # 如果没有找到合适的段落，选择前几个较长的段落
+        if not key_paragraphs:
+            key_paragraphs = [p for p in paragraphs[:3] if len(p) > 30]
+        
+        return '\n\n'.join(key_paragraphs[:3])
+
+    def _generate_detailed_trend_analysis(self, trend: TrendView) -> str:
         """生成详细的趋势分析"""
-        try:
-            analysis_parts = []
-            
-            # 基础指标分析
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            change_magnitude = trend_result.get("change_magnitude", 0.0)
-            confidence_score = trend_result.get("confidence_score", 0.5)
-            
-            # 趋势分析
-            if trend_score > 7.5:
-                analysis_parts.append(f"**趋势强度：** 当前呈现强劲上升趋势 (评分: {trend_score:.1f}/10)，表明该话题正获得越来越多的关注和讨论。")
-            elif trend_score > 6.0:
-                analysis_parts.append(f"**趋势强度：** 表现出温和的上升趋势 (评分: {trend_score:.1f}/10)，相关活动和讨论有所增加。")
-            elif trend_score < 3.5:
-                analysis_parts.append(f"**趋势强度：** 出现下降趋势 (评分: {trend_score:.1f}/10)，关注度和活跃程度有所减少。")
-            else:
-                analysis_parts.append(f"**趋势强度：** 保持相对稳定的发展态势 (评分: {trend_score:.1f}/10)，没有明显的波动变化。")
-            
-            # 活跃度分析
-            if activity_level > 7.0:
-                analysis_parts.append(f"**活跃程度：** 当前处于高度活跃状态 (评分: {activity_level:.1f}/10)，信息更新频繁，讨论热烈。")
-            elif activity_level > 5.0:
-                analysis_parts.append(f"**活跃程度：** 维持中等活跃水平 (评分: {activity_level:.1f}/10)，有稳定的信息产出和关注。")
-            else:
-                analysis_parts.append(f"**活跃程度：** 活跃度相对较低 (评分: {activity_level:.1f}/10)，可能需要寻找新的信息源或调整关键词。")
-            
-            # 变化程度分析
-            if change_magnitude > 6.0:
-                analysis_parts.append(f"**变化程度：** 发生了显著变化 (评分: {change_magnitude:.1f}/10)，出现了值得关注的新动向或转折点。")
-            elif change_magnitude > 3.0:
-                analysis_parts.append(f"**变化程度：** 出现了一定程度的变化 (评分: {change_magnitude:.1f}/10)，趋势正在逐步演进。")
-            else:
-                analysis_parts.append(f"**变化程度：** 变化相对平缓 (评分: {change_magnitude:.1f}/10)，保持了相对稳定的发展模式。")
-            
-            # 关键词趋势详情
-            keyword_trends = trend_result.get("keyword_trends", {})
-            if keyword_trends:
-                trending_up = [(k, v) for k, v in keyword_trends.items() if v > 7.0]
-                trending_down = [(k, v) for k, v in keyword_trends.items() if v < 4.0]
-                
-                if trending_up:
-                    trending_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_up[:3]])
-                    analysis_parts.append(f"**热门关键词：** {trending_keywords} - 这些关键词显示出强劲的上升趋势，值得重点关注。")
-                
-                if trending_down:
-                    declining_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_down[:3]])
-                    analysis_parts.append(f"**热度下降：** {declining_keywords} - 这些关键词的关注度有所下降，可能反映了话题重点的转移。")
-            
-            # 新兴内容分析
-            new_topics = trend_result.get("new_topics", [])
-            emerging_keywords = trend_result.get("emerging_keywords", [])
-            
-            if new_topics or emerging_keywords:
-                emerging_content = []
-                if new_topics:
-                    emerging_content.append(f"新话题: {', '.join(new_topics[:3])}")
-                if emerging_keywords:
-                    emerging_content.append(f"新关键词: {', '.join(emerging_keywords[:3])}")
-                
-                analysis_parts.append(f"**新兴内容：** {'; '.join(emerging_content)} - 这些新出现的元素可能代表了该领域的最新发展方向。")
-            
-            # 数据可靠性
-            if confidence_score > 0.8:
-                analysis_parts.append(f"**数据可靠性：** 高置信度 ({confidence_score:.1%}) - 基于充足的历史数据和高质量的信息源。")
-            elif confidence_score > 0.5:
-                analysis_parts.append(f"**数据可靠性：** 中等置信度 ({confidence_score:.1%}) - 有一定的历史数据支撑，结论较为可靠。")
-            else:
-                analysis_parts.append(f"**数据可靠性：** 低置信度 ({confidence_score:.1%}) - 历史数据有限，建议积累更多数据后再做判断。")
-            
-            return '\n\n'.join(analysis_parts)
-            
-        except Exception as e:
-            logger.error(f"Detailed trend analysis generation failed: {e}")
-            return "趋势分析正在进行中，请稍后查看详细结果。"
+        # 单个StringIO流式写入（段间"\n\n"分隔），省去中间列表与join扫描
+        buf = io.StringIO()
+
+        # 基础指标分析
+        trend_score = trend.trend_score
+        activity_level = trend.activity_level
+        change_magnitude = trend.change_magnitude
+        confidence_score = trend.confidence_score
+
+        # 趋势分析
+        buf.write(_TREND_ANALYSIS_TPLS[bisect_right(_TREND_ANALYSIS_TH, trend_score)].format(score=trend_score))
+        buf.write("\n\n")
+
+        # 活跃度分析
+        buf.write(_ACTIVITY_ANALYSIS_TPLS[bisect_right(_ACTIVITY_ANALYSIS_TH, activity_level)].format(score=activity_level))
+        buf.write("\n\n")
+
+        # 变化程度分析
+        buf.write(_CHANGE_ANALYSIS_TPLS[bisect_right(_CHANGE_ANALYSIS_TH, change_magnitude)].format(score=change_magnitude))
+
+        # 关键词趋势详情
+        if trend.keyword_trends:
+            trending_up = trend.keyword_pairs_above(7.0)
+            trending_down = trend.keyword_pairs_below(4.0)
+
+            if trending_up:
+                trending_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_up[:3]])
+                buf.write(f"\n\n**热门关键词：** {trending_keywords} - 这些关键词显示出强劲的上升趋势，值得重点关注。")
+
+            if trending_down:
+                declining_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_down[:3]])
+                buf.write(f"\n\n**热度下降：** {declining_keywords} - 这些关键词的关注度有所下降，可能反映了话题重点的转移。")
 
-    def _generate_comprehensive_recommendations(self, task, trend_result: Dict[str, Any]) -> str:
+        # 新兴内容分析
+        new_topics = trend.new_topics
+        emerging_keywords = trend.emerging_keywords
+
+        if new_topics or emerging_keywords:
+            emerging_content = []
+            if new_topics:
+                emerging_content.append(f"新话题: {', '.join(new_topics[:3])}")
+            if emerging_keywords:
+                emerging_content.append(f"新关键词: {', '.join(emerging_keywords[:3])}")
+
+            buf.write(f"\n\n**新兴内容：** {'; '.join(emerging_content)} - 这些新出现的元素可能代表了该领域的最新发展方向。")
+
+        # 数据可靠性
+        buf.write("\n\n")
+        buf.write(_CONFIDENCE_ANALYSIS_TPLS[bisect_right(_CONFIDENCE_ANALYSIS_TH, confidence_score)].format(score=confidence_score))
+
+        return buf.getvalue()
+
+    def _generate_comprehensive_recommendations(self, task, trend: TrendView) -> str:
         """生成综合性建议和后续关注重点"""
-        try:
-            recommendations = []
-            
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            new_topics = trend_result.get("new_topics", [])
-            emerging_keywords = trend_result.get("emerging_keywords", [])
-            anomaly_detected = trend_result.get("anomaly_detected", False)
-            
-            # 基于趋势的建议
-            if trend_score > 8.0:
-                recommendations.append("**立即行动建议：** 当前趋势非常强劲，建议密切关注最新发展，考虑加大投入或提高关注优先级。这可能是一个重要的发展窗口期。")
-            elif trend_score > 6.0:
-                recommendations.append("**持续关注建议：** 趋势向好，建议保持当前的监测频率，及时跟进相关动态，适时调整策略方向。")
-            elif trend_score < 3.0:
-                recommendations.append("**策略调整建议：** 当前趋势走低，建议评估是否需要调整研究方向或重新定位关注重点，可能需要寻找新的切入角度。")
-            else:
-                recommendations.append("**稳定监测建议：** 趋势相对稳定，建议继续定期监测，关注潜在的变化信号和新兴发展方向。")
-            
-            # 基于活跃度的建议
-            if activity_level > 8.0:
-                recommendations.append("**实时跟进：** 当前活跃度极高，信息更新频繁，建议启用实时监测模式，确保不错过重要信息和发展动向。")
-            elif activity_level < 3.0:
-                recommendations.append("**信息源优化：** 活跃度较低，建议扩展信息源范围，调整搜索关键词组合，或缩短监测间隔以捕获更多动态。")
-            
-            # 基于新内容的建议
-            if len(new_topics) > 2 or len(emerging_keywords) > 3:
-                focus_areas = []
-                if new_topics:
-                    focus_areas.extend(new_topics[:3])
-                if emerging_keywords:
-                    focus_areas.extend(emerging_keywords[:3])
-                
-                unique_areas = list(dict.fromkeys(focus_areas))[:4]
-                recommendations.append(f"**新兴领域关注：** 发现了多个新的发展方向，建议重点关注以下领域：{', '.join(unique_areas)}。这些可能代表了未来的重要发展趋势。")
-            
-            # 基于异常的建议
-            if anomaly_detected:
-                anomaly_desc = trend_result.get("anomaly_description", "")
-                recommendations.append(f"**异常情况处理：** 检测到异常变化模式 - {anomaly_desc}。建议立即进行深度分析，了解变化原因，评估对整体趋势的影响。")
-            
-            # 监测优化建议
-            if task.interval_hours > 24:
-                recommendations.append("**监测频率优化：** 考虑将监测间隔从当前的{}小时缩短至12-24小时，以获取更及时的信息和趋势变化。".format(task.interval_hours))
-            
-            # 关键词优化建议
-            keyword_trends = trend_result.get("keyword_trends", {})
-            if keyword_trends:
-                low_performing = [k for k, v in keyword_trends.items() if v < 3.0]
-                if low_performing and len(low_performing) > 1:
-                    recommendations.append(f"**关键词优化：** 以下关键词表现较差：{', '.join(low_performing[:2])}。建议考虑替换为更相关或更具时效性的关键词。")
-            
-            # 默认建议
-            if not recommendations:
-                recommendations.append("**持续优化：** 继续保持当前的监测策略，定期评估和调整关键词设置，关注行业发展趋势和新兴话题。")
-            
-            return '\n\n'.join(recommendations[:4])  # 最多返回4个详细建议
+        recommendations = []
+
+        trend_score = trend.trend_score
+        activity_level = trend.activity_level
+        new_topics = trend.new_topics
+        emerging_keywords = trend.emerging_keywords
+        
+        # 基于趋势的建议
+        if trend_score > 8.0:
+            recommendations.append("**立即行动建议：** 当前趋势非常强劲，建议密切关注最新发展，考虑加大投入或提高关注优先级。这可能是一个重要的发展窗口期。")
+        elif trend_score > 6.0:
+            recommendations.append("**持续关注建议：** 趋势向好，建议保持当前的监测频率，及时跟进相关动态，适时调整策略方向。")
+        elif trend_score < 3.0:
+            recommendations.append("**策略调整建议：** 当前趋势走低，建议评估是否需要调整研究方向或重新定位关注重点，可能需要寻找新的切入角度。")
+        else:
+            recommendations.append("**稳定监测建议：** 趋势相对稳定，建议继续定期监测，关注潜在的变化信号和新兴发展方向。")
+        
+        # 基于活跃度的建议
+        if activity_level > 8.0:
+            recommendations.append("**实时跟进：** 当前活跃度极高，信息更新频繁，建议启用实时监测模式，确保不错过重要信息和发展动向。")
+        elif activity_level < 3.0:
+            recommendations.append("**信息源优化：** 活跃度较低，建议扩展信息源范围，调整搜索关键词组合，或缩短监测间隔以捕获更多动态。")
+        
+        # 基于新内容的建议
+        if len(new_topics) > 2 or len(emerging_keywords) > 3:
+            focus_areas = []
+            if new_topics:
+                focus_areas.extend(new_topics[:3])
+            if emerging_keywords:
+                focus_areas.extend(emerging_keywords[:3])
             
-        except Exception as e:
-            logger.error(f"Comprehensive recommendations generation failed: {e}")
-            return "正在生成个性化建议，请稍后查看详细内容。"
+            unique_areas = _dedup_keep_order(focus_areas)[:4]
+            recommendations.append(f"**新兴领域关注：** 发现了多个新的发展方向，建议重点关注以下领域：{', '.join(unique_areas)}。这些可能代表了未来的重要发展趋势。")
+        
+        # 基于异常的建议
+        if trend.anomaly_detected:
+            recommendations.append(f"**异常情况处理：** 检测到异常变化模式 - {trend.anomaly_description}。建议立即进行深度分析，了解变化原因，评估对整体趋势的影响。")
+        
+        # 监测优化建议
+        if task.interval_hours > 24:
+            recommendations.append("**监测频率优化：** 考虑将监测间隔从当前的{}小时缩短至12-24小时，以获取更及时的信息和趋势变化。".format(task.interval_hours))
+        
+        # 关键词优化建议
+        if trend.keyword_trends:
+            low_performing = trend.keywords_below(3.0)
+            if low_performing and len(low_performing) > 1:
+                recommendations.append(f"**关键词优化：** 以下关键词表现较差：{', '.join(low_performing[:2])}。建议考虑替换为更相关或更具时效性的关键词。")
+        
+        # 默认建议
+        if not recommendations:
+            recommendations.append("**持续优化：** 继续保持当前的监测策略，定期评估和调整关键词设置，关注行业发展趋势和新兴话题。")
+        
+        return '\n\n'.join(recommendations[:4])  # 最多返回4个详细建议
 
-    def _extract_detailed_findings(self, research_result: Dict[str, Any], trend_result: Dict[str, Any]) -> List[str]:
+    def _extract_detailed_findings(self, research_result: Dict[str, Any], trend: TrendView) -> List[str]:
         """提取详细的关键发现"""
-        try:
-            findings = []
-            
-            # 从研究结果中提取详细发现
-            report = research_result.get("report", "")
-            if report:
-                # 寻找包含关键信息的完整段落或句群
-                paragraphs = [p.strip() for p in report.split('\n\n') if p.strip()]
-                if not paragraphs:
-                    # 如果没有段落分割，尝试按句号分割
-                    sentences = [s.strip() for s in report.split("。") if s.strip()]
-                    paragraphs = []
-                    temp_paragraph = []
-                    for sentence in sentences:
-                        temp_paragraph.append(sentence)
-                        if len("。".join(temp_paragraph)) > 150:  # 组合成段落
-                            paragraphs.append("。".join(temp_paragraph) + "。")
-                            temp_paragraph = []
-                    if temp_paragraph:  # 添加剩余内容
+        findings = []
+        
+        # 从研究结果中提取详细发现
+        report = research_result.get("report", "")
+        if report:
+            # 寻找包含关键信息的完整段落或句群（单次正则扫描分段）
+            paragraphs = [p for p in map(str.strip, _PARA_RE.split(report)) if p]
+            if not paragraphs:
+                # 如果没有段落分割，尝试按句号分割
+                sentences = [s.strip() for s in report.split("。") if s.strip()]
+                paragraphs = []
+                temp_paragraph = []
+                for sentence in sentences:
+                    temp_paragraph.append(sentence)
+                    if len("。".join(temp_paragraph)) > 150:  # 组合成段落
                         paragraphs.append("。".join(temp_paragraph) + "。")
-                
-                # 筛选重要的发现
-                important_keywords = ["突破", "创新", "发展", "增长", "下降", "变化", "趋势", "影响", "重要", "关键", "显著", "主要", "新兴", "提升", "改善", "挑战"]
-                
-                for paragraph in paragraphs[:15]:  # 检查前15个段落
-                    if 30 <= len(paragraph) <= 200:  # 长度适中
-                        keyword_count = sum(1 for keyword in important_keywords if keyword in paragraph)
-                        if keyword_count >= 1:  # 包含关键词
-                            findings.append(f"**研究发现：** {paragraph}")
-                        if len(findings) >= 3:  # 限制研究发现数量
-                            break
-            
-            # 从趋势分析中提取详细信息
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            
-            # 添加趋势发现
-            if trend_score > 7.5:
-                findings.append(f"**趋势发现：** 该话题呈现强劲上升趋势（评分: {trend_score:.1f}/10），表明正在获得越来越多的关注和讨论，可能正处于重要的发展节点。")
-            elif trend_score < 3.5:
-                findings.append(f"**趋势发现：** 该话题出现下降趋势（评分: {trend_score:.1f}/10），关注度和讨论热度有所减少，可能需要重新评估其发展前景或寻找新的关注角度。")
-            
-            # 添加新内容发现
-            new_topics = trend_result.get("new_topics", [])
-            emerging_keywords = trend_result.get("emerging_keywords", [])
-            
-            if new_topics or emerging_keywords:
-                new_content = []
-                if new_topics:
-                    new_content.append(f"新话题: {', '.join(new_topics[:3])}")
-                if emerging_keywords:
-                    new_content.append(f"新关键词: {', '.join(emerging_keywords[:3])}")
-                
-                findings.append(f"**新兴内容发现：** {'; '.join(new_content)}。这些新出现的内容可能代表了该领域的最新发展方向和创新点，值得深入关注和分析。")
-            
-            # 添加异常发现
-            if trend_result.get("anomaly_detected"):
-                anomaly_desc = trend_result.get("anomaly_description", "检测到异常变化模式")
-                findings.append(f"**异常现象发现：** {anomaly_desc}。这种异常变化可能意味着重要的转折点或突发事件，建议进行深入分析以了解其影响和意义。")
-            
-            # 添加情感趋势发现
-            sentiment_changes = trend_result.get("sentiment_changes", {})
-            significant_sentiment_changes = []
-            for sentiment_type, data in sentiment_changes.items():
-                if isinstance(data, dict) and abs(data.get("change", 0.0)) > 0.15:
-                    direction = "上升" if data.get("change", 0) > 0 else "下降"
-                    change_percent = abs(data.get("change", 0.0)) * 100
-                    significant_sentiment_changes.append(f"{sentiment_type}情感{direction}{change_percent:.1f}%")
-            
-            if significant_sentiment_changes:
-                findings.append(f"**情感趋势发现：** {', '.join(significant_sentiment_changes)}。这些情感变化反映了公众对该话题态度的转变，可能影响其未来发展轨迹。")
-            
-            return findings[:4]  # 最多返回4个详细发现
+                        temp_paragraph = []
+                if temp_paragraph:  # 添加剩余内容
+                    paragraphs.append("。".join(temp_paragraph) + "。")
+            
+            # 筛选重要的发现
+            for paragraph in paragraphs[:15]:  # 检查前15个段落
+                if 30 <= len(paragraph) <= 200:  # 长度适中
+                    if _FINDING_KW_RE.search(paragraph):  # 包含关键词
+                        findings.append(f"**研究发现：** {paragraph}")
+                    if len(findings) >= 3:  # 限制研究发现数量
+                        break
+        
+        # 从趋势分析中提取详细信息
+        trend_score = trend.trend_score
+
+        # 添加趋势发现
+        if trend_score > 7.5:
+            findings.append(f"**趋势发现：** 该话题呈现强劲上升趋势（评分: {trend_score:.1f}/10），表明正在获得越来越多的关注和讨论，可能正处于重要的发展节点。")
+        elif trend_score < 3.5:
+            findings.append(f"**趋势发现：** 该话题出现下降趋势（评分: {trend_score:.1f}/10），关注度和讨论热度有所减少，可能需要重新评估其发展前景或寻找新的关注角度。")
+        
+        # 添加新内容发现
+        new_topics = trend.new_topics
+        emerging_keywords = trend.emerging_keywords
+
+        if new_topics or emerging_keywords:
+            new_content = []
+            if new_topics:
+                new_content.append(f"新话题: {', '.join(new_topics[:3])}")
+            if emerging_keywords:
+                new_content.append(f"新关键词: {', '.join(emerging_keywords[:3])}")
             
-        except Exception as e:
-            logger.error(f"Detailed findings extraction failed: {e}")
-            return ["正在深入分析最新数据和发展趋势，详细发现即将生成。"]
-    
-    def _identify_detailed_changes(self, trend_result: Dict[str, Any]) -> List[str]:
+            findings.append(f"**新兴内容发现：** {'; '.join(new_content)}。这些新出现的内容可能代表了该领域的最新发展方向和创新点，值得深入关注和分析。")
+        
+        # 添加异常发现
+        if trend.anomaly_detected:
+            anomaly_desc = trend.anomaly_description or "检测到异常变化模式"
+            findings.append(f"**异常现象发现：** {anomaly_desc}。这种异常变化可能意味着重要的转折点或突发事件，建议进行深入分析以了解其影响和意义。")
+
+        # 添加情感趋势发现
+        significant_sentiment_changes = []
+        for sentiment_type, data in trend.sentiment_changes.items():
+            if isinstance(data, dict) and abs(data.get("change", 0.0)) > 0.15:
+                direction = "上升" if data.get("change", 0) > 0 else "下降"
+                change_percent = abs(data.get("change", 0.0)) * 100
+                significant_sentiment_changes.append(f"{sentiment_type}情感{direction}{change_percent:.1f}%")
+        
+        if significant_sentiment_changes:
+            findings.append(f"**情感趋势发现：** {', '.join(significant_sentiment_changes)}。这些情感变化反映了公众对该话题态度的转变，可能影响其未来发展轨迹。")
+        
+        return findings[:4]  # 最多返回4个详细发现
+
+    def _identify_detailed_changes(self, trend: TrendView) -> List[str]:
         """识别详细的关键变化"""
-        try:
-            changes = []
-            
-            # 详细的情感变化分析
-            sentiment_changes = trend_result.get("sentiment_changes", {})
-            significant_sentiment_changes = []
-            for sentiment_type, data in sentiment_changes.items():
-                if isinstance(data, dict):
-                    change = data.get("change", 0.0)
-                    current = data.get("current", 0.0)
-                    historical_avg = data.get("historical_avg", 0.0)
-                    trend = data.get("trend", "stable")
-                    
-                    if abs(change) > 0.1:  # 显著变化阈值
-                        direction = "上升" if change > 0 else "下降"
-                        change_desc = f"{sentiment_type}情感{direction}{abs(change):.1%}"
-                        
-                        # 添加更详细的分析
-                        if sentiment_type == "positive" and change > 0:
-                            analysis = f"正面情绪显著上升（从{historical_avg:.1%}提升至{current:.1%}），表明公众对该话题的态度趋向积极，可能反映了好消息或积极发展。"
-                        elif sentiment_type == "negative" and change > 0:
-                            analysis = f"负面情绪有所增加（从{historical_avg:.1%}上升至{current:.1%}），需要关注可能存在的问题或争议，建议深入了解负面情绪的来源。"
-                        elif sentiment_type == "positive" and change < 0:
-                            analysis = f"正面情绪出现下滑（从{historical_avg:.1%}降至{current:.1%}），可能表明热度减退或出现了一些不利因素。"
-                        elif sentiment_type == "negative" and change < 0:
-                            analysis = f"负面情绪有所缓解（从{historical_avg:.1%}降至{current:.1%}），表明争议或问题得到一定程度的解决或关注度下降。"
-                        else:
-                            analysis = f"{sentiment_type}情绪发生了{abs(change):.1%}的变化，从{historical_avg:.1%}变化至{current:.1%}。"
-                        
-                        changes.append(f"**情感变化：** {analysis}")
-            
-            # 详细的话题演变分析  
-            topic_evolution = trend_result.get("topic_evolution", {})
-            new_topics = topic_evolution.get("new_topics", [])
-            disappeared_topics = topic_evolution.get("disappeared_topics", [])
-            persistent_topics = topic_evolution.get("persistent_topics", [])
-            evolution_rate = topic_evolution.get("evolution_rate", 0.0)
-            
-            if new_topics or disappeared_topics:
-                evolution_analysis = []
-                if new_topics:
-                    evolution_analysis.append(f"新出现{len(new_topics)}个相关话题：{', '.join(new_topics[:3])}")
-                if disappeared_topics:
-                    evolution_analysis.append(f"有{len(disappeared_topics)}个话题热度消退：{', '.join(disappeared_topics[:2])}")
-                
-                evolution_desc = f"话题演变率为{evolution_rate:.1%}，"
-                if evolution_rate > 0.3:
-                    evolution_desc += "表明该领域正经历快速变化，新的发展方向不断涌现。"
-                elif evolution_rate > 0.1:
-                    evolution_desc += "表明该领域在稳步发展，有新的关注点出现。"
-                else:
-                    evolution_desc += "表明该领域相对稳定，核心话题保持一致。"
-                
-                changes.append(f"**话题演变：** {'; '.join(evolution_analysis)}。{evolution_desc}")
-            
-            # 详细的关键词趋势变化分析
-            keyword_trends = trend_result.get("keyword_trends", {})
-            if keyword_trends:
-                trending_up = [(k, v) for k, v in keyword_trends.items() if v > 7.5]
-                trending_down = [(k, v) for k, v in keyword_trends.items() if v < 3.5]
-                stable_keywords = [(k, v) for k, v in keyword_trends.items() if 4.0 <= v <= 7.0]
-                
-                if trending_up or trending_down:
-                    trend_analysis = []
-                    if trending_up:
-                        up_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_up[:3]])
-                        trend_analysis.append(f"热度上升的关键词：{up_keywords}，这些关键词正获得更多关注")
-                    
-                    if trending_down:
-                        down_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_down[:3]])
-                        trend_analysis.append(f"热度下降的关键词：{down_keywords}，可能反映了关注点的转移")
+        changes = []
+
+        # 详细的情感变化分析
+        significant_sentiment_changes = []
+        for sentiment_type, data in trend.sentiment_changes.items():
+            if isinstance(data, dict):
+                change = data.get("change", 0.0)
+                current = data.get("current", 0.0)
+                historical_avg = data.get("historical_avg", 0.0)
+                sentiment_trend = data.get("trend", "stable")
+
+                if abs(change) > 0.1:  # 显著变化阈值
+                    direction = "上升" if change > 0 else "下降"
+                    change_desc = f"{sentiment_type}情感{direction}{abs(change):.1%}"
                     
-                    stability_desc = ""
-                    if stable_keywords:
-                        stability_desc = f"同时有{len(stable_keywords)}个关键词保持稳定表现。"
+                    # 添加更详细的分析
+                    if sentiment_type == "positive" and change > 0:
+                        analysis = f"正面情绪显著上升（从{historical_avg:.1%}提升至{current:.1%}），表明公众对该话题的态度趋向积极，可能反映了好消息或积极发展。"
+                    elif sentiment_type == "negative" and change > 0:
+                        analysis = f"负面情绪有所增加（从{historical_avg:.1%}上升至{current:.1%}），需要关注可能存在的问题或争议，建议深入了解负面情绪的来源。"
+                    elif sentiment_type == "positive" and change < 0:
+                        analysis = f"正面情绪出现下滑（从{historical_avg:.1%}降至{current:.1%}），可能表明热度减退或出现了一些不利因素。"
+                    elif sentiment_type == "negative" and change < 0:
+                        analysis = f"负面情绪有所缓解（从{historical_avg:.1%}降至{current:.1%}），表明争议或问题得到一定程度的解决或关注度下降。"
+                    else:
+                        analysis = f"{sentiment_type}情绪发生了{abs(change):.1%}的变化，从{historical_avg:.1%}变化至{current:.1%}。"
                     
-                    changes.append(f"**关键词趋势：** {'; '.join(trend_analysis)}。{stability_desc}")
-            
-            # 详细的活跃度变化分析
-            activity_level = trend_result.get("activity_level", 5.0)
-            change_magnitude = trend_result.get("change_magnitude", 0.0)
+                    changes.append(f"**情感变化：** {analysis}")
+        
+        # 详细的话题演变分析
+        topic_evolution = trend.topic_evolution
+        new_topics = topic_evolution.get("new_topics", [])
+        disappeared_topics = topic_evolution.get("disappeared_topics", [])
+        persistent_topics = topic_evolution.get("persistent_topics", [])
+        evolution_rate = topic_evolution.get("evolution_rate", 0.0)
+        
+        if new_topics or disappeared_topics:
+            evolution_analysis = []
+            if new_topics:
+                evolution_analysis.append(f"新出现{len(new_topics)}个相关话题：{', '.join(new_topics[:3])}")
+            if disappeared_topics:
+                evolution_analysis.append(f"有{len(disappeared_topics)}个话题热度消退：{', '.join(disappeared_topics[:2])}")
+            
+            evolution_desc = f"话题演变率为{evolution_rate:.1%}，"
+            if evolution_rate > 0.3:
+                evolution_desc += "表明该领域正经历快速变化，新的发展方向不断涌现。"
+            elif evolution_rate > 0.1:
+                evolution_desc += "表明该领域在稳步发展，有新的关注点出现。"
+            else:
+                evolution_desc += "表明该领域相对稳定，核心话题保持一致。"
             
-            if activity_level > 8.0 or change_magnitude > 6.0:
-                if activity_level > 8.0:
-                    activity_desc = f"整体活跃度达到高水平（{activity_level:.1f}/10），信息更新频繁，讨论热度很高"
-                else:
-                    activity_desc = f"虽然活跃度为{activity_level:.1f}/10，但变化幅度较大（{change_magnitude:.1f}/10）"
+            changes.append(f"**话题演变：** {'; '.join(evolution_analysis)}。{evolution_desc}")
+        
+        # 详细的关键词趋势变化分析
+        if trend.keyword_trends:
+            trending_up = trend.keyword_pairs_above(7.5)
+            trending_down = trend.keyword_pairs_below(3.5)
+            stable_count = trend.keywords_between_count(4.0, 7.0)
+            
+            if trending_up or trending_down:
+                trend_analysis = []
+                if trending_up:
+                    up_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_up[:3]])
+                    trend_analysis.append(f"热度上升的关键词：{up_keywords}，这些关键词正获得更多关注")
                 
-                impact_analysis = "这种高活跃度通常意味着该话题正处于关键发展期，建议密切关注后续动态。"
-                changes.append(f"**活跃度变化：** {activity_desc}。{impact_analysis}")
+                if trending_down:
+                    down_keywords = ', '.join([f"{k}({v:.1f})" for k, v in trending_down[:3]])
+                    trend_analysis.append(f"热度下降的关键词：{down_keywords}，可能反映了关注点的转移")
                 
-            elif activity_level < 3.0:
-                activity_desc = f"整体活跃度较低（{activity_level:.1f}/10），相关讨论和信息更新不够频繁"
-                suggestion = "建议考虑调整监测关键词或扩大信息源范围，以获取更多相关动态。"
-                changes.append(f"**活跃度变化：** {activity_desc}。{suggestion}")
-            
-            return changes[:3]  # 最多返回3个详细变化分析
-            
-        except Exception as e:
-            logger.error(f"Detailed changes identification failed: {e}")
-            return ["正在深入分析变化趋势，详细分析即将完成。"]
-    
-    def _generate_trend_summary(self, trend_result: Dict[str, Any]) -> str:
-        """生成趋势摘要"""
-        try:
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            change_magnitude = trend_result.get("change_magnitude", 0.0)
-            confidence_score = trend_result.get("confidence_score", 0.5)
-            
-            # 趋势描述
-            if trend_score > 7.5:
-                trend_desc = "强劲上升趋势"
-            elif trend_score > 6.0:
-                trend_desc = "温和上升趋势"
-            elif trend_score < 3.5:
-                trend_desc = "下降趋势"
-            elif trend_score < 4.5:
-                trend_desc = "温和下降趋势"
-            else:
-                trend_desc = "稳定趋势"
-            
-            # 活跃度描述
-            if activity_level > 7.0:
-                activity_desc = "高度活跃"
-            elif activity_level > 5.5:
-                activity_desc = "中等活跃"
-            else:
-                activity_desc = "活跃度一般"
-            
-            # 变化程度描述
-            if change_magnitude > 7.0:
-                change_desc = "剧烈变化"
-            elif change_magnitude > 4.0:
-                change_desc = "明显变化"
-            else:
-                change_desc = "轻微变化"
-            
-            # 置信度描述
-            if confidence_score > 0.8:
-                confidence_desc = "高置信度"
-            elif confidence_score > 0.5:
-                confidence_desc = "中等置信度"
+                stability_desc = ""
+                if stable_count:
+                    stability_desc = f"同时有{stable_count}个关键词保持稳定表现。"
+                
+                changes.append(f"**关键词趋势：** {'; '.join(trend_analysis)}。{stability_desc}")
+        
+        # 详细的活跃度变化分析
+        activity_level = trend.activity_level
+        change_magnitude = trend.change_magnitude
+        
+        if activity_level > 8.0 or change_magnitude > 6.0:
+            if activity_level > 8.0:
+                activity_desc = f"整体活跃度达到高水平（{activity_level:.1f}/10），信息更新频繁，讨论热度很高"
             else:
-                confidence_desc = "低置信度"
-            
-            summary = f"趋势评估: {trend_desc} | 活跃程度: {activity_desc} | 变化程度: {change_desc} | 数据可靠性: {confidence_desc}"
-            
-            # 添加评分
-            summary += f"\n评分详情: 趋势 {trend_score:.1f}/10, 活跃度 {activity_level:.1f}/10, 变化幅度 {change_magnitude:.1f}/10"
+                activity_desc = f"虽然活跃度为{activity_level:.1f}/10，但变化幅度较大（{change_magnitude:.1f}/10）"
             
-            return summary
+            impact_analysis = "这种高活跃度通常意味着该话题正处于关键发展期，建议密切关注后续动态。"
+            changes.append(f"**活跃度变化：** {activity_desc}。{impact_analysis}")
             
-        except Exception as e:
-            logger.error(f"Trend summary generation failed: {e}")
-            return "趋势分析: 数据分析中，请稍后查看详细结果"
-    
-    def _determine_priority_level(self, trend_result: Dict[str, Any]) -> str:
+        elif activity_level < 3.0:
+            activity_desc = f"整体活跃度较低（{activity_level:.1f}/10），相关讨论和信息更新不够频繁"
+            suggestion = "建议考虑调整监测关键词或扩大信息源范围，以获取更多相关动态。"
+            changes.append(f"**活跃度变化：** {activity_desc}。{suggestion}")
+        
+        return changes[:3]  # 最多返回3个详细变化分析
+
+    def _generate_trend_summary(self, trend: TrendView) -> str:
+        """生成趋势摘要"""
+        trend_score = trend.trend_score
+        activity_level = trend.activity_level
+        change_magnitude = trend.change_magnitude
+        confidence_score = trend.confidence_score
+        
+        # 各维度按阈值表取档
+        trend_desc = _TREND_DESC_LABELS[bisect_right(_TREND_DESC_TH, trend_score)]
+        activity_desc = _ACTIVITY_DESC_LABELS[bisect_right(_ACTIVITY_DESC_TH, activity_level)]
+        change_desc = _CHANGE_DESC_LABELS[bisect_right(_CHANGE_DESC_TH, change_magnitude)]
+        confidence_desc = _CONFIDENCE_DESC_LABELS[bisect_right(_CONFIDENCE_DESC_TH, confidence_score)]
+        
+        summary = f"趋势评估: {trend_desc} | 活跃程度: {activity_desc} | 变化程度: {change_desc} | 数据可靠性: {confidence_desc}"
+        
+        # 添加评分
+        summary += f"\n评分详情: 趋势 {trend_score:.1f}/10, 活跃度 {activity_level:.1f}/10, 变化幅度 {change_magnitude:.1f}/10"
+        
+        return summary
+
+    def _determine_priority_level(self, trend: TrendView) -> str:
         """确定优先级级别"""
-        try:
-            trend_score = trend_result.get("trend_score", 5.0)
-            change_magnitude = trend_result.get("change_magnitude", 0.0)
-            anomaly_detected = trend_result.get("anomaly_detected", False)
-            
-            # 异常检测到，高优先级
-            if anomaly_detected:
-                return "high"
-            
-            # 高趋势分数或大变化幅度
-            if trend_score > 8.0 or change_magnitude > 7.0:
-                return "high"
-            
-            # 低趋势分数，中优先级
-            if trend_score < 3.0:
-                return "medium"
-            
-            # 有一定变化，中优先级
-            if change_magnitude > 4.0:
-                return "medium"
-            
-            # 其他情况，低优先级
-            return "low"
-            
-        except Exception as e:
-            logger.error(f"Priority level determination failed: {e}")
-            return "medium"
-    
-    def _generate_action_recommendations(self, task, trend_result: Dict[str, Any]) -> List[str]:
+        # 异常检测到，高优先级
+        if trend.anomaly_detected:
+            return "high"
+
+        # 趋势分与变化幅度各自取档，取两者中更高的等级
+        trend_rank = _PRIORITY_TREND_RANKS[bisect_right(_PRIORITY_TREND_TH, trend.trend_score)]
+        change_rank = _PRIORITY_CHANGE_RANKS[bisect_right(_PRIORITY_CHANGE_TH, trend.change_magnitude)]
+        return _PRIORITY_LEVELS[max(trend_rank, change_rank)]
+
+    def _generate_action_recommendations(self, task, trend: TrendView) -> List[str]:
         """生成行动建议"""
-        try:
-            recommendations = []
-            
-            trend_score = trend_result.get("trend_score", 5.0)
-            activity_level = trend_result.get("activity_level", 5.0)
-            new_topics = trend_result.get("new_topics", [])
-            anomaly_detected = trend_result.get("anomaly_detected", False)
-            
-            # 基于趋势分数的建议
-            if trend_score > 8.0:
-                recommendations.append("密切关注当前发展，考虑加大投入或关注力度")
-            elif trend_score < 3.0:
-                recommendations.append("评估是否需要调整策略或重新定位关注重点")
-            
-            # 基于活跃度的建议
-            if activity_level > 8.0:
-                recommendations.append("当前活跃度很高，建议及时跟进最新动态")
-            elif activity_level < 3.0:
-                recommendations.append("活跃度较低，可能需要寻找新的信息源或调整关键词")
-            
-            # 基于新话题的建议
-            if len(new_topics) > 3:
-                recommendations.append(f"出现多个新话题，建议深入研究: {', '.join(new_topics[:2])}")
-            
-            # 基于异常的建议
-            if anomaly_detected:
-                recommendations.append("检测到异常变化，建议立即进行深度分析")
-            
-            # 基于任务配置的建议
-            if task.interval_hours > 24:
-                recommendations.append("考虑缩短监测间隔以获取更及时的信息")
-            
-            # 默认建议
-            if not recommendations:
-                recommendations.append("继续定期监测，关注趋势变化")
-            
-            return recommendations[:3]  # 最多返回3个建议
-            
-        except Exception as e:
-            logger.error(f"Action recommendations generation failed: {e}")
-            return ["继续监测话题发展趋势"]
-    
-    def _suggest_next_focus_areas(self, trend_result: Dict[str, Any]) -> List[str]:
+        recommendations = []
+
+        trend_score = trend.trend_score
+        activity_level = trend.activity_level
+        new_topics = trend.new_topics
+        anomaly_detected = trend.anomaly_detected
+        
+        # 基于趋势分数的建议
+        if trend_score > 8.0:
+            recommendations.append("密切关注当前发展，考虑加大投入或关注力度")
+        elif trend_score < 3.0:
+            recommendations.append("评估是否需要调整策略或重新定位关注重点")
+        
+        # 基于活跃度的建议
+        if activity_level > 8.0:
+            recommendations.append("当前活跃度很高，建议及时跟进最新动态")
+        elif activity_level < 3.0:
+            recommendations.append("活跃度较低，可能需要寻找新的信息源或调整关键词")
+        
+        # 基于新话题的建议
+        if len(new_topics) > 3:
+            recommendations.append(f"出现多个新话题，建议深入研究: {', '.join(new_topics[:2])}")
+        
+        # 基于异常的建议
+        if anomaly_detected:
+            recommendations.append("检测到异常变化，建议立即进行深度分析")
+        
+        # 基于任务配置的建议
+        if task.interval_hours > 24:
+            recommendations.append("考虑缩短监测间隔以获取更及时的信息")
+        
+        # 默认建议
+        if not recommendations:
+            recommendations.append("继续定期监测，关注趋势变化")
+        
+        return recommendations[:3]  # 最多返回3个建议
+
+    def _suggest_next_focus_areas(self, trend: TrendView) -> List[str]:
         """推荐下一步关注领域"""
-        try:
-            focus_areas = []
-            
-            # 基于新话题
-            new_topics = trend_result.get("new_topics", [])
-            if new_topics:
-                focus_areas.extend(new_topics[:2])
-            
-            # 基于新兴关键词
-            emerging_keywords = trend_result.get("emerging_keywords", [])
-            if emerging_keywords:
-                focus_areas.extend(emerging_keywords[:2])
-            
-            # 基于趋势上升的关键词
-            keyword_trends = trend_result.get("keyword_trends", {})
-            trending_keywords = [k for k, v in keyword_trends.items() if v > 7.5]
-            if trending_keywords:
-                focus_areas.extend(trending_keywords[:2])
-            
-            # 去重并限制数量
-            unique_focus_areas = list(dict.fromkeys(focus_areas))  # 保持顺序的去重
-            
-            return unique_focus_areas[:4]  # 最多返回4个关注领域
-            
-        except Exception as e:
-            logger.error(f"Next focus areas suggestion failed: {e}")
-            return ["相关技术发展", "市场动态变化"]
-    
+        focus_areas = []
+
+        # 基于新话题
+        if trend.new_topics:
+            focus_areas.extend(trend.new_topics[:2])
+
+        # 基于新兴关键词
+        if trend.emerging_keywords:
+            focus_areas.extend(trend.emerging_keywords[:2])
+
+        # 基于趋势上升的关键词
+        trending_keywords = trend.keywords_above(7.5)
+        if trending_keywords:
+            focus_areas.extend(trending_keywords[:2])
+        
+        # 去重并限制数量
+        unique_focus_areas = _dedup_keep_order(focus_areas)  # 保持顺序的去重
+        
+        return unique_focus_areas[:4]  # 最多返回4个关注领域
+
     def _create_fallback_summary(self, research_result: Dict[str, Any], task) -> Dict[str, Any]:
         """创建后备摘要（出错时）"""
         report = research_result.get("report", "")
@@ -12,7 +12,7 @@ from typing import Dict, List, Optional, Any
 from gpt_researcher.agent import GPTResearcher
 from gpt_researcher.utils.enum import ReportType, ReportSource, Tone
 
-from ..database import ResearchHistoryDAO, TrendDataDAO, TaskExecutionLogDAO
+from ..database import ResearchHistoryDAO, TrendDataDAO, TaskExecutionLogDAO, HistoryCreate
 from ..server.content_safety import ContentSafetyChecker
 from .trend_analyzer import TopicTrendAnalyzer
 from .summary_generator import DynamicSummaryGenerator
@@ -37,6 +37,9 @@ class ResearchTaskExecutor:
         self.websocket_manager = websocket_manager
         self.trend_analyzer = TopicTrendAnalyzer()
         self.summary_generator = DynamicSummaryGenerator()
+        # 同查询研究的single-flight合并：多个任务共用主题/关键词/深度时，
+        # 同时到期只跑一条研究管线，其余任务等待同一结果再各自写日志/历史
+        self._inflight_research: Dict[tuple, asyncio.Future] = {}
     
     async def execute_task(self, task, execution_log_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -57,18 +60,16 @@ class ResearchTaskExecutor:
             "summary": "",
             "key_changes": [],
             "trend_score": 0.0,
-            "sources_count": 0,
-            "log_messages": []
+            "sources_count": 0
         }
         
         try:
             logger.info(f"Starting research task execution: {task.topic}")
             
             # 更新执行日志
-            await self._update_execution_log(execution_log_id, {
+            await self._append_log_message(execution_log_id, "Starting research phase", {
                 "execution_step": "research_phase",
-                "progress_percentage": 10.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": "Starting research phase"}]
+                "progress_percentage": 10.0
             })
             
             # 第一阶段：执行研究
@@ -78,20 +79,18 @@ class ResearchTaskExecutor:
                 return result
             
             # 更新执行日志
-            await self._update_execution_log(execution_log_id, {
+            await self._append_log_message(execution_log_id, "Research completed, starting analysis", {
                 "execution_step": "analysis_phase",
-                "progress_percentage": 60.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": "Research completed, starting analysis"}]
+                "progress_percentage": 60.0
             })
             
             # 第二阶段：趋势分析
             trend_result = await self._analyze_trends(task, research_result)
             
             # 更新执行日志
-            await self._update_execution_log(execution_log_id, {
-                "execution_step": "summary_phase", 
-                "progress_percentage": 80.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": "Trend analysis completed, generating summary"}]
+            await self._append_log_message(execution_log_id, "Trend analysis completed, generating summary", {
+                "execution_step": "summary_phase",
+                "progress_percentage": 80.0
             })
             
             # 第三阶段：生成摘要
@@ -101,10 +100,9 @@ class ResearchTaskExecutor:
             await self._save_results(task, research_result, trend_result, summary_result)
             
             # 更新执行日志
-            await self._update_execution_log(execution_log_id, {
+            await self._append_log_message(execution_log_id, "Task execution completed successfully", {
                 "execution_step": "completed",
-                "progress_percentage": 100.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": "Task execution completed successfully"}]
+                "progress_percentage": 100.0
             })
             
             # 组装最终结果
@@ -116,8 +114,7 @@ class ResearchTaskExecutor:
                 "trend_score": trend_result.get("trend_score", 0.0),
                 "sources_count": research_result.get("sources_count", 0),
                 "raw_result": research_result.get("report", ""),
-                "trend_data": trend_result,
-                "log_messages": result["log_messages"]
+                "trend_data": trend_result
             })
             
             logger.info(f"Task execution completed successfully: {task.topic}")
@@ -132,22 +129,45 @@ class ResearchTaskExecutor:
             result["execution_time"] = time.time() - start_time
             
             # 更新执行日志
-            await self._update_execution_log(execution_log_id, {
+            await self._append_log_message(execution_log_id, f"Task execution failed: {str(e)}", {
                 "execution_step": "failed",
-                "progress_percentage": 0.0,
-                "log_messages": [{"timestamp": datetime.now().isoformat(), "message": f"Task execution failed: {str(e)}"}]
+                "progress_percentage": 0.0
             })
         
         return result
     
     async def _conduct_research(self, task) -> Dict[str, Any]:
-        """执行GPT研究 - 优化版本"""
+        """执行GPT研究（同查询并发合并为一次执行）"""
+        # 规范化研究键：查询串已编码主题/关键词/深度，补上报告类型与来源
+        research_key = (
+            self._build_research_query(task),
+            task.report_type,
+            task.report_source,
+        )
+
+        # 同键研究已在执行中：等它的结果，不再重跑一遍LLM/检索管线
+        inflight = self._inflight_research.get(research_key)
+        if inflight is not None:
+            logger.info(f"Research coalesced with in-flight run: {task.topic}")
+            return await inflight
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight_research[research_key] = fut
+        try:
+            result = await self._do_conduct_research(task, research_key[0])
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight_research.pop(research_key, None)
+            # 首个调用方被取消等异常路径：让等待方同步感知，而非永久挂起
+            if not fut.done():
+                fut.cancel()
+
+    async def _do_conduct_research(self, task, query: str) -> Dict[str, Any]:
+        """研究执行主体 - 优化版本"""
         try:
             logger.info(f"Conducting research for topic: {task.topic}")
-            
-            # 构建查询字符串
-            query = self._build_research_query(task)
-            
+
             # 优化的研究参数配置
             researcher_config = {
                 "query": query,
@@ -373,7 +393,7 @@ class ResearchTaskExecutor:
         """获取历史数据用于趋势对比"""
         try:
             # 获取最近的成功记录
-            histories = ResearchHistoryDAO.get_successful_histories(task_id, limit=5)
+            histories = await ResearchHistoryDAO.get_successful_histories(task_id, limit=5)
             
             historical_data = []
             for history in histories:
@@ -395,24 +415,24 @@ class ResearchTaskExecutor:
         """保存执行结果到数据库"""
         try:
             # 保存研究历史记录
-            history_data = {
-                "task_id": task.id,
-                "raw_result": research_result.get("report", ""),
-                "summary": summary_result.get("summary", ""),
-                "key_findings": summary_result.get("key_findings", []),
-                "key_changes": summary_result.get("key_changes", []),
-                "sources_count": research_result.get("sources_count", 0),
-                "trend_score": trend_result.get("trend_score", 0.0),
-                "sentiment_score": trend_result.get("sentiment_score", 0.0),
-                "status": "success",
-                "research_config": {
+            history_data = HistoryCreate(
+                task_id=task.id,
+                raw_result=research_result.get("report", ""),
+                summary=summary_result.get("summary", ""),
+                key_findings=summary_result.get("key_findings", []),
+                key_changes=summary_result.get("key_changes", []),
+                sources_count=research_result.get("sources_count", 0),
+                trend_score=trend_result.get("trend_score", 0.0),
+                sentiment_score=trend_result.get("sentiment_score", 0.0),
+                status="success",
+                research_config={
                     "query": research_result.get("query_used", ""),
                     "analysis_depth": task.analysis_depth,
                     "source_types": task.source_types
                 }
-            }
+            )
             
-            history = ResearchHistoryDAO.create_history(history_data)
+            history = await ResearchHistoryDAO.create_history(history_data)
             logger.info(f"Saved research history: {history.id}")
             
             # 保存趋势数据
@@ -433,7 +453,7 @@ class ResearchTaskExecutor:
                     "anomaly_description": trend_result.get("anomaly_description", "")
                 }
                 
-                trend = TrendDataDAO.create_trend_data(trend_data)
+                trend = await TrendDataDAO.create_trend_data(trend_data)
                 logger.info(f"Saved trend data: {trend.id}")
             
         except Exception as e:
@@ -444,11 +464,22 @@ class ResearchTaskExecutor:
         """更新执行日志"""
         if not log_id:
             return
-        
+
         try:
-            TaskExecutionLogDAO.update_log(log_id, update_data)
+            await TaskExecutionLogDAO.update_log(log_id, update_data)
         except Exception as e:
             logger.error(f"Failed to update execution log: {e}")
+
+    async def _append_log_message(self, log_id: Optional[str], message: str,
+                                  log_update: Optional[Dict] = None):
+        """追加执行日志消息（子表纯INSERT，进度字段随同一事务更新）"""
+        if not log_id:
+            return
+
+        try:
+            await TaskExecutionLogDAO.append_log_message(log_id, message, log_update=log_update)
+        except Exception as e:
+            logger.error(f"Failed to append execution log message: {e}")
     
     async def test_research_configuration(self, task_data: Dict) -> Dict[str, Any]:
         """测试研究配置（不保存结果）"""
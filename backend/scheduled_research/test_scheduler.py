@@ -114,7 +114,7 @@ async def test_task_executor_configuration(task_id):
         executor = ResearchTaskExecutor()
         
         # 获取任务数据
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         if not task:
             raise Exception("Task not found")
         
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ..database import (
     ScheduledTaskDAO, ResearchHistoryDAO, TrendDataDAO, 
@@ -22,8 +22,12 @@ from .api_models import (
 
 logger = logging.getLogger(__name__)
 
-# 创建路由器
-router = APIRouter(prefix="/api/scheduled", tags=["scheduled-research"])
+# 创建路由器（orjson在C层序列化响应，datetime/None无需Python分支处理）
+router = APIRouter(
+    prefix="/api/scheduled",
+    tags=["scheduled-research"],
+    default_response_class=ORJSONResponse
+)
 
 # 全局调度器管理器实例
 _scheduler_manager = None
@@ -53,7 +57,7 @@ async def create_scheduled_task(
         task_id = await manager.add_task(task_data)
         
         # 获取创建的任务详情
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         
         return ApiResponse(
             success=True,
@@ -77,18 +81,18 @@ async def get_scheduled_tasks(
     try:
         logger.info(f"Getting scheduled tasks for user: {user_id}")
         
-        # 获取任务列表
-        tasks = ScheduledTaskDAO.get_tasks_by_user(user_id, active_only)
-        
+        # 获取任务列表（行映射直出dict，不构建ORM实例）
+        tasks = await ScheduledTaskDAO.list_tasks_as_dicts(user_id, active_only)
+
         # 分页处理
         total = len(tasks)
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
         paginated_tasks = tasks[start_idx:end_idx]
-        
+
         # 转换为响应格式
         task_responses = [
-            ScheduledTaskResponse.model_validate(task.to_dict()) 
+            ScheduledTaskResponse.model_validate(task)
             for task in paginated_tasks
         ]
         
@@ -109,7 +113,7 @@ async def get_scheduled_tasks(
 async def get_scheduled_task(task_id: str):
     """获取单个定时任务详情"""
     try:
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="任务不存在")
         
@@ -145,7 +149,7 @@ async def update_scheduled_task(
             raise HTTPException(status_code=404, detail="任务不存在")
         
         # 获取更新后的任务
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         
         return ApiResponse(
             success=True,
@@ -292,22 +296,22 @@ async def get_task_history(
     """获取任务执行历史"""
     try:
         # 验证任务存在
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="任务不存在")
         
-        # 获取历史记录
-        histories = ResearchHistoryDAO.get_history_by_task(task_id, limit=per_page * 10)
-        
+        # 获取历史记录（行映射直出dict，不构建ORM实例）
+        histories = await ResearchHistoryDAO.list_histories_as_dicts(task_id, limit=per_page * 10)
+
         # 分页处理
         total = len(histories)
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
         paginated_histories = histories[start_idx:end_idx]
-        
+
         # 转换为响应格式
         history_responses = [
-            ResearchHistoryResponse.model_validate(history.to_dict())
+            ResearchHistoryResponse.model_validate(history)
             for history in paginated_histories
         ]
         
@@ -336,12 +340,12 @@ async def get_task_trends(
     """获取任务趋势分析数据"""
     try:
         # 验证任务存在
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="任务不存在")
         
         # 获取趋势数据
-        trends = TrendDataDAO.get_trend_data_by_period(task_id, days)
+        trends = await TrendDataDAO.get_trend_data_by_period(task_id, days)
         
         # 分页处理
         total = len(trends)
@@ -376,12 +380,12 @@ async def get_task_statistics(task_id: str):
     """获取任务统计信息"""
     try:
         # 验证任务存在
-        task = ScheduledTaskDAO.get_task_by_id(task_id)
+        task = await ScheduledTaskDAO.get_task_by_id(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="任务不存在")
         
         # 获取统计数据
-        stats = AnalyticsDAO.get_task_statistics(task_id)
+        stats = await AnalyticsDAO.get_task_statistics(task_id)
         
         return TaskStatisticsResponse.model_validate(stats)
         
@@ -396,7 +400,7 @@ async def get_task_statistics(task_id: str):
 async def get_user_statistics(user_id: str = "default_user"):
     """获取用户统计信息"""
     try:
-        stats = AnalyticsDAO.get_user_statistics(user_id)
+        stats = await AnalyticsDAO.get_user_statistics(user_id)
         return UserStatisticsResponse.model_validate(stats)
         
     except Exception as e:
@@ -442,10 +446,10 @@ async def test_task_configuration(request: TestTaskConfigRequest):
 async def health_check():
     """健康检查端点"""
     try:
-        from ..database import check_database_connection
-        
-        # 检查数据库连接
-        db_healthy = check_database_connection()
+        from ..database import check_database_connection_async
+
+        # 检查数据库连接（结果带1秒缓存，避免探活压垮数据库）
+        db_healthy = await check_database_connection_async()
         
         # 检查调度器状态
         scheduler_healthy = True
@@ -88,6 +88,19 @@ manager = WebSocketManager()
 app.include_router(scheduled_research_router)
 
 # Middleware
+@app.middleware("http")
+async def db_session_middleware(request: Request, call_next):
+    """每个请求绑定一个数据库会话，请求内所有DAO调用复用同一连接"""
+    from ..database import AsyncSessionLocal, current_session
+
+    async with AsyncSessionLocal() as session:
+        token = current_session.set(session)
+        try:
+            return await call_next(request)
+        finally:
+            current_session.reset(token)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
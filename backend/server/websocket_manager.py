@@ -3,6 +3,8 @@ import datetime
 import json
 from typing import Dict, List
 
+import orjson
+
 from fastapi import WebSocket
 
 from ..report_type import BasicReport, DetailedReport
@@ -132,6 +134,36 @@ class WebSocketManager:
         for websocket in disconnected_websockets:
             await self.disconnect(websocket)
 
+    async def broadcast_scheduled_result_batch(self, items):
+        """Broadcast a batch of scheduled research results in one frame
+
+        多个任务在同一时间窗完成时只做一次JSON编码、每连接一次入队，
+        不再逐条发送
+        """
+        if not self.active_connections or not items:
+            return
+
+        # 批量帧走orjson：C编码器直接产出UTF-8字节，再转str入发送队列
+        message = orjson.dumps({
+            "type": "scheduled_result_batch",
+            "items": items
+        }).decode()
+
+        # 发送给所有连接的客户端
+        disconnected_websockets = []
+        for websocket in self.active_connections:
+            try:
+                queue = self.message_queues.get(websocket)
+                if queue:
+                    await queue.put(message)
+            except Exception as e:
+                print(f"Error broadcasting to websocket: {e}")
+                disconnected_websockets.append(websocket)
+
+        # 清理断开的连接
+        for websocket in disconnected_websockets:
+            await self.disconnect(websocket)
+
     async def send_scheduled_notification(self, notification_data):
         """Send scheduled research notification to all connected clients"""
         if not self.active_connections:
@@ -164,7 +164,7 @@ class ScheduledTasksDoctor:
         
         try:
             # 获取所有任务
-            all_tasks = ScheduledTaskDAO.get_tasks_by_user("default_user")
+            all_tasks = await ScheduledTaskDAO.get_tasks_by_user("default_user")
             
             print("\n" + "="*80)
             print("📋 定时任务列表")
@@ -205,7 +205,7 @@ class ScheduledTasksDoctor:
         
         try:
             # 获取所有暂停的任务
-            all_tasks = ScheduledTaskDAO.get_tasks_by_user("default_user")
+            all_tasks = await ScheduledTaskDAO.get_tasks_by_user("default_user")
             paused_tasks = [t for t in all_tasks if not t.is_active]
             
             if not paused_tasks:
@@ -254,7 +254,7 @@ class ScheduledTasksDoctor:
             
             for job in research_jobs:
                 task_id = job.id.replace("research_task_", "")
-                task = ScheduledTaskDAO.get_task_by_id(task_id)
+                task = await ScheduledTaskDAO.get_task_by_id(task_id)
                 
                 if not task:
                     # 孤立的job，没有对应的数据库记录
@@ -112,6 +112,16 @@ export const useScheduledWebSocket = (options: UseScheduledWebSocketOptions = {}
             const message = data as ScheduledResultMessage;
             setLastMessage(message);
             onScheduledResult?.(message);
+          } else if (data.type === 'scheduled_result_batch' && Array.isArray(data.items)) {
+            // 批量帧：后端把同一时间窗完成的结果合并发送，逐条拆包，
+            // 条目本身就是scheduled_result消息
+            for (const item of data.items) {
+              if (item?.type === 'scheduled_result') {
+                const message = item as ScheduledResultMessage;
+                setLastMessage(message);
+                onScheduledResult?.(message);
+              }
+            }
           }
         } catch (err) {
           // 只在开发环境下输出非JSON消息的错误
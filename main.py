@@ -36,6 +36,16 @@ logging.getLogger('transformers').setLevel(transformers_level)
 # Create logger instance
 logger = logging.getLogger(__name__)
 
+# 可选启用uvloop：libuv实现的事件循环对I/O密集协程（研究任务的主要负载）
+# 有2-4倍加速；未安装时走标准asyncio循环（uvicorn的"auto"同样会探测）
+try:
+    import asyncio
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop event loop policy installed")
+except ImportError:
+    pass
+
 # 显示配置信息
 logger.info(f"使用配置文件：{config.config_path}")
 logger.info(f"日志级别：{config.get('logging.level', 'INFO')}")